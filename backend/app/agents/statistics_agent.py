@@ -5,7 +5,8 @@ from ..services.tools import (
     KOSISSearchTool,
     WorldBankSearchTool,
     FREDSearchTool,
-    OWIDRAGTool
+    OWIDRAGTool,
+    OWIDLookupTool
 )
 
 
@@ -70,6 +71,15 @@ class StatisticsAgent(FactWaveAgent):
    • 주제: 기후, 에너지, 보건, 불평등
    • 신뢰도: ⭐⭐⭐⭐ (학술 기반)
 
+5️⃣ OWID Exact Lookup (정확 수치 확인)
+   • 용도: 국가 + 지표 + 연도가 정해진 수치 검증
+   • 특징: OWID 38개 데이터셋의 원자료 값을 그대로 조회
+   • 활용:
+     - "2020년 한국 1인당 CO2 배출량" → 해당 연도 값
+     - "일본 기대수명 2000 2020" → 기간 변화율, 연평균 증가율
+   • 팁: 구체적 수치 주장은 OWID RAG보다 먼저 사용
+   • 신뢰도: ⭐⭐⭐⭐ (학술 기반)
+
 📈 상황별 도구 조합 전략:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -83,7 +93,7 @@ class StatisticsAgent(FactWaveAgent):
 → KOSIS(한국) → OWID(국제) → World Bank(개발지표)
 
 [기후/환경 데이터]
-→ OWID(종합) → World Bank(국가별) → KOSIS(한국)
+→ OWID Lookup(수치) → OWID(종합) → World Bank(국가별) → KOSIS(한국)
 
 [실시간 경제 동향]
 → FRED(최신) → KOSIS(한국) → 시차 고려
@@ -138,5 +148,6 @@ class StatisticsAgent(FactWaveAgent):
             KOSISSearchTool(),      # 한국 통계청 자연어 검색
             WorldBankSearchTool(),  # World Bank 자연어 검색
             FREDSearchTool(),       # FRED 자연어 검색
-            OWIDRAGTool()           # Our World in Data RAG 검색
+            OWIDRAGTool(),          # Our World in Data RAG 검색
+            OWIDLookupTool()        # OWID 정확 수치 조회
         ]
\ No newline at end of file
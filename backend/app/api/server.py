@@ -7,12 +7,14 @@ import os
 import json
 import asyncio
 import logging
+import secrets
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from contextlib import asynccontextmanager
 from uuid import uuid4
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks, Header
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
@@ -21,6 +23,8 @@ from dotenv import load_dotenv
 # 프로젝트 imports
 from app.core.streaming_crew import StreamingFactWaveCrew
 from app.utils.websocket_manager import WebSocketManager
+from app.services.tools.base_tool import AsyncHTTPClient, RobustRequests, load_tool_caches
+from app.utils.cache_registry import get_cache_stats, purge_caches
 
 # 환경 설정
 load_dotenv()
@@ -135,6 +139,9 @@ async def lifespan(app: FastAPI):
     """앱 생명주기 관리"""
     logger.info("FactWave API 서버 시작")
     yield
+    # 도구들이 공유하는 비동기 HTTP 커넥션 풀 정리
+    await AsyncHTTPClient.aclose()
+    RobustRequests.close_all()
     logger.info("FactWave API 서버 종료")
 
 
@@ -173,7 +180,8 @@ async def root():
             "websocket": "/ws/{session_id}",
             "fact_check": "/api/fact-check",
             "health": "/health",
-            "sessions": "/api/sessions"
+            "sessions": "/api/sessions",
+            "cache_stats": "/api/cache/stats"
         }
     }
 
@@ -227,6 +235,57 @@ async def close_session(session_id: str):
         raise HTTPException(status_code=404, detail="Session not found")
 
 
+def _load_cache_stats(name: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    load_tool_caches()
+    return get_cache_stats(name)
+
+
+def _purge_tool_caches(name: Optional[str], prefix: Optional[str]) -> Dict[str, int]:
+    load_tool_caches()
+    return purge_caches(name=name, prefix=prefix)
+
+
+@app.get("/api/cache/stats")
+async def cache_stats(name: Optional[str] = None):
+    """캐시별 적중/미스/제거/용량 통계 (name으로 특정 캐시만 조회)"""
+    try:
+        # SQLite 조회는 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        caches = await run_in_threadpool(_load_cache_stats, name)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Cache not found: {name}")
+    return {"timestamp": datetime.now().isoformat(), "caches": caches}
+
+
+@app.delete("/api/cache")
+async def purge_cache(
+    name: Optional[str] = None,
+    tool: Optional[str] = None,
+    prefix: Optional[str] = None,
+    x_admin_token: Optional[str] = Header(default=None)
+):
+    """캐시 항목 삭제 (관리용, X-Admin-Token 헤더에 CACHE_ADMIN_TOKEN 필요)
+
+    - tool: 해당 도구 이름의 캐시 항목만 삭제 (예: Naver News Search)
+    - prefix: 키 접두사가 일치하는 항목만 삭제
+    - name: 대상 캐시 이름 (예: tool:news), 생략하면 모든 캐시
+    아무 조건도 없으면 모든 캐시를 비운다.
+    CACHE_ADMIN_TOKEN이 설정되지 않았으면 항상 403 (기본 비활성).
+    """
+    admin_token = os.getenv("CACHE_ADMIN_TOKEN", "")
+    if not admin_token or not x_admin_token or not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=403, detail="캐시 삭제 권한이 없습니다")
+    if tool and prefix:
+        raise HTTPException(status_code=400, detail="tool과 prefix는 함께 지정할 수 없습니다")
+    if tool:
+        prefix = f"{tool}:"
+
+    try:
+        removed = await run_in_threadpool(_purge_tool_caches, name, prefix)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Cache not found: {name}")
+    return {"status": "purged", "removed": removed, "total": sum(removed.values())}
+
+
 # ==================== WebSocket 엔드포인트 ====================
 
 @app.websocket("/ws/{session_id}")
@@ -1,6 +1,6 @@
 """FactWave Crew - 3단계 팩트체킹 프로세스 구현"""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from crewai import Agent, Task, Crew, Process
 from rich.console import Console
 from rich.panel import Panel
@@ -10,6 +10,7 @@ import time
 
 from ..agents import AcademicAgent, NewsAgent, SocialAgent, LogicAgent, StatisticsAgent, SuperAgent
 from ..utils.prompt_loader import PromptLoader
+from ..utils.deadline import DEADLINE_CONFIG, Deadline, deadline_scope
 
 
 console = Console()
@@ -341,14 +342,36 @@ class FactWaveCrew:
                     "timestamp": time.time()
                 })
     
-    def check_fact(self, statement: str):
-        """3단계 팩트체킹 프로세스 실행"""
+    def check_fact(self, statement: str, deadline: Optional[Deadline] = None):
+        """3단계 팩트체킹 프로세스 실행
+        
+        Args:
+            statement: 검증할 주장
+            deadline: 전체 시간 예산 (없으면 FACTCHECK_TIME_BUDGET 기준으로 생성)
+        """
+        if deadline is None:
+            deadline = Deadline(DEADLINE_CONFIG["total_seconds"], label="factcheck")
+        
+        # contextvar는 실행 스레드 안에서 설정해야 도구 호출까지 전달됨
+        with deadline_scope(deadline):
+            return self._run_steps(statement, deadline)
+    
+    def _run_steps(self, statement: str, deadline: Deadline):
+        """단계별 시간 예산을 나눠 3단계 프로세스 실행"""
         console.print(f"\n[bold green]📋 팩트체크 시작:[/bold green] {statement}\n")
         
         # Reset tracking
         self.completed_agents = {"step1": [], "step2": [], "step3": []}
         self.agent_outputs = {}
         self.tool_calls = {"step1": {}, "step2": {}, "step3": {}}
+        self.step1_tasks = {}
+        self.step2_tasks = {}
+        
+        # 단계별 예산: Step 3(최종 판정) 몫은 항상 남겨둠
+        shares = DEADLINE_CONFIG["step_shares"]
+        total_budget = deadline.remaining()
+        step3_reserve = total_budget * shares["step3"]
+        step1_deadline = deadline.child(total_budget * shares["step1"], label="step1")
         
         # 초기 진행 상황 표시
         console.print(self.create_progress_table())
@@ -363,11 +386,21 @@ class FactWaveCrew:
         
         # Step 1: 각 에이전트를 개별 crew로 실행하여 독립성 보장
         step1_results = {}
+        step1_agent_count = 5
         for i, (agent_name, agent_instance) in enumerate([("academic", self.agents["academic"]),
                                                           ("news", self.agents["news"]),
                                                           ("social", self.agents["social"]),
                                                           ("logic", self.agents["logic"]),
                                                           ("statistics", self.agents["statistics"])]):
+            # 호출 측에서 취소했으면(강제 종료 타임아웃 등) 더 진행하지 않음
+            deadline.raise_if_cancelled()
+            if step1_deadline.expired:
+                console.print(f"[yellow]⏱️ 시간 예산 초과로 {agent_instance.role} 분석을 생략합니다[/yellow]")
+                step1_results[agent_name] = "시간 예산 초과로 분석을 생략했습니다."
+                # 출력이 없는 Task가 Step 2/3 context로 전달되지 않도록 제외
+                self.step1_tasks.pop(agent_name, None)
+                continue
+            
             console.print(f"[cyan]🔸 {agent_instance.role} 분석 시작...[/cyan]")
             
             # 개별 crew로 각 에이전트 실행
@@ -379,7 +412,10 @@ class FactWaveCrew:
                 step_callback=self._step_callback
             )
             
-            result = individual_crew.kickoff()
+            # 남은 Step 1 예산을 남은 에이전트 수로 나눠 할당
+            agent_budget = step1_deadline.remaining() / (step1_agent_count - i)
+            with deadline_scope(step1_deadline.child(agent_budget, label=f"step1:{agent_name}")):
+                result = individual_crew.kickoff()
             step1_results[agent_name] = result
             
             # 결과 즉시 출력
@@ -421,54 +457,61 @@ class FactWaveCrew:
                 console.print(f"\n[bold]{self.agents[agent_name].role}:[/bold]")
                 console.print(Panel(self.agent_outputs[agent_name], border_style="cyan"))
         
-        # Step 2: 토론
-        console.print("\n[bold blue]💬 Step 2: 전문가 토론[/bold blue]")
-        console.print("[dim]각 전문가가 다른 전문가의 의견을 검토하고 토론합니다...[/dim]\n")
-        
-        # Step 1 결과를 문자열로 정리
-        step1_summary = "\n".join([
-            f"[{self.agents[name].role}]\n{str(step1_results[name])}\n"
-            for name in ["academic", "news", "social", "logic", "statistics"]
-        ])
-        
-        console.print(Panel(
-            "[bold yellow]📢 토론 시작: 모든 전문가들이 초기 분석을 공유하고 토론을 시작합니다![/bold yellow]",
-            title="Step 2: 토론 단계",
-            border_style="yellow"
-        ))
-        
-        step2_tasks = self.create_step2_tasks(statement)
-        
-        # Step 2는 순차적으로 (서로의 의견을 참조해야 하므로)
-        step2_agents = [self.agents[name].get_agent("step2") for name in ["academic", "news", "social", "logic", "statistics"]]
-        
-        step2_crew = Crew(
-            agents=step2_agents,
-            tasks=step2_tasks,
-            process=Process.sequential,
-            verbose=True,  # 토론 과정 보기
-            step_callback=self._step_callback
-        )
-        
-        console.print("\n[cyan]🎯 토론 순서: 학술 → 뉴스 → 사회 → 논리 → 통계[/cyan]")
-        console.print("[dim]각 전문가는 이전 전문가들의 의견을 참고하여 토론합니다.[/dim]\n")
-        
-        step2_results = step2_crew.kickoff()
-        
-        # Step 2 토론 결과 정리
-        console.print("\n[bold yellow]📝 Step 2 토론 요약[/bold yellow]")
-        for agent_name in ["academic", "news", "social", "logic", "statistics"]:
-            key = f"{agent_name}_step2"
-            if key in self.agent_outputs:
-                console.print(f"\n[bold]{self.agents[agent_name].role} 토론 의견:[/bold]")
-                output = self.agent_outputs[key]
-                # 토론 부분만 추출
-                if "동의하는 점:" in output or "반박하는 점:" in output:
-                    console.print(Panel(output, border_style="yellow"))
-                else:
-                    console.print(Panel(output[:500] + "...", border_style="yellow"))
-        
+        # Step 2: 토론 (Step 3 몫을 제외한 예산이 부족하면 생략)
+        deadline.raise_if_cancelled()
+        step2_budget = deadline.remaining() - step3_reserve
+        if step2_budget < DEADLINE_CONFIG["min_step2_seconds"]:
+            console.print(f"\n[yellow]⏱️ 남은 시간 예산({deadline.remaining():.0f}초)이 부족하여 Step 2 토론을 생략합니다[/yellow]")
+        else:
+            console.print("\n[bold blue]💬 Step 2: 전문가 토론[/bold blue]")
+            console.print("[dim]각 전문가가 다른 전문가의 의견을 검토하고 토론합니다...[/dim]\n")
+            
+            # Step 1 결과를 문자열로 정리
+            step1_summary = "\n".join([
+                f"[{self.agents[name].role}]\n{str(step1_results[name])}\n"
+                for name in ["academic", "news", "social", "logic", "statistics"]
+            ])
+            
+            console.print(Panel(
+                "[bold yellow]📢 토론 시작: 모든 전문가들이 초기 분석을 공유하고 토론을 시작합니다![/bold yellow]",
+                title="Step 2: 토론 단계",
+                border_style="yellow"
+            ))
+            
+            step2_tasks = self.create_step2_tasks(statement)
+            
+            # Step 2는 순차적으로 (서로의 의견을 참조해야 하므로)
+            step2_agents = [self.agents[name].get_agent("step2") for name in ["academic", "news", "social", "logic", "statistics"]]
+            
+            step2_crew = Crew(
+                agents=step2_agents,
+                tasks=step2_tasks,
+                process=Process.sequential,
+                verbose=True,  # 토론 과정 보기
+                step_callback=self._step_callback
+            )
+            
+            console.print("\n[cyan]🎯 토론 순서: 학술 → 뉴스 → 사회 → 논리 → 통계[/cyan]")
+            console.print("[dim]각 전문가는 이전 전문가들의 의견을 참고하여 토론합니다.[/dim]\n")
+            
+            with deadline_scope(deadline.child(step2_budget, label="step2")):
+                step2_results = step2_crew.kickoff()
+            
+            # Step 2 토론 결과 정리
+            console.print("\n[bold yellow]📝 Step 2 토론 요약[/bold yellow]")
+            for agent_name in ["academic", "news", "social", "logic", "statistics"]:
+                key = f"{agent_name}_step2"
+                if key in self.agent_outputs:
+                    console.print(f"\n[bold]{self.agents[agent_name].role} 토론 의견:[/bold]")
+                    output = self.agent_outputs[key]
+                    # 토론 부분만 추출
+                    if "동의하는 점:" in output or "반박하는 점:" in output:
+                        console.print(Panel(output, border_style="yellow"))
+                    else:
+                        console.print(Panel(output[:500] + "...", border_style="yellow"))
+            
         # Step 3: 최종 종합
+        deadline.raise_if_cancelled()
         console.print("\n[bold blue]📊 Step 3: 최종 종합[/bold blue]")
         
         step3_task = self.create_step3_task(statement)
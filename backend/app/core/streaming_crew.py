@@ -18,6 +18,7 @@ from ..agents import (
 )
 from ..utils.websocket_manager import WebSocketManager, StreamingCallback
 from ..utils.prompt_loader import PromptLoader
+from ..utils.deadline import DEADLINE_CONFIG, Deadline
 from .crew import FactWaveCrew
 
 logger = logging.getLogger(__name__)
@@ -520,6 +521,9 @@ class StreamingFactWaveCrew:
     
     async def check_fact_async(self, statement: str) -> Dict[str, Any]:
         """비동기 팩트체킹 실행 (WebSocket 스트리밍 지원)"""
+        # 요청 시점부터 시간 예산 계산 (단계/에이전트/도구 호출로 전파됨)
+        deadline = Deadline(DEADLINE_CONFIG["total_seconds"], label="factcheck")
+        
         try:
             # 시작 알림
             await self.ws_manager.emit_progress("init", 0.0, "팩트체킹을 시작합니다...")
@@ -535,10 +539,15 @@ class StreamingFactWaveCrew:
             )
             
             # FactWaveCrew.check_fact를 비동기로 실행
-            result = await loop.run_in_executor(
-                self.executor,
-                self.fact_crew.check_fact,
-                statement
+            # 도구/단계는 Deadline을 협조적으로 지키고, LLM 호출 지연까지 감안해 유예 시간 후 강제 종료
+            result = await asyncio.wait_for(
+                loop.run_in_executor(
+                    self.executor,
+                    self.fact_crew.check_fact,
+                    statement,
+                    deadline
+                ),
+                timeout=deadline.remaining() + DEADLINE_CONFIG["hard_timeout_grace_seconds"]
             )
             
             # 최종 결과 구조화
@@ -556,7 +565,19 @@ class StreamingFactWaveCrew:
             
             return final_result
             
+        except asyncio.TimeoutError:
+            # wait_for는 워커 스레드를 멈추지 못하므로 취소 표시 (도구 호출은 즉시 생략, 다음 에이전트/단계 전에 중단)
+            deadline.cancel()
+            message = f"팩트체크가 시간 예산({deadline.budget:.0f}초)을 초과했습니다"
+            logger.error(message)
+            await self.ws_manager.emit_error(message, {"step": self.current_step})
+            raise
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소된 경우에도 워커 스레드가 계속 LLM/API를 호출하지 않도록
+            deadline.cancel()
+            raise
         except Exception as e:
+            deadline.cancel()
             logger.error(f"Fact-checking error: {e}")
             await self.ws_manager.emit_error(str(e), {"step": self.current_step})
             raise
@@ -18,6 +18,7 @@ from .statistics.fred_search_tool import FREDSearchTool
 
 # 특수 도구
 from .statistics.owid_rag_tool import OWIDRAGTool
+from .statistics.owid_lookup_tool import OWIDLookupTool
 
 # 커뮤니티 도구
 from .community.twitter_tool import TwitterTool
@@ -40,6 +41,7 @@ __all__ = [
     "WorldBankSearchTool",  # World Bank 자연어 검색
     "FREDSearchTool",       # FRED 자연어 검색
     "OWIDRAGTool",          # Our World in Data RAG
+    "OWIDLookupTool",       # OWID 국가/연도/지표 정확 수치 조회
     
     # 커뮤니티 도구
     "TwitterTool",          # Twitter/X 커뮤니티 검색
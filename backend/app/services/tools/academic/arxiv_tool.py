@@ -7,6 +7,9 @@ import arxiv
 from datetime import datetime
 from rich.console import Console
 
+from ..base_tool import cached_tool
+
+
 console = Console()
 
 
@@ -17,6 +20,7 @@ class ArxivSearchInput(BaseModel):
     sort_by: str = Field(default="relevance", description="Sort by: relevance, lastUpdatedDate, submittedDate")
 
 
+@cached_tool("academic", empty_markers=("논문을 찾을 수 없습니다",))
 class ArxivSearchTool(BaseTool):
     """ArXiv search tool for finding CS, Physics, Math papers"""
     
@@ -7,6 +7,7 @@ OpenAlex API를 사용한 학술 논문 검색 도구
 - API 키 불필요
 """
 
+import httpx
 import requests
 import json
 from typing import Dict, List, Optional, Any, Type
@@ -14,6 +15,8 @@ from datetime import datetime
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ..base_tool import AsyncToolMixin, AsyncHTTPClient, CircuitOpenError, RobustRequests, cached_tool
+
 
 class OpenAlexClient:
     """OpenAlex API 클라이언트"""
@@ -38,25 +41,10 @@ class OpenAlexClient:
             year_to: 종료 연도
         """
         
-        # 검색 파라미터 구성
-        params = {
-            "search": query,
-            "per-page": min(limit, 200),  # 최대 200개
-            "page": 1
-        }
-        
-        # 연도 필터 추가
-        filters = []
-        if year_from:
-            filters.append(f"from_publication_date:{year_from}-01-01")
-        if year_to:
-            filters.append(f"to_publication_date:{year_to}-12-31")
-        
-        if filters:
-            params["filter"] = ",".join(filters)
+        params = self._build_search_params(query, limit, year_from, year_to)
         
         try:
-            response = requests.get(
+            response = RobustRequests.get(
                 f"{self.base_url}/works",
                 params=params,
                 headers=self.headers,
@@ -67,16 +55,72 @@ class OpenAlexClient:
             data = response.json()
             return self._format_results(data, query)
             
+        except CircuitOpenError as e:
+            return {
+                "success": False,
+                "error": f"OpenAlex API 일시적으로 사용 불가: {str(e)}"
+            }
         except requests.exceptions.RequestException as e:
             return {
                 "success": False,
                 "error": f"OpenAlex API 오류: {str(e)}"
             }
     
+    async def async_search_works(self, query: str, limit: int = 10,
+                                 year_from: Optional[int] = None,
+                                 year_to: Optional[int] = None) -> Dict[str, Any]:
+        """논문 검색 (공유 httpx 풀 사용)"""
+        params = self._build_search_params(query, limit, year_from, year_to)
+        
+        try:
+            response = await AsyncHTTPClient.get(
+                f"{self.base_url}/works",
+                params=params,
+                headers=self.headers,
+                timeout=30
+            )
+            response.raise_for_status()
+            
+            return self._format_results(response.json(), query)
+            
+        except CircuitOpenError as e:
+            return {
+                "success": False,
+                "error": f"OpenAlex API 일시적으로 사용 불가: {str(e)}"
+            }
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError: JSON이 아닌 응답 (동기 경로의 requests JSONDecodeError와 같게 처리)
+            return {
+                "success": False,
+                "error": f"OpenAlex API 오류: {str(e)}"
+            }
+    
+    def _build_search_params(self, query: str, limit: int,
+                             year_from: Optional[int],
+                             year_to: Optional[int]) -> Dict[str, Any]:
+        """검색 파라미터 구성"""
+        params = {
+            "search": query,
+            "per-page": min(limit, 200),  # 최대 200개
+            "page": 1
+        }
+        
+        # 연도 필터 추가
+        filters = []
+        if year_from:
+            filters.append(f"from_publication_date:{year_from}-01-01")
+        if year_to:
+            filters.append(f"to_publication_date:{year_to}-12-31")
+        
+        if filters:
+            params["filter"] = ",".join(filters)
+        
+        return params
+    
     def get_paper_details(self, openalex_id: str) -> Dict[str, Any]:
         """논문 상세 정보 조회"""
         try:
-            response = requests.get(
+            response = RobustRequests.get(
                 f"{self.base_url}/works/{openalex_id}",
                 headers=self.headers,
                 timeout=30
@@ -88,6 +132,11 @@ class OpenAlexClient:
                 "data": response.json()
             }
             
+        except CircuitOpenError as e:
+            return {
+                "success": False,
+                "error": f"OpenAlex API 일시적으로 사용 불가: {str(e)}"
+            }
         except requests.exceptions.RequestException as e:
             return {
                 "success": False,
@@ -167,7 +216,9 @@ class OpenAlexInput(BaseModel):
 
 
 # CrewAI Tool Wrapper
-class OpenAlexTool(BaseTool):
+@cached_tool("academic", empty_markers=("논문을 찾을 수 없습니다",),
+             canonical_args={"query": "bag"})
+class OpenAlexTool(AsyncToolMixin, BaseTool):
     """OpenAlex 학술 논문 검색 도구"""
     
     name: str = "OpenAlex Academic Search"
@@ -210,41 +261,54 @@ class OpenAlexTool(BaseTool):
         """
         try:
             result = self._tool.search_works(query, limit, year_from, year_to)
+            return self._format_summary(query, result)
             
-            if result.get("success") and result.get("papers"):
-                # 결과 요약 추가
-                papers = result["papers"]
-                summary = f"\n📚 OpenAlex 검색 결과: '{query}'\n"
-                summary += f"📊 총 {result['total_results']:,}개 논문 중 {len(papers)}개 표시\n\n"
-                
-                for i, paper in enumerate(papers, 1):
-                    summary += f"📄 논문 {i}: {paper['title']}\n"
-                    if paper['authors']:
-                        summary += f"👥 저자: {', '.join(paper['authors'])}\n"
-                    summary += f"📅 출판: {paper['year']}년\n"
-                    if paper['journal']:
-                        summary += f"📖 저널: {paper['journal']}\n"
-                    summary += f"📈 인용수: {paper['citations_count']:,}회\n"
-                    if paper['open_access']:
-                        summary += f"🔓 오픈액세스: 가능\n"
-                        if paper['pdf_url']:
-                            summary += f"📎 PDF: {paper['pdf_url']}\n"
-                    if paper['abstract']:
-                        # 팩트체킹을 위해 초록 전체 포함
-                        summary += f"📝 초록: {paper['abstract']}\n"
-                    summary += f"🔗 OpenAlex: {paper['openalex_url']}\n"
-                    summary += "-" * 50 + "\n\n"
-                
-                result["summary"] = summary
-            
-            # LLM이 이해하기 쉽게 텍스트 형식으로 변환
-            if result.get("success") and result.get("papers"):
-                return result.get("summary", "검색 결과가 없습니다.")
-            else:
-                return f"❌ OpenAlex 검색 실패: {result.get('error', '알 수 없는 오류')}"
+        except Exception as e:
+            return f"❌ OpenAlex 검색 중 오류 발생: {str(e)}"
+    
+    async def _arun(self, query: str, limit: int = 10,
+                    year_from: Optional[int] = None,
+                    year_to: Optional[int] = None) -> str:
+        """OpenAlex 학술 논문 검색 실행 (비동기)"""
+        try:
+            result = await self._tool.async_search_works(query, limit, year_from, year_to)
+            return self._format_summary(query, result)
             
         except Exception as e:
             return f"❌ OpenAlex 검색 중 오류 발생: {str(e)}"
+    
+    def _format_summary(self, query: str, result: Dict[str, Any]) -> str:
+        """검색 결과를 LLM이 이해하기 쉬운 텍스트로 변환"""
+        if result.get("success") and result.get("papers"):
+            # 결과 요약 추가
+            papers = result["papers"]
+            summary = f"\n📚 OpenAlex 검색 결과: '{query}'\n"
+            summary += f"📊 총 {result['total_results']:,}개 논문 중 {len(papers)}개 표시\n\n"
+            
+            for i, paper in enumerate(papers, 1):
+                summary += f"📄 논문 {i}: {paper['title']}\n"
+                if paper['authors']:
+                    summary += f"👥 저자: {', '.join(paper['authors'])}\n"
+                summary += f"📅 출판: {paper['year']}년\n"
+                if paper['journal']:
+                    summary += f"📖 저널: {paper['journal']}\n"
+                summary += f"📈 인용수: {paper['citations_count']:,}회\n"
+                if paper['open_access']:
+                    summary += f"🔓 오픈액세스: 가능\n"
+                    if paper['pdf_url']:
+                        summary += f"📎 PDF: {paper['pdf_url']}\n"
+                if paper['abstract']:
+                    # 팩트체킹을 위해 초록 전체 포함
+                    summary += f"📝 초록: {paper['abstract']}\n"
+                summary += f"🔗 OpenAlex: {paper['openalex_url']}\n"
+                summary += "-" * 50 + "\n\n"
+            
+            return summary
+        
+        if result.get("success"):
+            return f"❌ '{query}'에 대한 논문을 찾을 수 없습니다."
+        
+        return f"❌ OpenAlex 검색 실패: {result.get('error', '알 수 없는 오류')}"
 
 
 if __name__ == "__main__":
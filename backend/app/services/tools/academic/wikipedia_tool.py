@@ -2,13 +2,17 @@
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from typing import Type
+from typing import Dict, Type
 import wikipediaapi
-import requests
 from rich.console import Console
 
+from ..base_tool import CircuitOpenError, RobustRequests, cached_tool
+
 console = Console()
 
+# 언어별 Wikipedia 클라이언트를 재사용하여 커넥션 풀 유지
+_WIKI_CLIENTS: Dict[str, wikipediaapi.Wikipedia] = {}
+
 
 class WikipediaSearchInput(BaseModel):
     """Input schema for Wikipedia search"""
@@ -16,6 +20,8 @@ class WikipediaSearchInput(BaseModel):
     lang: str = Field(default="ko", description="Language code (ko for Korean, en for English)")
 
 
+@cached_tool("academic", empty_markers=("정보를 찾을 수 없습니다",),
+             canonical_args={"query": "keywords"})
 class WikipediaSearchTool(BaseTool):
     """Wikipedia search tool for finding background information"""
     
@@ -27,12 +33,18 @@ class WikipediaSearchTool(BaseTool):
     """
     args_schema: Type[BaseModel] = WikipediaSearchInput
     
+    def _get_client(self, lang: str) -> wikipediaapi.Wikipedia:
+        """언어별 공유 Wikipedia API 클라이언트"""
+        if lang not in _WIKI_CLIENTS:
+            user_agent = "FactWave/1.0 (https://factwave.ai; contact@factwave.ai)"
+            _WIKI_CLIENTS[lang] = wikipediaapi.Wikipedia(user_agent=user_agent, language=lang)
+        return _WIKI_CLIENTS[lang]
+    
     def _run(self, query: str, lang: str = "ko") -> str:
         """Execute Wikipedia search and return summary"""
         try:
-            # Wikipedia API 초기화
-            user_agent = "FactWave/1.0 (https://factwave.ai; contact@factwave.ai)"
-            wiki = wikipediaapi.Wikipedia(user_agent=user_agent, language=lang)
+            # Wikipedia API 클라이언트 (언어별 공유)
+            wiki = self._get_client(lang)
             
             # 페이지 검색
             page = wiki.page(query)
@@ -48,7 +60,7 @@ class WikipediaSearchTool(BaseTool):
                     "srlimit": 5
                 }
                 
-                response = requests.get(search_url, params=params)
+                response = RobustRequests.get(search_url, params=params, timeout=10)
                 data = response.json()
                 
                 if data["query"]["search"]:
@@ -96,6 +108,8 @@ class WikipediaSearchTool(BaseTool):
             
             return result
             
+        except CircuitOpenError as e:
+            return f"Wikipedia 일시적으로 사용 불가: {str(e)}"
         except Exception as e:
             console.print(f"[red]Wikipedia 검색 오류: {str(e)}[/red]")
             return f"Wikipedia 검색 중 오류가 발생했습니다: {str(e)}"
\ No newline at end of file
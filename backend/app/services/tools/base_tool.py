@@ -2,97 +2,700 @@
 
 import os
 import json
-import hashlib
+import sqlite3
 import time
-from typing import Any, Dict, Optional, Callable
-from datetime import datetime, timedelta
+import zlib
+import asyncio
+import contextvars
+import inspect
+import threading
+import weakref
+from typing import Any, Dict, Optional, Callable, Union
+from collections import OrderedDict
+from datetime import timedelta
 from pathlib import Path
+from urllib.parse import urlparse
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from crewai.tools.structured_tool import CrewStructuredTool
 import logging
 
+from ...utils.cache_registry import CacheStats, register_cache
+from .query_canonicalizer import CANONICAL_MODES, canonical_call_key
+from ...utils.deadline import (
+    DEADLINE_CONFIG,
+    TIME_BUDGET_EXHAUSTED_MESSAGE,
+    Deadline,
+    DeadlineExceeded,
+    clamp_timeout,
+    deadline_scope,
+    has_time_budget,
+    remaining_time,
+)
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2는 h2 패키지가 있을 때만 사용
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+# 도구 응답 캐시 설정 (환경변수로 조정 가능)
+DATA_CACHE_CONFIG = {
+    "max_bytes": int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024))),  # 디스크 티어 총 크기 한도
+    "memory_items": int(os.getenv("CACHE_MEMORY_ITEMS", "256")),             # 메모리 LRU 티어 항목 수
+    "compress_min_bytes": 1024,                                               # 이보다 큰 값만 zlib 압축
+    "maintenance_interval": 100,                                              # set N회마다 만료/용량 정리
+}
+
 
 class DataCache:
-    """Simple file-based caching for API responses"""
+    """Two-tier cache for API responses: in-memory LRU in front of SQLite (WAL)
+    
+    키 원문을 기본키로 저장하고 값은 compact JSON(+zlib)으로 직렬화한다.
+    쓰기는 단일 트랜잭션이라 원자적이며, 여러 스레드/프로세스가 같은 파일을 공유해도 안전하다.
+    만료 항목과 용량 초과분(오래 안 쓰인 순)은 주기적으로 정리한다.
+    stale_grace_hours를 주면 만료 후에도 그 기간 동안 항목을 보관하여 get_entry로 조회할 수 있다.
+    생성 시 cache_registry에 등록되어 적중/미스/제거 통계와 접두사 삭제를 제공한다.
+    """
     
-    def __init__(self, cache_dir: str = ".cache/api_cache", ttl_hours: int = 24):
+    def __init__(
+        self,
+        cache_dir: str = ".cache/api_cache",
+        ttl_hours: float = 24,
+        max_bytes: Optional[int] = None,
+        memory_items: Optional[int] = None,
+        stale_grace_hours: float = 0,
+        name: Optional[str] = None
+    ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
+        self.stale_grace = timedelta(hours=stale_grace_hours).total_seconds()
+        self.max_bytes = max_bytes or DATA_CACHE_CONFIG["max_bytes"]
+        self.memory_items = memory_items if memory_items is not None else DATA_CACHE_CONFIG["memory_items"]
+        
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, data)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats = CacheStats()
+        self.name = name or str(self.cache_dir)
+        
+        self.db_path = self.cache_dir / "cache.sqlite3"
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed_at)")
+        
+        register_cache(self.name, self)
     
-    def _get_cache_key(self, key_str: str) -> str:
-        """Generate a unique cache key from input string"""
-        return hashlib.md5(key_str.encode()).hexdigest()
+    @staticmethod
+    def _serialize(data: Any) -> bytes:
+        """compact JSON 직렬화 (크면 zlib 압축, 첫 바이트가 압축 여부 표시)"""
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(raw) >= DATA_CACHE_CONFIG["compress_min_bytes"]:
+            return b"z" + zlib.compress(raw, 6)
+        return b"j" + raw
     
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key"""
-        return self.cache_dir / f"{cache_key}.json"
+    @staticmethod
+    def _deserialize(blob: bytes) -> Any:
+        raw = zlib.decompress(blob[1:]) if blob[:1] == b"z" else blob[1:]
+        return json.loads(raw.decode("utf-8"))
     
-    def get(self, key: str) -> Optional[Any]:
-        """Retrieve cached data if exists and not expired"""
-        cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_key)
-        
-        if not cache_path.exists():
-            return None
+    def _remember(self, key: str, expires_at: float, data: Any) -> None:
+        """메모리 티어에 저장 (LRU 초과분 제거, 호출자가 lock 보유)"""
+        if self.memory_items <= 0:
+            return
+        self._memory[key] = (expires_at, data)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+            self._stats.incr("memory_evictions")
+    
+    def _lookup(self, key: str, now: float) -> Optional[tuple]:
+        """(data, expires_at) 조회 - 유예 기간이 지난 항목은 삭제 (호출자가 lock 보유)"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry[0] + self.stale_grace > now:
+                self._memory.move_to_end(key)
+                self._stats.incr("memory_hits")
+                return entry[1], entry[0]
+            del self._memory[key]
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # Check expiration
-            cached_time = datetime.fromisoformat(cache_data['timestamp'])
-            if datetime.now() - cached_time > self.ttl:
-                # Cache expired, remove file
-                cache_path.unlink()
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
                 return None
             
-            logger.debug(f"Cache hit for key: {key[:50]}...")
-            return cache_data['data']
+            blob, expires_at = row
+            if expires_at + self.stale_grace <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._stats.incr("expirations")
+                return None
             
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            data = self._deserialize(blob)
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        except (sqlite3.Error, zlib.error, ValueError) as e:
             logger.error(f"Cache read error: {e}")
-            # Remove corrupted cache file
-            cache_path.unlink(missing_ok=True)
+            # 손상된 항목 제거
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+        
+        self._remember(key, expires_at, data)
+        return data, expires_at
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve cached data if exists and not expired"""
+        now = time.time()
+        with self._lock:
+            found = self._lookup(key, now)
+        if found is None or found[1] <= now:
+            self._stats.incr("misses")
+            return None
+        self._stats.incr("hits")
+        logger.debug(f"Cache hit for key: {key[:50]}...")
+        return found[0]
+    
+    def get_entry(self, key: str) -> Optional[tuple]:
+        """(data, is_fresh) 반환 - 만료됐지만 유예 기간 안이면 is_fresh=False"""
+        now = time.time()
+        with self._lock:
+            found = self._lookup(key, now)
+        if found is None:
+            self._stats.incr("misses")
             return None
+        is_fresh = found[1] > now
+        self._stats.incr("hits" if is_fresh else "stale_hits")
+        return found[0], is_fresh
     
-    def set(self, key: str, data: Any) -> None:
-        """Store data in cache"""
-        cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_key)
+    def set(self, key: str, data: Any, ttl_hours: Optional[float] = None) -> None:
+        """Store data in cache (ttl_hours로 항목별 TTL 지정 가능)"""
+        now = time.time()
+        ttl = self.ttl if ttl_hours is None else timedelta(hours=ttl_hours)
+        expires_at = now + ttl.total_seconds()
         
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'key': key[:100],  # Store first 100 chars for debugging
-            'data': data
-        }
+        try:
+            blob = self._serialize(data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Cache serialize error: {e}")
+            return
+        
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, size, created_at, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, blob, len(blob) + len(key), now, expires_at, now)
+                )
+            except sqlite3.Error as e:
+                logger.error(f"Cache write error: {e}")
+                return
+            
+            self._remember(key, expires_at, data)
+            self._stats.incr("sets")
+            self._writes += 1
+            if self._writes % DATA_CACHE_CONFIG["maintenance_interval"] == 0:
+                self._evict(now)
         
+        logger.debug(f"Cache set for key: {key[:50]}...")
+    
+    def _evict(self, now: float) -> None:
+        """만료 항목 삭제 후 총 크기가 한도를 넘으면 오래 안 쓰인 순으로 삭제 (호출자가 lock 보유)"""
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"Cache set for key: {key[:50]}...")
-        except Exception as e:
-            logger.error(f"Cache write error: {e}")
+            expired = self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now - self.stale_grace,))
+            if expired.rowcount > 0:
+                self._stats.incr("expirations", expired.rowcount)
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            
+            # 한도의 90%까지 줄여 매번 정리가 반복되지 않게 함
+            excess = total - int(self.max_bytes * 0.9)
+            victims = []
+            for key, size in self._conn.execute("SELECT key, size FROM cache ORDER BY accessed_at"):
+                victims.append((key,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+            for (key,) in victims:
+                self._memory.pop(key, None)
+            self._stats.incr("evictions", len(victims))
+            logger.info(f"Cache evicted {len(victims)} entries from {self.db_path}")
+        except sqlite3.Error as e:
+            logger.error(f"Cache eviction error: {e}")
     
     def clear(self) -> None:
-        """Clear all cache files"""
+        """Clear all cached entries"""
+        self.purge()
+        # 이전 버전의 키별 JSON 파일도 정리
         for cache_file in self.cache_dir.glob("*.json"):
             cache_file.unlink()
         logger.info("Cache cleared")
+    
+    def purge(self, prefix: Optional[str] = None) -> int:
+        """전체 또는 키 접두사가 일치하는 항목 삭제 (도구별 삭제는 "도구이름:" 접두사)"""
+        with self._lock:
+            try:
+                if prefix is None:
+                    removed = self._conn.execute("DELETE FROM cache").rowcount
+                    self._memory.clear()
+                else:
+                    # LIKE 대신 substr 비교로 와일드카드 문자(%, _) 이스케이프 문제를 피함
+                    removed = self._conn.execute(
+                        "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                    ).rowcount
+                    for key in [k for k in self._memory if k.startswith(prefix)]:
+                        del self._memory[key]
+            except sqlite3.Error as e:
+                logger.error(f"Cache purge error: {e}")
+                return 0
+        self._stats.incr("purged", removed)
+        return removed
+    
+    def stats(self) -> Dict[str, Any]:
+        """프로세스 시작 이후 카운터 + 현재 항목 수/크기"""
+        now = time.time()
+        with self._lock:
+            try:
+                entries, total_bytes, fresh = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(expires_at > ?), 0) FROM cache",
+                    (now,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Cache stats error: {e}")
+                entries = total_bytes = fresh = 0
+            memory_entries = len(self._memory)
+        return {
+            "type": "sqlite_lru",
+            "path": str(self.db_path),
+            "ttl_hours": self.ttl.total_seconds() / 3600,
+            "entries": entries,
+            "fresh_entries": fresh,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "memory_entries": memory_entries,
+            "memory_items": self.memory_items,
+            **self._stats.as_dict(),
+        }
+
+
+# 동기 HTTP 커넥션 풀 설정 (환경변수로 조정 가능)
+HTTP_POOL_CONFIG = {
+    "pool_connections": int(os.getenv("HTTP_POOL_CONNECTIONS", "32")),  # 유지할 호스트별 풀 개수
+    "pool_maxsize": int(os.getenv("HTTP_POOL_MAXSIZE", "10")),          # 호스트당 keep-alive 연결 수
+}
+
+# 재시도 정책 - 도구는 이름으로 선택
+RETRY_POLICIES = {
+    "default": {"total_retries": 3, "backoff_factor": 1.0, "status_forcelist": (429, 500, 502, 503, 504)},
+    "fast": {"total_retries": 1, "backoff_factor": 0.3, "status_forcelist": (500, 502, 503, 504)},
+    "none": {"total_retries": 0, "backoff_factor": 0.0, "status_forcelist": ()},
+}
+
+
+# 업스트림 호스트별 호출 한도 (초당 요청 수, 버스트 허용량)
+# 호스트 이름의 접미사로 매칭하며, 등록되지 않은 호스트는 "default"를 사용
+RATE_LIMIT_CONFIGS = {
+    "default": {"rate": float(os.getenv("MAX_REQUESTS_PER_MINUTE", "60")) / 60, "burst": 5},
+    "openapi.naver.com": {"rate": 10.0, "burst": 10},
+    "newsapi.org": {"rate": 1.0, "burst": 3},
+    "factchecktools.googleapis.com": {"rate": 5.0, "burst": 5},
+    "api.gdeltproject.org": {"rate": 0.2, "burst": 1},       # GDELT: 5초당 1회 권장
+    "api.openalex.org": {"rate": 10.0, "burst": 10},         # polite pool 기준
+    "api.stlouisfed.org": {"rate": 2.0, "burst": 5},         # FRED: 분당 120회
+    "api.worldbank.org": {"rate": 5.0, "burst": 5},
+    "wikipedia.org": {"rate": 10.0, "burst": 10},
+}
+
+
+def _load_rate_limit_overrides() -> None:
+    """RATE_LIMITS 환경변수로 호스트별 한도 덮어쓰기
+
+    형식: "host=rate[:burst],host2=rate" (예: "newsapi.org=0.5:2,api.openalex.org=5")
+    """
+    raw = os.getenv("RATE_LIMITS", "").strip()
+    if not raw:
+        return
+    for entry in raw.split(","):
+        try:
+            host, spec = entry.strip().split("=", 1)
+            rate, _, burst = spec.partition(":")
+            RATE_LIMIT_CONFIGS[host.strip()] = {
+                "rate": float(rate),
+                "burst": int(burst) if burst else max(1, int(float(rate))),
+            }
+        except ValueError:
+            logger.warning(f"Invalid RATE_LIMITS entry ignored: {entry!r}")
+
+
+_load_rate_limit_overrides()
+
+
+def _host_of(url_or_host: str) -> str:
+    """URL 또는 호스트 이름에서 소문자 호스트 추출"""
+    host = urlparse(url_or_host).hostname if "://" in url_or_host else url_or_host
+    return (host or "").lower()
+
+
+def _budget_timeout(timeout: float) -> float:
+    """대기 이후 남은 시간 예산으로 timeout 재조정 (예산이 다 떨어졌으면 DeadlineExceeded)"""
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded("시간 예산 소진 (요청 전 대기 중 마감)")
+    return min(timeout, remaining)
+
+
+def _rate_limit_max_wait() -> Optional[float]:
+    """속도 제한 대기 허용 시간 - 대기 후에도 요청에 min_tool_seconds가 남아야 함 (Deadline이 없으면 None)"""
+    remaining = remaining_time()
+    return None if remaining is None else remaining - DEADLINE_CONFIG["min_tool_seconds"]
+
+
+def _host_config(host: str, configs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """호스트 접미사로 설정 조회 (없으면 "default")"""
+    for pattern, config in configs.items():
+        if pattern != "default" and (host == pattern or host.endswith("." + pattern)):
+            return config
+    return configs["default"]
+
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    토큰을 예약 방식으로 차감하여(음수 허용) 동시 호출자들이 도착 순서대로
+    간격을 두고 나가도록 한다. 대기 자체는 호출자가 수행한다.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+        # 대기 통계
+        self.calls = 0
+        self.waited_calls = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초)을 반환
+
+        대기 시간이 max_wait를 넘으면 예약하지 않고 DeadlineExceeded를 발생시킨다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+            if max_wait is not None and wait > max(max_wait, 0.0):
+                raise DeadlineExceeded(f"시간 예산 부족 (속도 제한 대기 {wait:.1f}초 필요)")
+            self.tokens -= 1
+            
+            self.calls += 1
+            if wait > 0:
+                self.waited_calls += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+    
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """동기 대기 (워커 스레드용)"""
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self, max_wait: Optional[float] = None) -> float:
+        """비동기 대기 (이벤트 루프를 막지 않음)"""
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.capacity,
+                "calls": self.calls,
+                "waited_calls": self.waited_calls,
+                "total_wait_seconds": round(self.total_wait, 3),
+                "max_wait_seconds": round(self.max_wait, 3),
+            }
+
+
+class HostRateLimiter:
+    """Process-wide token buckets keyed by upstream host
+
+    모든 도구의 동기/비동기 HTTP 호출이 같은 버킷을 공유하므로
+    여러 세션이 동시에 돌아도 업스트림별 호출 속도가 한도 안에서 평탄화된다.
+    """
+    
+    _buckets: Dict[str, TokenBucket] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def bucket(cls, url_or_host: str) -> TokenBucket:
+        """URL 또는 호스트 이름에 해당하는 버킷 반환 (없으면 생성)"""
+        host = _host_of(url_or_host)
+        bucket = cls._buckets.get(host)
+        if bucket is not None:
+            return bucket
+        
+        with cls._lock:
+            if host not in cls._buckets:
+                config = _host_config(host, RATE_LIMIT_CONFIGS)
+                cls._buckets[host] = TokenBucket(config["rate"], config["burst"])
+            return cls._buckets[host]
+    
+    @classmethod
+    def acquire(cls, url: str) -> float:
+        """토큰 대기 - 팩트체크 Deadline 안에 끝나지 않으면 DeadlineExceeded"""
+        wait = cls.bucket(url).acquire(_rate_limit_max_wait())
+        if wait > 0:
+            logger.debug(f"Rate limited {urlparse(url).hostname}: waited {wait:.2f}s")
+        return wait
+    
+    @classmethod
+    async def acquire_async(cls, url: str) -> float:
+        wait = await cls.bucket(url).acquire_async(_rate_limit_max_wait())
+        if wait > 0:
+            logger.debug(f"Rate limited {urlparse(url).hostname}: waited {wait:.2f}s")
+        return wait
+    
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """호스트별 호출/대기 통계"""
+        with cls._lock:
+            buckets = dict(cls._buckets)
+        return {host: bucket.stats() for host, bucket in buckets.items()}
+
+
+# 업스트림 호스트별 서킷 브레이커 설정
+# failure_threshold: 연속 실패(오류/5xx/느린 응답) 횟수, slow_call_seconds: 느린 응답 기준,
+# recovery_seconds: 차단 후 half-open 탐침까지 대기 시간
+CIRCUIT_BREAKER_CONFIGS = {
+    "default": {
+        "failure_threshold": int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3")),
+        "slow_call_seconds": float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "10")),
+        "recovery_seconds": float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30")),
+    },
+    # GDELT는 정상 상태에서도 응답이 느린 편
+    "api.gdeltproject.org": {
+        "failure_threshold": int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3")),
+        "slow_call_seconds": 20.0,
+        "recovery_seconds": float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30")),
+    },
+}
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 업스트림 호출 없이 즉시 실패"""
+    
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(
+            f"{host} 소스를 일시적으로 사용할 수 없습니다 "
+            f"(연속 실패로 차단됨, 약 {max(retry_in, 0):.0f}초 후 재시도)"
+        )
+
+
+class CircuitBreaker:
+    """closed → open → half-open 상태를 갖는 호스트 단위 서킷 브레이커"""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, host: str, failure_threshold: int = 3,
+                 slow_call_seconds: float = 10.0, recovery_seconds: float = 30.0):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.slow_call_seconds = slow_call_seconds
+        self.recovery_seconds = recovery_seconds
+        
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.rejected_calls = 0
+        self._lock = threading.Lock()
+    
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 (차단 중이면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.recovery_seconds - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    self.rejected_calls += 1
+                    raise CircuitOpenError(self.host, remaining)
+                self.state = self.HALF_OPEN
+                logger.info(f"Circuit half-open for {self.host}, probing")
+            
+            if self.state == self.HALF_OPEN:
+                # half-open에서는 탐침 요청 하나만 통과
+                if self.probe_in_flight:
+                    self.rejected_calls += 1
+                    raise CircuitOpenError(self.host, self.recovery_seconds)
+                self.probe_in_flight = True
+    
+    def record(self, success: Optional[bool], elapsed: float = 0.0) -> None:
+        """호출 결과 기록 (success=None이면 결과 없이 탐침 슬롯만 반환)"""
+        with self._lock:
+            if success is None:
+                self.probe_in_flight = False
+                return
+            
+            if success and elapsed <= self.slow_call_seconds:
+                if self.state != self.CLOSED:
+                    logger.info(f"Circuit closed for {self.host}")
+                self.state = self.CLOSED
+                self.consecutive_failures = 0
+                self.probe_in_flight = False
+                return
+            
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Circuit opened for {self.host} "
+                        f"({self.consecutive_failures} consecutive failures/slow calls)"
+                    )
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self.probe_in_flight = False
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "rejected_calls": self.rejected_calls,
+            }
+
+
+class HostCircuitBreakers:
+    """Process-wide circuit breakers keyed by upstream host"""
+    
+    _breakers: Dict[str, CircuitBreaker] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, url_or_host: str) -> CircuitBreaker:
+        """URL 또는 호스트 이름에 해당하는 브레이커 반환 (없으면 생성)"""
+        host = _host_of(url_or_host)
+        breaker = cls._breakers.get(host)
+        if breaker is not None:
+            return breaker
+        
+        with cls._lock:
+            if host not in cls._breakers:
+                cls._breakers[host] = CircuitBreaker(host, **_host_config(host, CIRCUIT_BREAKER_CONFIGS))
+            return cls._breakers[host]
+    
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """호스트별 서킷 상태"""
+        with cls._lock:
+            breakers = dict(cls._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+# 재시도하면 풀릴 수 있는 상태 코드 (5xx 전체 포함) - 이 결과는 절대 캐시하지 않음
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429})
+
+
+class _CallOutcome:
+    """도구 호출 하나 동안 HTTP 계층이 관찰한 결과 (일시적/영구적 오류, 부분 결과 여부)"""
+    
+    __slots__ = ("transient", "permanent", "degraded")
+    
+    def __init__(self):
+        self.transient = False
+        self.permanent = False
+        self.degraded = False  # 시간 예산 부족 등으로 일부 조회를 생략한 결과
+
+
+_call_outcome: contextvars.ContextVar[Optional[_CallOutcome]] = contextvars.ContextVar(
+    "tool_call_outcome", default=None
+)
+
+
+def _record_outcome(status_code: Optional[int] = None, transient: bool = False) -> None:
+    """현재 도구 호출에 HTTP 결과 기록 (추적 중이 아니면 무시)"""
+    outcome = _call_outcome.get()
+    if outcome is None:
+        return
+    if transient or status_code in TRANSIENT_STATUS_CODES or (status_code is not None and status_code >= 500):
+        outcome.transient = True
+    elif status_code is not None and status_code >= 400:
+        outcome.permanent = True
+
+
+def has_optional_fetch_budget() -> bool:
+    """부가 데이터 조회(min_optional_fetch_seconds) 예산이 남았는지
+
+    예산이 없어 조회를 생략하면 현재 호출을 부분 결과로 표시해 cached_tool이 캐시하지 않는다
+    (같은 키의 전체 결과 대신 부분 결과가 TTL 동안 재사용되는 것을 막음).
+    """
+    if has_time_budget(DEADLINE_CONFIG["min_optional_fetch_seconds"]):
+        return True
+    mark_result_uncacheable()
+    return False
+
+
+def mark_result_uncacheable() -> None:
+    """현재 도구 호출 결과를 캐시하지 않도록 표시 (대체/모의 응답 등, 추적 중이 아니면 무시)
+
+    결과 문자열의 첫 줄 표식에 의존하지 않으므로 실제 결과처럼 보이는 대체 응답에도 쓸 수 있다.
+    """
+    outcome = _call_outcome.get()
+    if outcome is not None:
+        outcome.degraded = True
 
 
 class RobustRequests:
-    """HTTP requests with retry logic and better error handling"""
+    """HTTP requests with retry logic and better error handling
+    
+    재시도 정책별로 프로세스 전역 Session을 하나씩 유지하여
+    호스트별 keep-alive 풀과 TLS 세션을 모든 도구 호출이 재사용한다.
+    """
+    
+    _sessions: Dict[str, requests.Session] = {}
+    _lock = threading.Lock()
     
     @staticmethod
     def create_session(
         total_retries: int = 3,
         backoff_factor: float = 1.0,
-        status_forcelist: tuple = (429, 500, 502, 503, 504)
+        status_forcelist: tuple = (429, 500, 502, 503, 504),
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None
     ) -> requests.Session:
         """Create a requests session with retry strategy"""
         session = requests.Session()
@@ -103,32 +706,103 @@ class RobustRequests:
             connect=total_retries,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
+            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"],
+            raise_on_status=False  # 재시도 소진 시 마지막 응답을 그대로 반환
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections or HTTP_POOL_CONFIG["pool_connections"],
+            pool_maxsize=pool_maxsize or HTTP_POOL_CONFIG["pool_maxsize"]
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
     
-    @staticmethod
+    @classmethod
+    def get_session(cls, retry_policy: str = "default") -> requests.Session:
+        """재시도 정책별 공유 Session 반환 (없으면 생성)"""
+        session = cls._sessions.get(retry_policy)
+        if session is not None:
+            return session
+        
+        with cls._lock:
+            if retry_policy not in cls._sessions:
+                if retry_policy not in RETRY_POLICIES:
+                    raise ValueError(f"Unknown retry policy: {retry_policy}")
+                cls._sessions[retry_policy] = cls.create_session(**RETRY_POLICIES[retry_policy])
+                logger.debug(f"Pooled HTTP session created (policy={retry_policy})")
+            return cls._sessions[retry_policy]
+    
+    @classmethod
+    def get(
+        cls,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: float = 30,
+        retry_policy: str = "default",
+        **kwargs
+    ) -> requests.Response:
+        """공유 풀을 통한 GET 요청 (상태 코드 판단은 호출자에게 맡김)
+
+        팩트체크 Deadline이 있으면 timeout을 남은 예산으로 줄이고,
+        예산이 거의 없으면 재시도 없이 한 번만 시도한다.
+        """
+        if not has_time_budget(DEADLINE_CONFIG["min_retry_seconds"]):
+            retry_policy = "none"
+        # 세션을 먼저 확정 (잘못된 정책 ValueError가 탐침 슬롯을 잡은 채 나가지 않도록)
+        session = cls.get_session(retry_policy)
+        
+        try:
+            timeout = clamp_timeout(timeout)
+            breaker = HostCircuitBreakers.get(url)
+            breaker.before_call()
+        except (DeadlineExceeded, CircuitOpenError):
+            _record_outcome(transient=True)
+            raise
+        
+        try:
+            HostRateLimiter.acquire(url)
+            timeout = _budget_timeout(timeout)
+        except DeadlineExceeded:
+            breaker.record(None)  # 탐침 슬롯 반환
+            _record_outcome(transient=True)
+            raise
+        
+        success = None
+        start = time.monotonic()
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+            success = response.status_code < 500
+            _record_outcome(response.status_code)
+            return response
+        except requests.exceptions.RequestException:
+            success = False
+            _record_outcome(transient=True)
+            raise
+        finally:
+            breaker.record(success, time.monotonic() - start)
+    
+    @classmethod
     def get_with_retry(
+        cls,
         url: str,
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         timeout: int = 30,
+        retry_policy: str = "default",
         **kwargs
     ) -> requests.Response:
         """Make GET request with automatic retry on failure"""
-        session = RobustRequests.create_session()
-        
         try:
-            response = session.get(
+            response = cls.get(
                 url,
                 params=params,
                 headers=headers,
                 timeout=timeout,
+                retry_policy=retry_policy,
                 **kwargs
             )
             response.raise_for_status()
@@ -146,17 +820,206 @@ class RobustRequests:
         except Exception as e:
             logger.error(f"Unexpected error for URL {url}: {e}")
             raise
-        finally:
-            session.close()
+    
+    @classmethod
+    def close_all(cls) -> None:
+        """공유 Session 모두 종료"""
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+
+# 비동기 HTTP 클라이언트 풀 설정 (환경변수로 조정 가능)
+ASYNC_HTTP_CONFIG = {
+    "max_connections": int(os.getenv("HTTP_MAX_CONNECTIONS", "200")),
+    "max_keepalive_connections": int(os.getenv("HTTP_MAX_KEEPALIVE", "50")),
+    "per_host_connections": int(os.getenv("HTTP_PER_HOST_CONNECTIONS", "10")),
+    "keepalive_expiry": float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+}
+
+
+class AsyncHTTPClient:
+    """Process-wide httpx.AsyncClient shared by every tool's _arun
+
+    httpx의 커넥션 풀은 이벤트 루프에 묶여 있으므로 루프별로 클라이언트를 하나씩 유지하고,
+    호스트별 세마포어로 한 업스트림이 풀 전체를 점유하지 못하게 한다.
+    """
+    
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    _host_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 공유 클라이언트 반환 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        client = cls._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=ASYNC_HTTP_CONFIG["max_connections"],
+                    max_keepalive_connections=ASYNC_HTTP_CONFIG["max_keepalive_connections"],
+                    keepalive_expiry=ASYNC_HTTP_CONFIG["keepalive_expiry"],
+                ),
+                follow_redirects=True,
+            )
+            cls._clients[loop] = client
+            logger.debug(f"Async HTTP client created (http2={HAS_HTTP2})")
+        return client
+    
+    @classmethod
+    def _host_slot(cls, host: str) -> asyncio.Semaphore:
+        """호스트별 동시 연결 수 제한용 세마포어"""
+        loop = asyncio.get_running_loop()
+        slots = cls._host_slots.setdefault(loop, {})
+        if host not in slots:
+            slots[host] = asyncio.Semaphore(ASYNC_HTTP_CONFIG["per_host_connections"])
+        return slots[host]
+    
+    @classmethod
+    async def get(
+        cls,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: float = 30
+    ) -> httpx.Response:
+        """공유 풀을 통한 비동기 GET 요청 (상태 코드 판단은 호출자에게 맡김)"""
+        try:
+            timeout = clamp_timeout(timeout)
+            breaker = HostCircuitBreakers.get(url)
+            breaker.before_call()
+        except (DeadlineExceeded, CircuitOpenError):
+            _record_outcome(transient=True)
+            raise
+        
+        client = cls.get_client()
+        try:
+            await HostRateLimiter.acquire_async(url)
+        except DeadlineExceeded:
+            breaker.record(None)  # 예산 안에 토큰을 못 받으면 탐침 슬롯 반환
+            _record_outcome(transient=True)
+            raise
+        except BaseException:
+            breaker.record(None)  # 대기 중 취소되면 탐침 슬롯 반환
+            raise
+        
+        success = None
+        async with cls._host_slot(urlparse(url).netloc):
+            try:
+                timeout = _budget_timeout(timeout)
+            except DeadlineExceeded:
+                breaker.record(None)
+                _record_outcome(transient=True)
+                raise
+            start = time.monotonic()
+            try:
+                response = await client.get(url, params=params, headers=headers, timeout=timeout)
+                success = response.status_code < 500
+                _record_outcome(response.status_code)
+                return response
+            except httpx.TransportError:
+                success = False
+                _record_outcome(transient=True)
+                raise
+            finally:
+                breaker.record(success, time.monotonic() - start)
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """현재 이벤트 루프의 클라이언트 종료"""
+        loop = asyncio.get_running_loop()
+        client = cls._clients.pop(loop, None)
+        cls._host_slots.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+class AsyncCrewStructuredTool(CrewStructuredTool):
+    """CrewStructuredTool whose ainvoke awaits the tool's _arun instead of a worker thread"""
+    
+    def __init__(self, *args, async_func: Callable[..., Any], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.async_func = async_func
+    
+    async def ainvoke(
+        self,
+        input: Union[str, dict],
+        config: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> Any:
+        parsed_args = self._parse_args(input)
+        return await self.async_func(**parsed_args, **kwargs)
+
+
+class AsyncToolMixin:
+    """Mixin for CrewAI BaseTool subclasses that implement an async-native _arun
+    
+    비동기 crew는 스레드 없이 이벤트 루프에서 도구 I/O를 수행하고,
+    동기 crew는 기존처럼 _run을 사용한다. 팩트체크 시간 예산이 소진되면 호출을 생략한다.
+    """
+    
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        """비동기 구현이 없는 도구는 _run을 스레드에서 실행 (contextvars의 데드라인도 전달됨)"""
+        return await asyncio.to_thread(self._run, *args, **kwargs)
+    
+    async def arun(self, *args: Any, **kwargs: Any) -> Any:
+        """BaseTool.run의 비동기 버전"""
+        result = await self._arun_within_deadline(*args, **kwargs)
+        self.current_usage_count += 1
+        return result
+    
+    def _budget_exhausted_result(self, *args: Any, **kwargs: Any) -> Any:
+        """예산 소진 시 반환값 (캐시된 결과가 있으면 그것을 사용)"""
+        lookup = getattr(self, "_cache_lookup", None)
+        cached = lookup(*args, **kwargs) if lookup is not None else None
+        return cached if cached is not None else TIME_BUDGET_EXHAUSTED_MESSAGE
+    
+    def _run_within_deadline(self, *args: Any, **kwargs: Any) -> Any:
+        """시간 예산이 남아 있을 때만 _run 실행"""
+        if not has_time_budget(DEADLINE_CONFIG["min_tool_seconds"]):
+            return self._budget_exhausted_result(*args, **kwargs)
+        try:
+            return self._run(*args, **kwargs)
+        except DeadlineExceeded:
+            return TIME_BUDGET_EXHAUSTED_MESSAGE
+    
+    async def _arun_within_deadline(self, *args: Any, **kwargs: Any) -> Any:
+        """시간 예산이 남아 있을 때만 _arun 실행"""
+        if not has_time_budget(DEADLINE_CONFIG["min_tool_seconds"]):
+            return self._budget_exhausted_result(*args, **kwargs)
+        try:
+            return await self._arun(*args, **kwargs)
+        except DeadlineExceeded:
+            return TIME_BUDGET_EXHAUSTED_MESSAGE
+    
+    def to_structured_tool(self) -> CrewStructuredTool:
+        self._set_args_schema()
+        return AsyncCrewStructuredTool(
+            name=self.name,
+            description=self.description,
+            args_schema=self.args_schema,
+            func=self._run_within_deadline,
+            async_func=self._arun_within_deadline,
+            result_as_answer=self.result_as_answer,
+            max_usage_count=self.max_usage_count,
+            current_usage_count=self.current_usage_count,
+        )
 
 
 def with_cache(cache: DataCache):
     """Decorator to add caching to a function"""
     def decorator(func: Callable):
+        signature = inspect.signature(func)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            cache_key = f"{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
+            # Create cache key from function name and canonicalized arguments
+            try:
+                cache_key = f"{func.__name__}:{canonical_call_key(signature, args, kwargs)}"
+            except TypeError:
+                return func(*args, **kwargs)
             
             # Try to get from cache
             cached_result = cache.get(cache_key)
@@ -177,20 +1040,21 @@ def with_cache(cache: DataCache):
 
 
 def rate_limit(calls_per_second: float = 1.0):
-    """Decorator to rate limit function calls"""
-    min_interval = 1.0 / calls_per_second
-    last_called = [0.0]
+    """Decorator to rate limit function calls (thread-safe)"""
+    bucket = TokenBucket(rate=calls_per_second, burst=1)
     
     def decorator(func: Callable):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await bucket.acquire_async()
+                return await func(*args, **kwargs)
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_called[0]
-            left_to_wait = min_interval - elapsed
-            if left_to_wait > 0:
-                time.sleep(left_to_wait)
-            ret = func(*args, **kwargs)
-            last_called[0] = time.time()
-            return ret
+            bucket.acquire()
+            return func(*args, **kwargs)
         return wrapper
     return decorator
 
@@ -206,7 +1070,7 @@ class EnhancedBaseTool:
         else:
             self.cache = None
         
-        self.session = RobustRequests.create_session()
+        self.session = RobustRequests.get_session()
     
     def get_cached_or_fetch(
         self,
@@ -247,16 +1111,285 @@ class EnhancedBaseTool:
 
 
 # Cache configurations for different data types
+# stale_grace_hours: 만료 후 이 기간 안의 항목은 즉시 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
 CACHE_CONFIGS = {
-    "academic": {"ttl_hours": 72},      # 3 days for academic papers
-    "statistics": {"ttl_hours": 24},    # 1 day for economic stats
-    "news": {"ttl_hours": 1},           # 1 hour for news
-    "social": {"ttl_hours": 0.5},       # 30 minutes for social media
+    "academic": {"ttl_hours": 72},                            # 3 days for academic papers
+    "statistics": {"ttl_hours": 24},                          # 1 day for economic stats
+    "news": {"ttl_hours": 1, "stale_grace_hours": 6},         # 1 hour for news
+    "social": {"ttl_hours": 0.5, "stale_grace_hours": 2},     # 30 minutes for social media
 }
 
 
+_type_caches: Dict[str, DataCache] = {}
+_type_caches_lock = threading.Lock()
+
+
 def get_cache_for_type(data_type: str) -> DataCache:
-    """Get appropriate cache instance for data type"""
-    config = CACHE_CONFIGS.get(data_type, {"ttl_hours": 24})
-    cache_dir = f".cache/{data_type}"
-    return DataCache(cache_dir=cache_dir, ttl_hours=config["ttl_hours"])
\ No newline at end of file
+    """Get appropriate cache instance for data type (도메인별로 하나를 공유)"""
+    cache = _type_caches.get(data_type)
+    if cache is not None:
+        return cache
+    
+    with _type_caches_lock:
+        if data_type not in _type_caches:
+            config = CACHE_CONFIGS.get(data_type, {"ttl_hours": 24})
+            cache_dir = f".cache/{data_type}"
+            _type_caches[data_type] = DataCache(
+                cache_dir=cache_dir,
+                ttl_hours=config["ttl_hours"],
+                stale_grace_hours=config.get("stale_grace_hours", 0),
+                name=f"tool:{data_type}"
+            )
+        return _type_caches[data_type]
+
+
+def load_tool_caches() -> Dict[str, DataCache]:
+    """설정된 모든 도메인 캐시를 열어 등록 (통계/관리 API용)"""
+    return {data_type: get_cache_for_type(data_type) for data_type in CACHE_CONFIGS}
+
+
+# 첫 줄에 이런 표현이 있는 결과(오류/일시 장애/설정 누락/빈 결과)는 일반 TTL로 캐시하지 않음
+UNCACHEABLE_RESULT_MARKERS = (
+    "오류", "사용 불가", "설정되지 않았습니다", "한도 초과",
+    "찾을 수 없습니다", "결과가 없습니다", "❌", "⏱️",
+)
+
+# 빈 결과 표현 기본값 (도구별로 cached_tool(empty_markers=...)로 지정)
+DEFAULT_EMPTY_RESULT_MARKERS = ("찾을 수 없습니다", "결과가 없습니다")
+
+# 네거티브 캐시 TTL - 도메인 TTL보다 길어지지 않음. 일시적 오류(5xx/429/타임아웃/서킷 차단)는 캐시하지 않음
+NEGATIVE_CACHE_CONFIGS = {
+    "empty": {"ttl_hours": float(os.getenv("NEGATIVE_CACHE_EMPTY_MINUTES", "10")) / 60},            # 검색 결과 없음
+    "permanent_error": {"ttl_hours": float(os.getenv("NEGATIVE_CACHE_ERROR_MINUTES", "5")) / 60},   # 4xx 등 결정적 오류
+}
+
+
+def _is_cacheable_result(result: Any) -> bool:
+    if result is None or result == "":
+        return False
+    if isinstance(result, str):
+        first_line = result.lstrip().split("\n", 1)[0]
+        return not any(marker in first_line for marker in UNCACHEABLE_RESULT_MARKERS)
+    return True
+
+
+def _classify_result(result: Any, outcome: _CallOutcome, empty_markers: tuple) -> Optional[str]:
+    """캐시 분류: "ok" | "empty" | "permanent_error" | None(캐시 안 함)"""
+    if outcome.transient or outcome.degraded:
+        return None
+    if isinstance(result, str):
+        first_line = result.lstrip().split("\n", 1)[0]
+        if any(marker in first_line for marker in empty_markers):
+            return "empty"
+    if _is_cacheable_result(result):
+        return "ok"
+    if outcome.permanent:
+        return "permanent_error"
+    # HTTP 계층을 거치지 않은 오류(라이브러리 예외 등)는 일시적인지 알 수 없으므로 캐시하지 않음
+    return None
+
+
+def _store_result(cache: DataCache, key: str, result: Any, outcome: _CallOutcome, empty_markers: tuple) -> None:
+    kind = _classify_result(result, outcome, empty_markers)
+    if kind == "ok":
+        cache.set(key, result)
+    elif kind is not None:
+        ttl_hours = min(NEGATIVE_CACHE_CONFIGS[kind]["ttl_hours"], cache.ttl.total_seconds() / 3600)
+        cache.set(key, result, ttl_hours=ttl_hours)
+        logger.debug(f"Negative cache set ({kind}) for key: {key[:50]}...")
+
+
+def _echo_placeholder(name: str) -> str:
+    return f"'\ue000{name}\ue001'"
+
+
+def _template_echoes(result: Any, values: Dict[str, str]) -> Any:
+    """결과에 에코된 질의 원문('{query}')을 자리표시자로 바꿔 저장용으로 변환
+
+    정규화 모드(keywords/bag) 인자는 원문이 달라도 같은 키를 쓰므로, 조회 시
+    다른 호출자의 질의가 그대로 보이지 않도록 호출자의 원문으로 다시 채운다.
+    """
+    if not isinstance(result, str):
+        return result
+    for name, value in values.items():
+        result = result.replace(f"'{value}'", _echo_placeholder(name))
+    return result
+
+
+def _fill_echoes(result: Any, values: Dict[str, str]) -> Any:
+    """_template_echoes의 자리표시자를 호출자의 원문으로 채움"""
+    if not isinstance(result, str):
+        return result
+    for name, value in values.items():
+        result = result.replace(_echo_placeholder(name), f"'{value}'")
+    return result
+
+
+def _call_tracked(func: Callable, *args, **kwargs) -> tuple:
+    """HTTP 결과를 추적하며 호출 - (result, outcome) 반환"""
+    outcome = _CallOutcome()
+    token = _call_outcome.set(outcome)
+    try:
+        return func(*args, **kwargs), outcome
+    finally:
+        _call_outcome.reset(token)
+
+
+async def _acall_tracked(func: Callable, *args, **kwargs) -> tuple:
+    """_call_tracked의 비동기 버전"""
+    outcome = _CallOutcome()
+    token = _call_outcome.set(outcome)
+    try:
+        return await func(*args, **kwargs), outcome
+    finally:
+        _call_outcome.reset(token)
+
+
+# stale-while-revalidate 백그라운드 갱신용 워커 (같은 키는 동시에 하나만 갱신)
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CACHE_REFRESH_WORKERS", "4")),
+    thread_name_prefix="cache-refresh"
+)
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+# 백그라운드 갱신 한 건의 시간 예산 (HTTP 계층이 Deadline으로 timeout/대기를 줄임)
+CACHE_REFRESH_TIMEOUT = float(os.getenv("CACHE_REFRESH_TIMEOUT", "30"))
+
+
+def _schedule_refresh(key: str, refresh: Callable[[], None]) -> None:
+    """만료된 캐시 항목을 백그라운드에서 다시 가져와 교체"""
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    
+    def run_refresh():
+        try:
+            with deadline_scope(Deadline(CACHE_REFRESH_TIMEOUT, label="cache-refresh")):
+                refresh()
+            logger.debug(f"Cache refreshed for key: {key[:50]}...")
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+    
+    try:
+        _refresh_executor.submit(run_refresh)
+    except RuntimeError:
+        # 인터프리터 종료 중에는 갱신 생략
+        with _refreshing_lock:
+            _refreshing.discard(key)
+
+
+def cached_tool(
+    data_type: str,
+    empty_markers: Optional[tuple] = None,
+    canonical_args: Optional[Dict[str, str]] = None
+):
+    """Class decorator that caches a CrewAI tool's _run/_arun results
+    
+    키는 도구 이름 + 정규화된 인자이고, TTL은 CACHE_CONFIGS의 도메인 설정을 따른다.
+    문자열 인자는 NFC/공백/대소문자를 정규화하고, canonical_args로 인자별 모드
+    ("keywords": 조사·불용어 제거, "bag": 추가로 토큰 정렬)를 지정할 수 있다.
+    기본값과 같은 인자는 키에서 빠지므로 생략 여부와 관계없이 같은 항목을 쓴다.
+    도메인에 stale_grace_hours가 있으면 만료된 결과를 바로 반환하고 백그라운드에서 갱신한다.
+    빈 결과(empty_markers)와 4xx 오류는 NEGATIVE_CACHE_CONFIGS의 짧은 TTL로 캐시하고,
+    호출 중 일시적 오류가 하나라도 관찰되거나 시간 예산 부족으로 부가 조회를 생략했으면
+    (has_optional_fetch_budget) 결과를 캐시하지 않는다.
+    canonical_args 인자가 결과에 '원문' 형태로 에코되면 캐시 적중 시 호출자의 원문으로 바꿔 돌려준다.
+    
+    Usage:
+        @cached_tool("academic", empty_markers=("정보를 찾을 수 없습니다",),
+                     canonical_args={"query": "keywords"})
+        class WikipediaSearchTool(BaseTool):
+            ...
+    """
+    markers = tuple(empty_markers) if empty_markers else DEFAULT_EMPTY_RESULT_MARKERS
+    modes = dict(canonical_args or {})
+    for mode in modes.values():
+        if mode not in CANONICAL_MODES:
+            raise ValueError(f"Unknown canonical mode: {mode}")
+    
+    def decorator(cls):
+        run = cls._run
+        arun = cls.__dict__.get("_arun")
+        signature = inspect.signature(run)
+        
+        def cache_key(self, args: tuple, kwargs: dict) -> str:
+            return f"{self.name}:{canonical_call_key(signature, args, kwargs, modes, skip_self=True)}"
+        
+        def echo_values(self, args: tuple, kwargs: dict) -> Dict[str, str]:
+            """정규화 모드가 지정된 문자열 인자의 원문"""
+            if not modes:
+                return {}
+            bound = signature.bind(self, *args, **kwargs)
+            return {
+                name: value for name, value in bound.arguments.items()
+                if name in modes and isinstance(value, str) and value
+            }
+        
+        def store(self, cache: DataCache, key: str, result: Any, outcome: _CallOutcome,
+                  args: tuple, kwargs: dict) -> None:
+            _store_result(cache, key, _template_echoes(result, echo_values(self, args, kwargs)), outcome, markers)
+        
+        def cache_lookup(self, *args, **kwargs) -> Optional[Any]:
+            """네트워크 호출 없이 캐시만 조회 (유예 기간 안의 만료 항목 포함)"""
+            try:
+                entry = get_cache_for_type(data_type).get_entry(cache_key(self, args, kwargs))
+            except TypeError:
+                return None
+            return _fill_echoes(entry[0], echo_values(self, args, kwargs)) if entry is not None else None
+        
+        def lookup_or_refresh(self, cache: DataCache, key: str, args: tuple, kwargs: dict) -> Optional[Any]:
+            entry = cache.get_entry(key)
+            if entry is None:
+                return None
+            data, is_fresh = entry
+            if not is_fresh:
+                # 갱신은 동기 _run으로 수행 (호출 시점이 아닌 CACHE_REFRESH_TIMEOUT 예산 적용)
+                def refresh():
+                    result, outcome = _call_tracked(run, self, *args, **kwargs)
+                    store(self, cache, key, result, outcome, args, kwargs)
+                _schedule_refresh(key, refresh)
+            return _fill_echoes(data, echo_values(self, args, kwargs))
+        
+        @wraps(run)
+        def cached_run(self, *args, **kwargs):
+            cache = get_cache_for_type(data_type)
+            try:
+                key = cache_key(self, args, kwargs)
+            except TypeError:
+                # 키로 만들 수 없는 인자는 캐시 없이 호출
+                return run(self, *args, **kwargs)
+            cached = lookup_or_refresh(self, cache, key, args, kwargs)
+            if cached is not None:
+                return cached
+            
+            result, outcome = _call_tracked(run, self, *args, **kwargs)
+            store(self, cache, key, result, outcome, args, kwargs)
+            return result
+        
+        cls._run = cached_run
+        cls._cache_lookup = cache_lookup
+        
+        if arun is not None:
+            @wraps(arun)
+            async def cached_arun(self, *args, **kwargs):
+                cache = get_cache_for_type(data_type)
+                try:
+                    key = cache_key(self, args, kwargs)
+                except TypeError:
+                    return await arun(self, *args, **kwargs)
+                cached = lookup_or_refresh(self, cache, key, args, kwargs)
+                if cached is not None:
+                    return cached
+                
+                result, outcome = await _acall_tracked(arun, self, *args, **kwargs)
+                store(self, cache, key, result, outcome, args, kwargs)
+                return result
+            
+            cls._arun = cached_arun
+        
+        return cls
+    return decorator
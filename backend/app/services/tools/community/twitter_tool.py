@@ -8,6 +8,8 @@ from crewai.tools import BaseTool
 from datetime import datetime, timezone
 from rich.console import Console
 
+from ..base_tool import AsyncToolMixin, cached_tool, mark_result_uncacheable
+
 console = Console()
 
 # twscrape import는 설치 후 사용
@@ -27,7 +29,8 @@ class TwitterSearchInput(BaseModel):
     include_replies: Optional[bool] = Field(False, description="답글 포함 여부")
 
 
-class TwitterTool(BaseTool):
+@cached_tool("social", empty_markers=("트윗을 찾을 수 없습니다",))
+class TwitterTool(AsyncToolMixin, BaseTool):
     """Twitter/X 커뮤니티 여론 수집 도구"""
     
     name: str = "Twitter/X Community Search"
@@ -80,6 +83,29 @@ class TwitterTool(BaseTool):
             console.print(f"[red]Twitter 검색 오류: {str(e)}[/red]")
             return self._get_mock_data(query)
     
+    async def _arun(
+        self,
+        query: str,
+        limit: Optional[int] = 30,
+        language: Optional[str] = "ko",
+        include_replies: Optional[bool] = False
+    ) -> str:
+        """Twitter/X 검색 수행 (이벤트 루프에서 직접 실행)"""
+        
+        if not TWSCRAPE_AVAILABLE:
+            return self._get_setup_instructions()
+        
+        if not self._api:
+            return self._get_mock_data(query)
+        
+        try:
+            tweets = await self._search_tweets(query, limit, language, include_replies)
+            return self._format_twitter_data(tweets, query)
+            
+        except Exception as e:
+            console.print(f"[red]Twitter 검색 오류: {str(e)}[/red]")
+            return self._get_mock_data(query)
+    
     async def _search_tweets(self, query: str, limit: int, language: str, include_replies: bool) -> List:
         """비동기 트윗 검색"""
         tweets = []
@@ -218,6 +244,7 @@ class TwitterTool(BaseTool):
     
     def _get_mock_data(self, query: str) -> str:
         """API 설정이 없을 때 반환할 메시지"""
+        mark_result_uncacheable()  # 실제 검색 결과가 아니므로 캐시하지 않음
         return f"""❌ Twitter/X API가 설정되지 않았습니다.
 
 현재 Twitter/X 접근 옵션:
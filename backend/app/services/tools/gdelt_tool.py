@@ -1,10 +1,13 @@
 """GDELT v2 Tool - Events/Doc API lightweight wrapper"""
 
-from typing import Type, Optional
+from typing import Any, Dict, Type, Optional
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+import httpx
 import requests
 
+from .base_tool import AsyncToolMixin, AsyncHTTPClient, CircuitOpenError, RobustRequests, cached_tool
+
 
 class GDELTInput(BaseModel):
     query: str = Field(..., description="검색 키워드 (GDELT Doc API) ")
@@ -13,7 +16,9 @@ class GDELTInput(BaseModel):
     sort: Optional[str] = Field("DateDesc", description="정렬: DateDesc|DateAsc|ToneDesc 등")
 
 
-class GDELTTool(BaseTool):
+@cached_tool("news", empty_markers=("GDELT 결과가 없습니다",),
+             canonical_args={"query": "bag"})
+class GDELTTool(AsyncToolMixin, BaseTool):
     """GDELT Doc API search wrapper"""
 
     name: str = "GDELT_Doc_Search"
@@ -29,6 +34,37 @@ class GDELTTool(BaseTool):
         timespan: Optional[str] = "7d",
         sort: Optional[str] = "DateDesc",
     ) -> str:
+        try:
+            resp = RobustRequests.get(**self._build_request(query, max_records, timespan, sort), timeout=25)
+            return self._handle_response(resp, query)
+        except CircuitOpenError as e:
+            return f"GDELT API 일시적으로 사용 불가: {str(e)}"
+        except requests.exceptions.RequestException as e:
+            return f"GDELT API 요청 오류: {str(e)}"
+
+    async def _arun(
+        self,
+        query: str,
+        max_records: Optional[int] = 50,
+        timespan: Optional[str] = "7d",
+        sort: Optional[str] = "DateDesc",
+    ) -> str:
+        try:
+            resp = await AsyncHTTPClient.get(**self._build_request(query, max_records, timespan, sort), timeout=25)
+            return self._handle_response(resp, query)
+        except CircuitOpenError as e:
+            return f"GDELT API 일시적으로 사용 불가: {str(e)}"
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError: 200 응답이 JSON이 아닌 경우 (동기 경로의 requests JSONDecodeError와 같게 처리)
+            return f"GDELT API 요청 오류: {str(e)}"
+
+    def _build_request(
+        self,
+        query: str,
+        max_records: Optional[int],
+        timespan: Optional[str],
+        sort: Optional[str],
+    ) -> Dict[str, Any]:
         # See: https://blog.gdeltproject.org/gdelt-doc-2-0-api-debuts/
         url = "https://api.gdeltproject.org/api/v2/doc/doc"
         params = {
@@ -39,24 +75,22 @@ class GDELTTool(BaseTool):
             "maxrecords": max(1, min(250, max_records or 50)),
             "sort": sort or "DateDesc",
         }
-        try:
-            resp = requests.get(url, params=params, timeout=25)
-            if resp.status_code != 200:
-                return f"GDELT API 오류: HTTP {resp.status_code} - {resp.text[:300]}"
-            data = resp.json()
-            arts = (data.get("articles") or [])
-            if not arts:
-                return f"'{query}'에 대한 GDELT 결과가 없습니다."
-            lines = [f"🌐 GDELT 검색: '{query}' (표시 {len(arts)}건)\n"]
-            for i, a in enumerate(arts[:10], 1):
-                title = a.get("title") or "제목 없음"
-                source = a.get("sourceCommonName") or a.get("domain") or "출처 미상"
-                date = a.get("seendate") or ""
-                url_a = a.get("url") or ""
-                lines.append(f"[{i}] {title}\n- 출처: {source}\n- 일시: {date}\n- 링크: {url_a}")
-            if len(arts) > 10:
-                lines.append("... (더 많은 결과가 있습니다)")
-            return "\n".join(lines)
-        except requests.exceptions.RequestException as e:
-            return f"GDELT API 요청 오류: {str(e)}"
+        return {"url": url, "params": params}
 
+    def _handle_response(self, resp, query: str) -> str:
+        if resp.status_code != 200:
+            return f"GDELT API 오류: HTTP {resp.status_code} - {resp.text[:300]}"
+        data = resp.json()
+        arts = (data.get("articles") or [])
+        if not arts:
+            return f"'{query}'에 대한 GDELT 결과가 없습니다."
+        lines = [f"🌐 GDELT 검색: '{query}' (표시 {len(arts)}건)\n"]
+        for i, a in enumerate(arts[:10], 1):
+            title = a.get("title") or "제목 없음"
+            source = a.get("sourceCommonName") or a.get("domain") or "출처 미상"
+            date = a.get("seendate") or ""
+            url_a = a.get("url") or ""
+            lines.append(f"[{i}] {title}\n- 출처: {source}\n- 일시: {date}\n- 링크: {url_a}")
+        if len(arts) > 10:
+            lines.append("... (더 많은 결과가 있습니다)")
+        return "\n".join(lines)
@@ -1,11 +1,14 @@
 """Google Fact Check Tools API - claims.search wrapper"""
 
-from typing import Type, Optional
+from typing import Any, Dict, Type, Optional, Union
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 import os
+import httpx
 import requests
 
+from ..base_tool import AsyncToolMixin, AsyncHTTPClient, CircuitOpenError, RobustRequests, cached_tool
+
 
 class FactCheckSearchInput(BaseModel):
     query: str = Field(..., description="텍스트 쿼리")
@@ -14,7 +17,9 @@ class FactCheckSearchInput(BaseModel):
     pageSize: Optional[int] = Field(10, description="페이지 크기(기본 10)")
 
 
-class GoogleFactCheckTool(BaseTool):
+@cached_tool("news", empty_markers=("사실검증 결과가 없습니다",),
+             canonical_args={"query": "keywords"})
+class GoogleFactCheckTool(AsyncToolMixin, BaseTool):
     """Google Fact Check Tools - Claim Search API"""
 
     name: str = "Google_Fact_Check_Search"
@@ -30,6 +35,46 @@ class GoogleFactCheckTool(BaseTool):
         maxAgeDays: Optional[int] = None,
         pageSize: Optional[int] = 10,
     ) -> str:
+        request = self._build_request(query, languageCode, maxAgeDays, pageSize)
+        if isinstance(request, str):
+            return request
+
+        try:
+            resp = RobustRequests.get(**request, timeout=20)
+            return self._handle_response(resp, query)
+        except CircuitOpenError as e:
+            return f"Google Fact Check API 일시적으로 사용 불가: {str(e)}"
+        except requests.exceptions.RequestException as e:
+            return f"Google Fact Check API 요청 오류: {str(e)}"
+
+    async def _arun(
+        self,
+        query: str,
+        languageCode: Optional[str] = None,
+        maxAgeDays: Optional[int] = None,
+        pageSize: Optional[int] = 10,
+    ) -> str:
+        request = self._build_request(query, languageCode, maxAgeDays, pageSize)
+        if isinstance(request, str):
+            return request
+
+        try:
+            resp = await AsyncHTTPClient.get(**request, timeout=20)
+            return self._handle_response(resp, query)
+        except CircuitOpenError as e:
+            return f"Google Fact Check API 일시적으로 사용 불가: {str(e)}"
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError: JSON이 아닌 응답 (동기 경로의 requests JSONDecodeError와 같게 처리)
+            return f"Google Fact Check API 요청 오류: {str(e)}"
+
+    def _build_request(
+        self,
+        query: str,
+        languageCode: Optional[str],
+        maxAgeDays: Optional[int],
+        pageSize: Optional[int],
+    ) -> Union[Dict[str, Any], str]:
+        """요청 구성 (API 키가 없으면 안내 메시지 반환)"""
         api_key = os.getenv("GOOGLE_FACT_CHECK_API_KEY")
         if not api_key:
             return "Google API 키가 설정되지 않았습니다. 환경변수 GOOGLE_FACT_CHECK_API_KEY를 설정하세요."
@@ -45,32 +90,30 @@ class GoogleFactCheckTool(BaseTool):
         if maxAgeDays:
             params["maxAgeDays"] = max(1, maxAgeDays)
 
-        try:
-            resp = requests.get(url, params=params, timeout=20)
-            if resp.status_code != 200:
-                return f"Google Fact Check API 오류: HTTP {resp.status_code} - {resp.text[:300]}"
-            data = resp.json()
-            claims = data.get("claims", [])
-            if not claims:
-                return f"'{query}'에 대한 사실검증 결과가 없습니다."
-
-            lines = [f"🔎 Fact Check 검색 결과: '{query}' (표시 {len(claims)}건)\n"]
-            for i, c in enumerate(claims, 1):
-                text = c.get("text") or "(claim 미상)"
-                claimant = c.get("claimant") or "(주장자 미상)"
-                date = c.get("claimDate") or ""
-                reviews = c.get("claimReview", [])
-                if reviews:
-                    r = reviews[0]
-                    pub = (r.get("publisher") or {}).get("name") or "출처 미상"
-                    rating = r.get("textualRating") or ""
-                    url_r = r.get("url") or ""
-                    lines.append(
-                        f"[{i}] {text}\n- 주장자: {claimant}\n- 일시: {date}\n- 출처: {pub}\n- 판정: {rating}\n- 링크: {url_r}\n"
-                    )
-                else:
-                    lines.append(f"[{i}] {text} - 주장자: {claimant} ({date})\n")
-            return "\n".join(lines)
-        except requests.exceptions.RequestException as e:
-            return f"Google Fact Check API 요청 오류: {str(e)}"
+        return {"url": url, "params": params}
+
+    def _handle_response(self, resp, query: str) -> str:
+        if resp.status_code != 200:
+            return f"Google Fact Check API 오류: HTTP {resp.status_code} - {resp.text[:300]}"
+        data = resp.json()
+        claims = data.get("claims", [])
+        if not claims:
+            return f"'{query}'에 대한 사실검증 결과가 없습니다."
 
+        lines = [f"🔎 Fact Check 검색 결과: '{query}' (표시 {len(claims)}건)\n"]
+        for i, c in enumerate(claims, 1):
+            text = c.get("text") or "(claim 미상)"
+            claimant = c.get("claimant") or "(주장자 미상)"
+            date = c.get("claimDate") or ""
+            reviews = c.get("claimReview", [])
+            if reviews:
+                r = reviews[0]
+                pub = (r.get("publisher") or {}).get("name") or "출처 미상"
+                rating = r.get("textualRating") or ""
+                url_r = r.get("url") or ""
+                lines.append(
+                    f"[{i}] {text}\n- 주장자: {claimant}\n- 일시: {date}\n- 출처: {pub}\n- 판정: {rating}\n- 링크: {url_r}\n"
+                )
+            else:
+                lines.append(f"[{i}] {text} - 주장자: {claimant} ({date})\n")
+        return "\n".join(lines)
@@ -2,12 +2,15 @@
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from typing import Type
+from typing import Any, Dict, Optional, Type
+import httpx
 import requests
 import os
 from datetime import datetime
 from rich.console import Console
 
+from ..base_tool import AsyncToolMixin, AsyncHTTPClient, CircuitOpenError, RobustRequests, cached_tool, mark_result_uncacheable
+
 console = Console()
 
 
@@ -19,7 +22,9 @@ class NaverNewsInput(BaseModel):
     start: int = Field(default=1, description="검색 시작 위치")
 
 
-class NaverNewsTool(BaseTool):
+@cached_tool("news", empty_markers=("뉴스를 찾을 수 없습니다",),
+             canonical_args={"query": "bag"})
+class NaverNewsTool(AsyncToolMixin, BaseTool):
     """네이버 뉴스 검색 도구"""
     
     name: str = "Naver News Search"
@@ -33,49 +38,79 @@ class NaverNewsTool(BaseTool):
     def _run(self, query: str, sort: str = "sim", display: int = 30, start: int = 1) -> str:
         """네이버 뉴스 API를 통해 뉴스 검색"""
         try:
-            # API 인증 정보
-            client_id = os.getenv("NAVER_CLIENT_ID")
-            client_secret = os.getenv("NAVER_CLIENT_SECRET")
+            request = self._build_request(query, sort, display, start)
+            if request is None:
+                return self._get_mock_data(query)
             
-            if not client_id or not client_secret:
+            # API 요청 (일일 한도 429는 재시도해도 풀리지 않으므로 fast 정책)
+            response = RobustRequests.get(**request, timeout=10, retry_policy="fast")
+            return self._handle_response(response, query)
+                
+        except CircuitOpenError as e:
+            return f"네이버 뉴스 API 일시적으로 사용 불가: {str(e)}"
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]네이버 뉴스 API 요청 오류: {str(e)}[/red]")
+            return self._get_mock_data(query)
+        except Exception as e:
+            console.print(f"[red]네이버 뉴스 검색 오류: {str(e)}[/red]")
+            return f"네이버 뉴스 검색 중 오류가 발생했습니다: {str(e)}"
+    
+    async def _arun(self, query: str, sort: str = "sim", display: int = 30, start: int = 1) -> str:
+        """네이버 뉴스 검색 (공유 httpx 풀 사용)"""
+        try:
+            request = self._build_request(query, sort, display, start)
+            if request is None:
                 return self._get_mock_data(query)
             
+            response = await AsyncHTTPClient.get(**request, timeout=10)
+            return self._handle_response(response, query)
+        
+        except CircuitOpenError as e:
+            return f"네이버 뉴스 API 일시적으로 사용 불가: {str(e)}"
+        except httpx.HTTPError as e:
+            console.print(f"[red]네이버 뉴스 API 요청 오류: {str(e)}[/red]")
+            return self._get_mock_data(query)
+        except Exception as e:
+            console.print(f"[red]네이버 뉴스 검색 오류: {str(e)}[/red]")
+            return f"네이버 뉴스 검색 중 오류가 발생했습니다: {str(e)}"
+    
+    def _build_request(self, query: str, sort: str, display: int, start: int) -> Optional[Dict[str, Any]]:
+        """요청 URL/헤더/파라미터 구성 (API 키가 없으면 None)"""
+        # API 인증 정보
+        client_id = os.getenv("NAVER_CLIENT_ID")
+        client_secret = os.getenv("NAVER_CLIENT_SECRET")
+        
+        if not client_id or not client_secret:
+            return None
+        
+        return {
             # API 엔드포인트
-            url = "https://openapi.naver.com/v1/search/news.json"
-            
+            "url": "https://openapi.naver.com/v1/search/news.json",
             # 헤더 설정
-            headers = {
+            "headers": {
                 "X-Naver-Client-Id": client_id,
                 "X-Naver-Client-Secret": client_secret
-            }
-            
+            },
             # 파라미터 설정
-            params = {
+            "params": {
                 "query": query,
                 "sort": sort,
                 "display": min(display, 100),  # 최대 100개
                 "start": start
             }
-            
-            # API 요청
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self._format_news_data(data, query)
-            elif response.status_code == 401:
-                return "네이버 API 인증 오류: Client ID 또는 Secret이 올바르지 않습니다."
-            elif response.status_code == 429:
-                return "네이버 API 일일 요청 한도 초과 (25,000회/일)"
-            else:
-                return f"네이버 뉴스 API 오류: {response.status_code}"
-                
-        except requests.exceptions.RequestException as e:
-            console.print(f"[red]네이버 뉴스 API 요청 오류: {str(e)}[/red]")
-            return self._get_mock_data(query)
-        except Exception as e:
-            console.print(f"[red]네이버 뉴스 검색 오류: {str(e)}[/red]")
-            return f"네이버 뉴스 검색 중 오류가 발생했습니다: {str(e)}"
+        }
+    
+    def _handle_response(self, response, query: str) -> str:
+        """응답 상태 코드별 처리 (requests/httpx 응답 모두 지원)"""
+        if response.status_code == 200:
+            data = response.json()
+            return self._format_news_data(data, query)
+        elif response.status_code == 401:
+            return "네이버 API 인증 오류: Client ID 또는 Secret이 올바르지 않습니다."
+        elif response.status_code == 429:
+            return "네이버 API 일일 요청 한도 초과 (25,000회/일)"
+        else:
+            return f"네이버 뉴스 API 오류: {response.status_code}"
     
     def _format_news_data(self, data: dict, query: str) -> str:
         """네이버 뉴스 API 응답 포맷팅 - 향상된 정보 제공"""
@@ -157,6 +192,7 @@ class NaverNewsTool(BaseTool):
     
     def _get_mock_data(self, query: str) -> str:
         """API 키가 없을 때 반환할 오류 메시지"""
+        mark_result_uncacheable()  # 실제 검색 결과가 아니므로 캐시하지 않음
         return f"❌ 네이버 뉴스 API 키가 설정되지 않았습니다.\n\n" \
                f"API 키 설정 방법:\n" \
                f"1. 네이버 개발자 센터에서 API 키 발급: https://developers.naver.com/\n" \
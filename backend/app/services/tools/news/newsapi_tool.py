@@ -1,11 +1,14 @@
 """NewsAPI.org Tool - International news search"""
 
-from typing import Type, Optional
+from typing import Any, Dict, Type, Optional, Union
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 import os
+import httpx
 import requests
 
+from ..base_tool import AsyncToolMixin, AsyncHTTPClient, CircuitOpenError, RobustRequests, cached_tool
+
 
 class NewsAPIInput(BaseModel):
     """Input schema for NewsAPI search"""
@@ -17,7 +20,9 @@ class NewsAPIInput(BaseModel):
     page_size: Optional[int] = Field(30, description="페이지당 결과수(최대 100)")
 
 
-class NewsAPITool(BaseTool):
+@cached_tool("news", empty_markers=("뉴스 결과가 없습니다",),
+             canonical_args={"query": "bag"})
+class NewsAPITool(AsyncToolMixin, BaseTool):
     """NewsAPI.org everything endpoint wrapper"""
 
     name: str = "NewsAPI Search"
@@ -36,6 +41,50 @@ class NewsAPITool(BaseTool):
         sort_by: Optional[str] = "publishedAt",
         page_size: Optional[int] = 30,
     ) -> str:
+        request = self._build_request(query, from_date, to_date, language, sort_by, page_size)
+        if isinstance(request, str):
+            return request
+
+        try:
+            resp = RobustRequests.get(**request, timeout=20)
+            return self._handle_response(resp, query)
+        except CircuitOpenError as e:
+            return f"NewsAPI 일시적으로 사용 불가: {str(e)}"
+        except requests.exceptions.RequestException as e:
+            return f"NewsAPI 요청 오류: {str(e)}"
+
+    async def _arun(
+        self,
+        query: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        language: Optional[str] = None,
+        sort_by: Optional[str] = "publishedAt",
+        page_size: Optional[int] = 30,
+    ) -> str:
+        request = self._build_request(query, from_date, to_date, language, sort_by, page_size)
+        if isinstance(request, str):
+            return request
+
+        try:
+            resp = await AsyncHTTPClient.get(**request, timeout=20)
+            return self._handle_response(resp, query)
+        except CircuitOpenError as e:
+            return f"NewsAPI 일시적으로 사용 불가: {str(e)}"
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError: JSON이 아닌 응답 (동기 경로의 requests JSONDecodeError와 같게 처리)
+            return f"NewsAPI 요청 오류: {str(e)}"
+
+    def _build_request(
+        self,
+        query: str,
+        from_date: Optional[str],
+        to_date: Optional[str],
+        language: Optional[str],
+        sort_by: Optional[str],
+        page_size: Optional[int],
+    ) -> Union[Dict[str, Any], str]:
+        """요청 구성 (API 키가 없으면 안내 메시지 반환)"""
         api_key = os.getenv("NEWSAPI_API_KEY")
         if not api_key:
             return "NewsAPI API 키가 설정되지 않았습니다. 환경변수 NEWSAPI_API_KEY를 설정하세요."
@@ -54,73 +103,72 @@ class NewsAPITool(BaseTool):
             params["language"] = language
 
         headers = {"X-Api-Key": api_key}
+        return {"url": url, "params": params, "headers": headers}
 
-        try:
-            resp = requests.get(url, params=params, headers=headers, timeout=20)
-            if resp.status_code != 200:
-                return f"NewsAPI 오류: HTTP {resp.status_code} - {resp.text[:300]}"
-            data = resp.json()
-            if data.get("status") != "ok":
-                return f"NewsAPI 오류: {data}"
-
-            articles = data.get("articles", [])
-            if not articles:
-                return f"'{query}'에 대한 뉴스 결과가 없습니다."
-
-            total_results = data.get('totalResults', 0)
-            lines = [
-                f"📰 NewsAPI 검색 결과: '{query}'\n",
-                f"📊 총 {total_results:,}건 중 {len(articles)}건 표시\n\n"
-            ]
+    def _handle_response(self, resp, query: str) -> str:
+        """응답 포맷팅 (requests/httpx 응답 모두 지원)"""
+        if resp.status_code != 200:
+            return f"NewsAPI 오류: HTTP {resp.status_code} - {resp.text[:300]}"
+        data = resp.json()
+        if data.get("status") != "ok":
+            return f"NewsAPI 오류: {data}"
+
+        articles = data.get("articles", [])
+        if not articles:
+            return f"'{query}'에 대한 뉴스 결과가 없습니다."
+
+        total_results = data.get('totalResults', 0)
+        lines = [
+            f"📰 NewsAPI 검색 결과: '{query}'\n",
+            f"📊 총 {total_results:,}건 중 {len(articles)}건 표시\n\n"
+        ]
+        
+        
+        for i, a in enumerate(articles, 1):
+            title = a.get("title") or "제목 없음"
+            source = (a.get("source") or {}).get("name") or "출처 미상"
+            published = a.get("publishedAt") or ""
+            author = a.get("author") or ""
+            desc = a.get("description") or ""
+            content = a.get("content") or ""
+            url_a = a.get("url") or ""
+            url_image = a.get("urlToImage") or ""
             
+            # 날짜 포맷팅 및 최신성 표시
+            if published:
+                try:
+                    from datetime import datetime, timezone
+                    dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                    formatted_date = dt.strftime("%Y-%m-%d %H:%M UTC")
+                    now = datetime.now(timezone.utc)
+                    hours_ago = (now - dt).total_seconds() / 3600
+                    
+                    published_str = formatted_date
+                except:
+                    published_str = published
+            else:
+                published_str = "N/A"
             
-            for i, a in enumerate(articles, 1):
-                title = a.get("title") or "제목 없음"
-                source = (a.get("source") or {}).get("name") or "출처 미상"
-                published = a.get("publishedAt") or ""
-                author = a.get("author") or ""
-                desc = a.get("description") or ""
-                content = a.get("content") or ""
-                url_a = a.get("url") or ""
-                url_image = a.get("urlToImage") or ""
-                
-                # 날짜 포맷팅 및 최신성 표시
-                if published:
-                    try:
-                        from datetime import datetime, timezone
-                        dt = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                        formatted_date = dt.strftime("%Y-%m-%d %H:%M UTC")
-                        now = datetime.now(timezone.utc)
-                        hours_ago = (now - dt).total_seconds() / 3600
-                        
-                        published_str = formatted_date
-                    except:
-                        published_str = published
-                else:
-                    published_str = "N/A"
-                
-                lines.append(f"[{i}] {title}\n")
-                lines.append(f"  📰 출처: {source}\n")
-                lines.append(f"  📅 발행: {published_str}\n")
-                
-                if author and author != "null":
-                    # 저자명 정리
-                    author_clean = author[:50] if len(author) > 50 else author
-                    lines.append(f"  ✍️ 저자: {author_clean}\n")
-                
-                # 요약
-                if desc:
-                    desc_preview = desc[:350] + "..." if len(desc) > 350 else desc
-                    lines.append(f"  📝 요약: {desc_preview}\n")
-                
-                
-                lines.append(f"  🔗 링크: {url_a}\n")
-                
-                lines.append("\n")
+            lines.append(f"[{i}] {title}\n")
+            lines.append(f"  📰 출처: {source}\n")
+            lines.append(f"  📅 발행: {published_str}\n")
             
-            lines.append(f"\n💡 국제 뉴스를 통해 다양한 관점을 파악하세요.")
+            if author and author != "null":
+                # 저자명 정리
+                author_clean = author[:50] if len(author) > 50 else author
+                lines.append(f"  ✍️ 저자: {author_clean}\n")
             
-            return "".join(lines)
-        except requests.exceptions.RequestException as e:
-            return f"NewsAPI 요청 오류: {str(e)}"
+            # 요약
+            if desc:
+                desc_preview = desc[:350] + "..." if len(desc) > 350 else desc
+                lines.append(f"  📝 요약: {desc_preview}\n")
+            
+            
+            lines.append(f"  🔗 링크: {url_a}\n")
+            
+            lines.append("\n")
+        
+        lines.append(f"\n💡 국제 뉴스를 통해 다양한 관점을 파악하세요.")
+        
+        return "".join(lines)
 
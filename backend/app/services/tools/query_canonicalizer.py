@@ -0,0 +1,125 @@
+"""Query canonicalization for tool cache keys
+
+의미가 같은 도구 호출("한국 실업률", "한국  실업률", "실업률 한국")이 같은 캐시 항목을 쓰도록
+인자를 정규화한다. 정규화 결과는 캐시 키에만 쓰이고, 실제 API 요청에는 원래 인자가 그대로 전달된다.
+
+정규화 모드 (인자별로 지정):
+    text      Unicode NFC + 공백 정리 + casefold (모든 문자열 인자의 기본값, 대문자 AND/OR/NOT 연산자는 유지)
+    keywords  text + 문장부호/조사/불용어 제거 (어순 유지)
+    bag       keywords + 토큰 정렬 (어순 무관한 키워드 검색용)
+"""
+
+import inspect
+import json
+import re
+import unicodedata
+from typing import Any, Dict, Optional
+
+
+CANONICAL_MODES = ("text", "keywords", "bag")
+
+# 어간이 2음절 이상 남을 때만 떼어내는 조사 (긴 것부터 매칭)
+# 한 글자 조사(은/는/의/도/로 등)는 원자로, 한반도처럼 명사 끝 글자와 겹쳐 서로 다른 질의를
+# 같은 키로 묶으므로 떼지 않는다 (어휘 사전 없이 구분할 수 없음)
+KOREAN_PARTICLES = tuple(sorted((
+    "에서의", "으로의", "이라는", "에서", "에게", "으로", "까지", "부터", "보다", "처럼",
+    "라는", "에는", "에도", "과의", "와의", "이란",
+), key=len, reverse=True))
+
+STOPWORDS = frozenset({
+    # 한국어 질의 군더더기
+    "관련", "관한", "대한", "대해", "대해서", "무엇", "어떻게", "얼마", "얼마나", "정도",
+    # 영어
+    "a", "an", "the", "of", "in", "on", "for", "to", "and", "about", "what", "is", "are", "how",
+})
+
+# 따옴표/연산자 등 검색 문법이 있으면 토큰을 건드리지 않음
+_QUERY_SYNTAX = re.compile(r'["():]|\b(?:AND|OR|NOT)\b|(?:^|\s)[+-]\w')
+# 대소문자를 구분하는 불리언 연산자 (arXiv 등에서 "AND"와 "and"는 의미가 다름)
+_OPERATORS = re.compile(r"\b(AND|OR|NOT|ANDNOT)\b")
+_PUNCTUATION = re.compile(r"[^\w\s%.\-]")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def _strip_particle(token: str) -> str:
+    """한글 토큰 끝의 조사 제거 (어간이 2음절 이상일 때만)"""
+    if not _HANGUL.search(token[-1:]):
+        return token
+    for particle in KOREAN_PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[:-len(particle)]
+    return token
+
+
+def _casefold_keep_operators(text: str) -> str:
+    """대문자 불리언 연산자만 그대로 두고 casefold"""
+    parts = _OPERATORS.split(text)
+    return "".join(part if i % 2 else part.casefold() for i, part in enumerate(parts))
+
+
+def canonicalize_text(value: str, mode: str = "text") -> str:
+    """문자열 하나를 지정한 모드로 정규화"""
+    if mode not in CANONICAL_MODES:
+        raise ValueError(f"Unknown canonical mode: {mode}")
+
+    text = unicodedata.normalize("NFC", value)
+    if mode != "text" and _QUERY_SYNTAX.search(text):
+        mode = "text"
+
+    text = _casefold_keep_operators(" ".join(text.split()))
+    if mode == "text":
+        return text
+
+    tokens = []
+    for token in _PUNCTUATION.sub(" ", text).split():
+        token = _strip_particle(token.strip(".-"))
+        if token and token not in STOPWORDS:
+            tokens.append(token)
+
+    # 전부 불용어였다면 원문 기준 키 유지
+    if not tokens:
+        return text
+    if mode == "bag":
+        tokens = sorted(set(tokens))
+    return " ".join(tokens)
+
+
+def canonical_arguments(
+    signature: inspect.Signature,
+    args: tuple,
+    kwargs: dict,
+    modes: Optional[Dict[str, str]] = None,
+    skip_self: bool = False
+) -> Dict[str, Any]:
+    """호출 인자를 시그니처에 바인딩한 뒤 기본값과 같은 인자는 빼고 정규화"""
+    if skip_self:
+        args = (None,) + tuple(args)
+    bound = signature.bind(*args, **kwargs)
+    modes = modes or {}
+
+    canonical = {}
+    for index, (name, value) in enumerate(bound.arguments.items()):
+        if skip_self and index == 0:
+            continue
+        parameter = signature.parameters[name]
+        if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            canonical[name] = value
+            continue
+        if parameter.default is not inspect.Parameter.empty and value == parameter.default:
+            continue
+        if isinstance(value, str):
+            value = canonicalize_text(value, modes.get(name, "text"))
+        canonical[name] = value
+    return canonical
+
+
+def canonical_call_key(
+    signature: inspect.Signature,
+    args: tuple,
+    kwargs: dict,
+    modes: Optional[Dict[str, str]] = None,
+    skip_self: bool = False
+) -> str:
+    """정규화된 인자를 안정적인 JSON 문자열로 직렬화"""
+    canonical = canonical_arguments(signature, args, kwargs, modes, skip_self)
+    return json.dumps(canonical, ensure_ascii=False, sort_keys=True, default=str)
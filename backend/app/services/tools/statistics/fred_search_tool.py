@@ -4,8 +4,8 @@ import os
 from typing import Type, Optional, List, Dict
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-import requests
-from datetime import datetime, timedelta
+
+from ..base_tool import AsyncToolMixin, AsyncHTTPClient, RobustRequests, cached_tool, has_optional_fetch_budget
 
 
 class FREDSearchInput(BaseModel):
@@ -14,7 +14,9 @@ class FREDSearchInput(BaseModel):
     limit: int = Field(10, description="최근 몇 개 데이터를 가져올지")
 
 
-class FREDSearchTool(BaseTool):
+@cached_tool("statistics", empty_markers=("시계열을 찾을 수 없습니다",),
+             canonical_args={"query": "bag"})
+class FREDSearchTool(AsyncToolMixin, BaseTool):
     """FRED 자연어 검색 도구 - 경제 지표를 자연어로 검색"""
 
     name: str = "FRED_Natural_Search"
@@ -43,28 +45,55 @@ class FREDSearchTool(BaseTool):
             # API 키 없으면 기본 매핑만 사용
             return self._search_from_cache(query)
         
-        url = "https://api.stlouisfed.org/fred/series/search"
-        params = {
-            "search_text": query,
-            "api_key": api_key,
-            "file_type": "json",
-            "limit": limit,
-            "order_by": "popularity",
-            "sort_order": "desc"
-        }
-        
         try:
-            resp = requests.get(url, params=params, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                if "seriess" in data:
-                    return data["seriess"]
-        except:
+            resp = RobustRequests.get(**self._build_search_request(query, limit, api_key), timeout=10)
+            series = self._parse_search_response(resp)
+            if series is not None:
+                return series
+        except Exception:
             pass
         
         # 실패 시 캐시에서 검색
         return self._search_from_cache(query)
     
+    async def _asearch_series(self, query: str, limit: int = 5) -> List[Dict]:
+        """FRED series/search API 사용 (비동기)"""
+        api_key = os.getenv("FRED_API_KEY")
+        if not api_key:
+            return self._search_from_cache(query)
+        
+        try:
+            resp = await AsyncHTTPClient.get(**self._build_search_request(query, limit, api_key), timeout=10)
+            series = self._parse_search_response(resp)
+            if series is not None:
+                return series
+        except Exception:
+            pass
+        
+        return self._search_from_cache(query)
+    
+    def _build_search_request(self, query: str, limit: int, api_key: str) -> Dict:
+        """series/search 요청 구성"""
+        return {
+            "url": "https://api.stlouisfed.org/fred/series/search",
+            "params": {
+                "search_text": query,
+                "api_key": api_key,
+                "file_type": "json",
+                "limit": limit,
+                "order_by": "popularity",
+                "sort_order": "desc"
+            }
+        }
+    
+    def _parse_search_response(self, resp) -> Optional[List[Dict]]:
+        """series/search 응답에서 시리즈 목록 추출"""
+        if resp.status_code == 200:
+            data = resp.json()
+            if "seriess" in data:
+                return data["seriess"]
+        return None
+    
     def _search_from_cache(self, query: str) -> List[Dict]:
         """캐시된 매핑에서 검색"""
         query_lower = query.lower()
@@ -116,26 +145,49 @@ class FREDSearchTool(BaseTool):
         if not api_key:
             return None
         
-        url = "https://api.stlouisfed.org/fred/series/observations"
-        params = {
-            "series_id": series_id,
-            "api_key": api_key,
-            "file_type": "json",
-            "limit": limit,
-            "sort_order": "desc"
-        }
+        try:
+            resp = RobustRequests.get(**self._build_observations_request(series_id, limit, api_key), timeout=10)
+            return self._parse_observations_response(resp)
+        except Exception:
+            pass
+        
+        return None
+    
+    async def _afetch_series_data(self, series_id: str, limit: int = 10) -> Optional[List[Dict]]:
+        """시리즈 데이터 가져오기 (비동기)"""
+        api_key = os.getenv("FRED_API_KEY")
+        if not api_key:
+            return None
         
         try:
-            resp = requests.get(url, params=params, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                if "observations" in data:
-                    return data["observations"]
-        except:
+            resp = await AsyncHTTPClient.get(**self._build_observations_request(series_id, limit, api_key), timeout=10)
+            return self._parse_observations_response(resp)
+        except Exception:
             pass
         
         return None
     
+    def _build_observations_request(self, series_id: str, limit: int, api_key: str) -> Dict:
+        """series/observations 요청 구성"""
+        return {
+            "url": "https://api.stlouisfed.org/fred/series/observations",
+            "params": {
+                "series_id": series_id,
+                "api_key": api_key,
+                "file_type": "json",
+                "limit": limit,
+                "sort_order": "desc"
+            }
+        }
+    
+    def _parse_observations_response(self, resp) -> Optional[List[Dict]]:
+        """series/observations 응답에서 관측값 추출"""
+        if resp.status_code == 200:
+            data = resp.json()
+            if "observations" in data:
+                return data["observations"]
+        return None
+    
     def _format_observations(self, observations: List[Dict], units: str) -> str:
         """관측값 포맷팅"""
         if not observations:
@@ -178,9 +230,32 @@ class FREDSearchTool(BaseTool):
         if not search_results:
             return f"❌ '{query}'에 대한 시계열을 찾을 수 없습니다."
         
-        return self._format_structured_output(query, search_results, fetch_data, limit)
+        # 데이터 가져오기 (첫 번째 시리즈만, 부가 정보이므로 시간 예산이 부족하면 생략)
+        data_info = None
+        if fetch_data and has_optional_fetch_budget():
+            data_info = self._fetch_and_format_data(search_results[0].get("id", ""), limit)
+        
+        return self._format_structured_output(query, search_results, data_info)
+    
+    async def _arun(
+        self,
+        query: str,
+        fetch_data: bool = True,
+        limit: int = 10
+    ) -> str:
+        """검색 실행 (비동기)"""
+        search_results = await self._asearch_series(query, limit=5)
+        
+        if not search_results:
+            return f"❌ '{query}'에 대한 시계열을 찾을 수 없습니다."
+        
+        data_info = None
+        if fetch_data and has_optional_fetch_budget():
+            data_info = await self._afetch_and_format_data(search_results[0].get("id", ""), limit)
+        
+        return self._format_structured_output(query, search_results, data_info)
     
-    def _format_structured_output(self, query: str, search_results: List[Dict], fetch_data: bool, limit: int) -> str:
+    def _format_structured_output(self, query: str, search_results: List[Dict], data_info: Optional[str]) -> str:
         """구조화된 FRED 출력 형식"""
         
         result = []
@@ -201,9 +276,8 @@ class FREDSearchTool(BaseTool):
                 if value and key not in ['title']:  # title은 헤더에 사용되므로 제외
                     result.append(f"  📋 {key}: {value}")
             
-            # 데이터 가져오기 (첫 번째만 또는 모든 시리즈)
-            if fetch_data and (i == 1):  # 첫 번째만 데이터 표시
-                data_info = self._fetch_and_format_data(series.get("id", ""), limit)
+            # 첫 번째 시리즈에만 데이터 표시
+            if data_info is not None and i == 1:
                 result.append("\n📊 시계열 데이터:")
                 result.append(data_info)
             
@@ -232,6 +306,20 @@ class FREDSearchTool(BaseTool):
             return "  ⚠️ FRED API 키가 없어 데이터를 가져올 수 없습니다."
         
         observations = self._fetch_series_data(series_id, limit)
+        return self._format_observation_data(observations, limit)
+    
+    async def _afetch_and_format_data(self, series_id: str, limit: int) -> str:
+        """데이터를 가져와서 원본 형태로 포맷팅 (비동기)"""
+        
+        api_key = os.getenv("FRED_API_KEY")
+        if not api_key:
+            return "  ⚠️ FRED API 키가 없어 데이터를 가져올 수 없습니다."
+        
+        observations = await self._afetch_series_data(series_id, limit)
+        return self._format_observation_data(observations, limit)
+    
+    def _format_observation_data(self, observations: Optional[List[Dict]], limit: int) -> str:
+        """관측값의 모든 메타데이터를 그대로 표시"""
         if not observations:
             return "  ⚠️ 데이터를 불러올 수 없습니다."
         
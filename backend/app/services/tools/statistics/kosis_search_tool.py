@@ -7,6 +7,9 @@ import os
 import PublicDataReader as pdr
 import pandas as pd
 
+from ..base_tool import cached_tool, has_optional_fetch_budget
+from ....utils.deadline import DEADLINE_CONFIG, TIME_BUDGET_EXHAUSTED_MESSAGE, has_time_budget
+
 
 class KOSISSearchInput(BaseModel):
     query: str = Field(..., description="검색어 (예: GDP, 인구, 실업률)")
@@ -14,6 +17,8 @@ class KOSISSearchInput(BaseModel):
     fetch_data: bool = Field(True, description="통계 데이터도 함께 가져올지 여부")
 
 
+@cached_tool("statistics", empty_markers=("통계표를 찾을 수 없습니다",),
+             canonical_args={"query": "bag"})
 class KOSISSearchTool(BaseTool):
     """KOSIS 통합검색을 통한 자연어 통계 검색 (PublicDataReader 사용)"""
 
@@ -32,6 +37,9 @@ class KOSISSearchTool(BaseTool):
     ) -> str:
         """KOSIS 자연어 검색 실행 - LLM 친화적 구조화 출력"""
         
+        if not has_time_budget(DEADLINE_CONFIG["min_tool_seconds"]):
+            return TIME_BUDGET_EXHAUSTED_MESSAGE
+        
         # API 키 확인 (따옴표 제거)
         api_key = os.getenv("KOSIS_API_KEY", "").strip('"')
         if not api_key:
@@ -86,8 +94,11 @@ class KOSISSearchTool(BaseTool):
             if metadata['description']:
                 result.append(f"📝  설명: {metadata['description']}")
             
-            # 실제 데이터 가져오기
-            if fetch_data:
+            # 실제 데이터 가져오기 (통계표마다 API 호출이 추가되므로 시간 예산이 부족하면 생략)
+            if fetch_data and not has_optional_fetch_budget():
+                result.append("")
+                result.append("⏱️ 시간 예산 부족으로 통계 데이터 조회를 생략했습니다. (테이블ID로 추후 조회 가능)")
+            elif fetch_data:
                 data_summary = self._fetch_and_format_data(
                     api, metadata['org_id'], metadata['table_id'], metadata['table_name']
                 )
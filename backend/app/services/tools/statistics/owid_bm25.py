@@ -0,0 +1,116 @@
+"""
+Sparse BM25 scorer for OWID hybrid search
+BM25Okapi와 같은 점수를 내는 SciPy CSR 기반 구현
+
+문서별 BM25 가중치를 term x document CSR 행렬로 미리 계산해 두고,
+질의 점수는 희소 행렬-벡터 곱, 상위 k개는 argpartition으로 구한다.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 상위 k개 인덱스 (내림차순) - 전체 정렬 대신 argpartition 사용"""
+    n = scores.shape[0]
+    if n == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= n:
+        return np.argsort(scores, kind="stable")[::-1]
+    candidates = np.argpartition(scores, n - k)[n - k:]
+    # 동점은 인덱스가 큰 쪽이 먼저 (np.argsort(scores)[-k:][::-1]와 같은 순서)
+    return candidates[np.lexsort((candidates, scores[candidates]))[::-1]]
+
+
+class SparseBM25:
+    """BM25Okapi 호환 스코어러 (get_scores 시그니처 동일)
+
+    idf 계산과 음수 idf를 epsilon * 평균 idf로 대체하는 방식은 rank_bm25.BM25Okapi와 같다.
+    """
+
+    def __init__(self, corpus: Sequence[Sequence[str]], k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25):
+        if not HAS_SCIPY:
+            raise ImportError("scipy is required for SparseBM25")
+
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(corpus)
+        self.vocab: Dict[str, int] = {}
+
+        rows, cols, tfs = [], [], []
+        doc_len = np.zeros(self.corpus_size, dtype=np.float64)
+        for doc_id, document in enumerate(corpus):
+            doc_len[doc_id] = len(document)
+            counts: Dict[int, int] = {}
+            for token in document:
+                term_id = self.vocab.setdefault(token, len(self.vocab))
+                counts[term_id] = counts.get(term_id, 0) + 1
+            rows.extend(counts.keys())
+            cols.extend([doc_id] * len(counts))
+            tfs.extend(counts.values())
+
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        tf = np.asarray(tfs, dtype=np.float64)
+
+        self.avgdl = float(doc_len.sum() / self.corpus_size) if self.corpus_size else 0.0
+        self.idf = self._compute_idf(np.bincount(rows, minlength=len(self.vocab)))
+
+        # 가중치 = idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+        norm = k1 * (1 - b + b * doc_len[cols] / self.avgdl) if self.avgdl else np.full_like(tf, k1)
+        weights = self.idf[rows] * tf * (k1 + 1) / (tf + norm)
+
+        self.matrix = sparse.csr_matrix(
+            (weights, (rows, cols)), shape=(len(self.vocab), self.corpus_size)
+        )
+
+    def _compute_idf(self, doc_freq: np.ndarray) -> np.ndarray:
+        """BM25Okapi._calc_idf와 같은 규칙"""
+        idf = np.log(self.corpus_size - doc_freq + 0.5) - np.log(doc_freq + 0.5)
+        average_idf = float(idf.mean()) if idf.size else 0.0
+        idf[idf < 0] = self.epsilon * average_idf
+        return idf
+
+    def _query_matrix(self, queries: Sequence[Sequence[str]]):
+        """질의별 어휘 출현 횟수 행렬 (B x V, 어휘에 없는 토큰은 무시)"""
+        rows, cols = [], []
+        for query_id, query in enumerate(queries):
+            for token in query:
+                term_id = self.vocab.get(token)
+                if term_id is not None:
+                    rows.append(query_id)
+                    cols.append(term_id)
+        data = np.ones(len(rows), dtype=np.float64)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(queries), len(self.vocab)))
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """문서별 BM25 점수 (BM25Okapi.get_scores와 동일)"""
+        return self.get_scores_batch([query])[0]
+
+    def get_scores_batch(self, queries: Sequence[Sequence[str]]) -> np.ndarray:
+        """여러 질의를 한 번의 희소 행렬 곱으로 채점 (B x N)"""
+        if not queries:
+            return np.zeros((0, self.corpus_size))
+        return (self._query_matrix(queries) @ self.matrix).toarray()
+
+    def top_k(self, query: Sequence[str], k: int, min_score: Optional[float] = 0.0) -> List[tuple]:
+        """(문서 인덱스, 점수) 상위 k개 - min_score 이하 점수는 제외"""
+        return self.top_k_batch([query], k, min_score)[0]
+
+    def top_k_batch(self, queries: Sequence[Sequence[str]], k: int, min_score: Optional[float] = 0.0) -> List[List[tuple]]:
+        results = []
+        for scores in self.get_scores_batch(queries):
+            indices = top_k_indices(scores, k)
+            results.append([
+                (int(idx), float(scores[idx])) for idx in indices
+                if min_score is None or scores[idx] > min_score
+            ])
+        return results
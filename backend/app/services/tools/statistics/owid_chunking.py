@@ -0,0 +1,655 @@
+"""
+OWID chunk builders
+데이터셋 하나(CSV/README)를 검색용 청크로 변환하는 함수 모음
+
+인덱스 빌드 시 워커 프로세스에서 실행되므로 모듈 수준 함수로 두고
+ChromaDB/임베딩 모델 등 무거운 의존성을 import하지 않는다.
+
+CSV는 OWID_CSV_CHUNKSIZE 행 단위로 스트리밍하며 DatasetAggregator에 누적한다.
+파일 전체 행을 반영하되 메모리는 엔티티 수와 최신 연도 행 수 수준으로 유지된다.
+Arrow 변환본(owid_columnar)이 최신이면 CSV 대신 memory-map된 레코드 배치를 읽는다.
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .owid_columnar import iter_frames
+
+logger = logging.getLogger(__name__)
+
+# CSV 스트리밍 설정 (환경변수로 조정 가능)
+OWID_INGEST_CONFIG = {
+    "chunksize": int(os.getenv("OWID_CSV_CHUNKSIZE", "50000")),  # 한 번에 읽는 행 수
+    "reservoir_size": 100000,  # 중앙값 계산용 표본 크기 (값이 이보다 적으면 정확한 중앙값)
+    "tail_rows": 100,          # Year 열이 없을 때 최신 데이터로 보는 마지막 행 수
+}
+
+# backend/owid_datasets - 실행 위치(cwd)와 무관하게 모듈 위치 기준으로 해석
+OWID_DATA_DIR = Path(__file__).resolve().parents[4] / "owid_datasets"
+
+COUNTRY_COLUMNS = ('Entity', 'Country', 'Location')
+KOREA_NAMES = ['South Korea', 'Korea, Republic of', 'Republic of Korea', 'Korea']
+MAX_COUNTRIES_PER_CHUNK = 100
+
+REGIONS = {
+    'Asia': ['China', 'India', 'Japan', 'South Korea', 'Indonesia', 'Thailand', 'Vietnam',
+            'Philippines', 'Malaysia', 'Singapore', 'Bangladesh', 'Pakistan'],
+    'Europe': ['Germany', 'France', 'United Kingdom', 'Italy', 'Spain', 'Netherlands',
+              'Belgium', 'Sweden', 'Poland', 'Austria', 'Switzerland', 'Norway'],
+    'Americas': ['United States', 'Canada', 'Brazil', 'Mexico', 'Argentina', 'Colombia',
+                'Chile', 'Peru', 'Venezuela', 'Ecuador'],
+    'Africa': ['Nigeria', 'Egypt', 'South Africa', 'Kenya', 'Ethiopia', 'Ghana',
+              'Morocco', 'Algeria', 'Tunisia', 'Uganda'],
+    'Oceania': ['Australia', 'New Zealand', 'Papua New Guinea', 'Fiji']
+}
+REGION_OF = {country: region for region, countries in REGIONS.items() for country in countries}
+
+
+def dataset_csv_path(folder: Path) -> Optional[Path]:
+    """데이터셋 폴더의 대표 CSV
+
+    한 폴더에 CSV가 여러 개일 수 있으므로(population-growth) glob 순서에 기대지 않고
+    download_summary.json의 chart_slug(없으면 files.csv)와 같은 이름의 파일, 그다음 이름순 첫 파일을 쓴다.
+    """
+    folder = Path(folder)
+    csv_files = sorted(folder.glob("*.csv"))
+    if len(csv_files) <= 1:
+        return csv_files[0] if csv_files else None
+    try:
+        summary = json.loads((folder / "download_summary.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        summary = {}
+    for name in (f"{summary.get('chart_slug')}.csv", Path(str((summary.get("files") or {}).get("csv"))).name):
+        if (folder / name) in csv_files:
+            return folder / name
+    return csv_files[0]
+
+
+@dataclass
+class SearchResult:
+    """검색 결과 데이터 클래스"""
+    content: str
+    metadata: Dict[str, Any]
+    score: float
+    source: str
+    dataset_id: str
+    chunk_type: str
+    chunk_id: str = ""  # 인덱스 청크 ID (검색 결과에서만 채워짐)
+
+
+class RunningStats:
+    """스트리밍 요약 통계 - count/mean/std(ddof=1)/min/max/마지막 값, 중앙값은 저수지 표본 기반"""
+
+    def __init__(self, reservoir_size: Optional[int] = None, seed: int = 0):
+        self.count = 0
+        self.total = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.last = np.nan
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._capacity = reservoir_size or OWID_INGEST_CONFIG["reservoir_size"]
+        self._sample = np.empty(0, dtype=np.float64)
+        # 고정 시드 - 같은 파일이면 항상 같은 청크 내용
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values) -> None:
+        """값 배치 누적 (NaN 제외, 파일 순서 유지)"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        n = values.size
+        if not n:
+            return
+
+        # Chan et al. 병렬 분산 병합
+        batch_mean = values.mean()
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        seen = self.count
+        total = seen + n
+        delta = batch_mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += batch_m2 + delta * delta * seen * n / total
+        self.count = total
+        self.total += float(values.sum())
+
+        batch_min, batch_max = values.min(), values.max()
+        self.min = batch_min if seen == 0 else min(self.min, batch_min)
+        self.max = batch_max if seen == 0 else max(self.max, batch_max)
+        self.last = values[-1]
+        self._sample_update(values, seen)
+
+    def _sample_update(self, values: np.ndarray, seen: int) -> None:
+        """Algorithm R 저수지 표본 (벡터화)"""
+        room = self._capacity - self._sample.size
+        if room > 0:
+            head = values[:room]
+            self._sample = np.concatenate([self._sample, head])
+            values = values[room:]
+            seen += head.size
+        if values.size:
+            positions = seen + np.arange(values.size)
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self._capacity
+            self._sample[slots[keep]] = values[keep]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else np.nan
+
+    @property
+    def median(self) -> float:
+        return float(np.median(self._sample)) if self._sample.size else np.nan
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self._m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+
+class DatasetAggregator:
+    """CSV 청크를 순서대로 받아 청크 생성에 필요한 집계만 유지"""
+
+    def __init__(self):
+        self.columns: Optional[List[str]] = None
+        self.total_rows = 0
+
+    def _setup(self, frame: pd.DataFrame) -> None:
+        """첫 청크 기준으로 열 구성 결정"""
+        self.columns = list(frame.columns)
+        self.country_col = next((col for col in COUNTRY_COLUMNS if col in frame.columns), None)
+        self.has_year = 'Year' in frame.columns
+
+        numeric_cols = list(frame.select_dtypes(include=[np.number]).columns)
+        self.trend_indicator = next((col for col in numeric_cols if col != 'Year'), None)
+        self.indicators = [col for col in numeric_cols if col not in ['Year', 'Code']]
+        self.main_indicator = self.indicators[0] if self.indicators else None
+        self._numeric_cols = numeric_cols
+
+        self.year_min = None
+        self.year_max = None
+        self.yearly_sum = pd.Series(dtype=np.float64)
+        self.yearly_count = pd.Series(dtype=np.float64)
+        self.summary = {indicator: RunningStats() for indicator in self.indicators[:3]}
+
+        # 엔티티 (첫 등장 순서), 엔티티별 마지막 행, 최신 연도(또는 마지막 N행) 행
+        self.entities: Dict[Any, None] = {}
+        self.entity_latest: Optional[pd.DataFrame] = None
+        self.latest_rows: Optional[pd.DataFrame] = None
+        self.latest_year = None
+
+        self.korea_rows = 0
+        self.korea_stats = {indicator: RunningStats() for indicator in self.indicators[:3]}
+
+        self.regions = {
+            region: {"rows": 0, "stats": RunningStats(), "countries": set(), "year": None, "latest": None}
+            for region in REGIONS
+        }
+
+    @staticmethod
+    def _merge_latest(current: Optional[pd.DataFrame], current_year, rows: pd.DataFrame, year):
+        """최대 연도 행 유지 (더 큰 연도가 오면 교체, 같으면 이어붙임)"""
+        if current is None or year > current_year:
+            return rows, year
+        if year == current_year:
+            return pd.concat([current, rows]), year
+        return current, current_year
+
+    def update(self, frame: pd.DataFrame) -> None:
+        if self.columns is None:
+            self._setup(frame)
+        if frame.empty:
+            return
+
+        # 첫 청크에서 숫자였던 열은 이후 청크에서도 숫자로 강제
+        # (변환본의 float32 열은 합계/평균이 CSV와 같도록 float64로 되돌림)
+        for col in self._numeric_cols:
+            if col not in frame.columns:
+                continue
+            if not pd.api.types.is_numeric_dtype(frame[col]):
+                frame[col] = pd.to_numeric(frame[col], errors='coerce')
+            elif frame[col].dtype == np.float32:
+                frame[col] = frame[col].astype(np.float64)
+
+        self.total_rows += len(frame)
+        main = self.main_indicator
+        country = self.country_col
+
+        if self.has_year:
+            years = frame['Year']
+            frame_min, frame_max = years.min(), years.max()
+            if pd.notna(frame_max):
+                self.year_min = frame_min if self.year_min is None else min(self.year_min, frame_min)
+                self.year_max = frame_max if self.year_max is None else max(self.year_max, frame_max)
+            if self.trend_indicator:
+                yearly = frame.groupby('Year')[self.trend_indicator].agg(['sum', 'count'])
+                self.yearly_sum = self.yearly_sum.add(yearly['sum'], fill_value=0)
+                self.yearly_count = self.yearly_count.add(yearly['count'], fill_value=0)
+
+        for indicator, stats in self.summary.items():
+            stats.update(frame[indicator].to_numpy())
+
+        latest_cols = ([country] if country else []) + ([main] if main else [])
+        if self.has_year:
+            if pd.notna(frame_max):
+                rows = frame.loc[frame['Year'] == frame_max, latest_cols]
+                self.latest_rows, self.latest_year = self._merge_latest(
+                    self.latest_rows, self.latest_year, rows, frame_max
+                )
+        else:
+            tail = frame[latest_cols].tail(OWID_INGEST_CONFIG["tail_rows"])
+            merged = tail if self.latest_rows is None else pd.concat([self.latest_rows, tail])
+            self.latest_rows = merged.tail(OWID_INGEST_CONFIG["tail_rows"])
+
+        if not country:
+            return
+
+        # 기존 키의 순서는 유지되므로 첫 등장 순서가 보존됨
+        self.entities.update(dict.fromkeys(frame[country].dropna().unique()))
+
+        entity_cols = [country] + (['Year'] if self.has_year else []) + ([main] if main else [])
+        last = frame.drop_duplicates(country, keep='last')[entity_cols]
+        if self.entity_latest is not None:
+            last = pd.concat([self.entity_latest, last]).drop_duplicates(country, keep='last')
+        self.entity_latest = last
+
+        korea = frame[frame[country].isin(KOREA_NAMES)]
+        self.korea_rows += len(korea)
+        for indicator, stats in self.korea_stats.items():
+            stats.update(korea[indicator].to_numpy())
+
+        if not main:
+            return
+        region_of_row = frame[country].map(REGION_OF)
+        in_region = region_of_row.notna()
+        if not in_region.any():
+            return
+        region_cols = [country, main] + (['Year'] if self.has_year else [])
+        for region, group in frame.loc[in_region, region_cols].groupby(region_of_row[in_region], sort=False, observed=True):
+            state = self.regions[region]
+            state["rows"] += len(group)
+            state["stats"].update(group[main].to_numpy())
+            state["countries"].update(group[country].dropna().unique())
+            if self.has_year:
+                group_max = group['Year'].max()
+                if pd.notna(group_max):
+                    rows = group.loc[group['Year'] == group_max, [country, main]]
+                    state["latest"], state["year"] = self._merge_latest(state["latest"], state["year"], rows, group_max)
+            else:
+                # Year가 없으면 지역 전체 행 중 상위 3개 (동점은 먼저 나온 행 우선)
+                merged = group[[country, main]] if state["latest"] is None else pd.concat([state["latest"], group[[country, main]]])
+                state["latest"] = merged.nlargest(3, main)
+
+    @property
+    def yearly_avg(self) -> pd.Series:
+        """연도별 평균 (groupby('Year').mean()과 동일)"""
+        return (self.yearly_sum / self.yearly_count).sort_index()
+
+
+def aggregate_csv(csv_path, chunksize: Optional[int] = None) -> DatasetAggregator:
+    """CSV(또는 Arrow 변환본) 전체를 청크 단위로 읽어 집계"""
+    aggregator = DatasetAggregator()
+    for frame in iter_frames(csv_path, chunksize or OWID_INGEST_CONFIG["chunksize"]):
+        aggregator.update(frame)
+    return aggregator
+
+
+def create_smart_chunks(dataset: Dict) -> List[SearchResult]:
+    """통계 데이터에 최적화된 스마트 청킹 - 모든 국가/모든 행 포함"""
+    chunks = []
+    dataset_id = dataset['id']
+
+    # 1. Overview chunk (README 기반)
+    if dataset['readme_path'] and dataset['readme_path'].exists():
+        try:
+            readme = dataset['readme_path'].read_text(encoding='utf-8')
+
+            korean_keywords = get_korean_keywords(dataset_id)
+
+            overview = f"""
+Dataset: {dataset_id}
+Description: {readme[:500]}
+Korean Keywords: {korean_keywords}
+Related Terms: {get_related_terms(dataset_id)}
+"""
+            chunks.append(SearchResult(
+                content=overview,
+                metadata={"lang": "multi"},
+                score=0.0,
+                source="index",
+                dataset_id=dataset_id,
+                chunk_type="overview"
+            ))
+        except:
+            pass
+
+    # 2. Statistical chunks (CSV 전체 스트리밍 집계 기반)
+    try:
+        agg = aggregate_csv(dataset['csv_path'])
+        if agg.columns is None:
+            return chunks
+
+        # 시계열 트렌드 청크
+        if agg.has_year:
+            trend_chunk = create_trend_chunk(agg, dataset_id)
+            if trend_chunk:
+                chunks.append(trend_chunk)
+
+        country_chunks = create_country_chunks(agg, dataset_id)
+        chunks.extend(country_chunks)
+
+        latest_chunk = create_latest_data_chunk(agg, dataset_id)
+        if latest_chunk:
+            chunks.append(latest_chunk)
+
+        stats_chunk = create_statistics_summary_chunk(agg, dataset_id)
+        if stats_chunk:
+            chunks.append(stats_chunk)
+
+    except Exception as e:
+        logger.warning(f"Error processing {dataset_id}: {e}")
+
+    return chunks
+
+
+def create_trend_chunk(agg: DatasetAggregator, dataset_id: str) -> Optional[SearchResult]:
+    """시계열 트렌드 분석 청크"""
+    if not agg.has_year:
+        return None
+
+    main_indicator = agg.trend_indicator
+
+    if not main_indicator:
+        return None
+
+    yearly_avg = agg.yearly_avg
+    if yearly_avg.empty:
+        return None
+
+    content = f"""
+Dataset: {dataset_id}
+Indicator: {main_indicator}
+Time Range: {agg.year_min}-{agg.year_max}
+Trend Analysis:
+- Starting Value ({agg.year_min}): {yearly_avg.iloc[0]:.2f}
+- Ending Value ({agg.year_max}): {yearly_avg.iloc[-1]:.2f}
+- Change: {((yearly_avg.iloc[-1] / yearly_avg.iloc[0] - 1) * 100):.1f}%
+- Average Annual Growth: {((yearly_avg.pct_change().mean()) * 100):.2f}%
+Keywords: trend, time series, growth rate, 추세, 시계열, 성장률
+"""
+
+    return SearchResult(
+        content=content,
+        metadata={"year_range": f"{agg.year_min}-{agg.year_max}"},
+        score=0.0,
+        source="index",
+        dataset_id=dataset_id,
+        chunk_type="trend"
+    )
+
+
+def create_country_chunks(agg: DatasetAggregator, dataset_id: str) -> List[SearchResult]:
+    """모든 국가 데이터를 포함하는 청크 생성"""
+    chunks = []
+
+    country_col = agg.country_col
+    if not country_col:
+        return chunks
+
+    if not agg.indicators:
+        return chunks
+
+    main_indicator = agg.main_indicator
+
+    countries_data = {}
+    unique_countries = list(agg.entities)
+
+    if len(unique_countries) > MAX_COUNTRIES_PER_CHUNK:
+        if agg.has_year:
+            latest_df = agg.latest_rows
+            top_countries = latest_df.nlargest(MAX_COUNTRIES_PER_CHUNK, main_indicator)[country_col].tolist()
+        else:
+            top_countries = unique_countries[:MAX_COUNTRIES_PER_CHUNK]
+
+        logger.info(f"{dataset_id}: {len(unique_countries)} countries found, using top {MAX_COUNTRIES_PER_CHUNK}")
+    else:
+        top_countries = unique_countries
+
+    # 국가별 최신 행을 한 번에 선택 (entity_latest는 국가당 1행)
+    latest_by_country = agg.entity_latest.set_index(country_col)
+    selected = [country for country in top_countries if country in latest_by_country.index]
+    latest = latest_by_country.loc[selected]
+    values = [float(v) if pd.notna(v) else None for v in latest[main_indicator].to_numpy()]
+    if agg.has_year:
+        years = latest['Year'].astype(int).tolist()
+        for country, value, year in zip(selected, values, years):
+            countries_data[country] = {'value': value, 'year': year}
+    else:
+        for country, value in zip(selected, values):
+            countries_data[country] = {'value': value}
+
+    content = f"""
+Dataset: {dataset_id}
+Indicator: {main_indicator}
+Countries Coverage: {len(countries_data)} countries
+Country Data:
+"""
+    sorted_countries = sorted(countries_data.items(),
+                            key=lambda x: x[1].get('value', 0) if x[1].get('value') else 0,
+                            reverse=True)
+
+    for country, data in sorted_countries[:20]:
+        if data.get('value') is not None:
+            content += f"- {country}: {data['value']:.2f}"
+            if 'year' in data:
+                content += f" ({data['year']})"
+            content += "\n"
+
+    all_country_names = ', '.join(top_countries[:50])
+    content += f"\nAll Countries: {all_country_names[:500]}..."
+
+    chunks.append(SearchResult(
+        content=content,
+        metadata={
+            "countries_count": len(countries_data),
+            "has_all_countries": True
+        },
+        score=0.0,
+        source="index",
+        dataset_id=dataset_id,
+        chunk_type="countries"
+    ))
+
+    # 2. Regional Chunks (대륙별 청크)
+    for region_name, state in agg.regions.items():
+        if not state["rows"]:
+            continue
+        region_content = f"""
+Dataset: {dataset_id}
+Region: {region_name}
+Indicator: {main_indicator}
+Regional Statistics:
+"""
+        values = state["stats"]
+        if values.count > 0:
+            region_content += f"- Average: {values.mean:.2f}\n"
+            region_content += f"- Median: {values.median:.2f}\n"
+            region_content += f"- Countries with data: {len(state['countries'])}\n"
+
+            top3 = state["latest"].nlargest(3, main_indicator)
+            region_content += f"\nTop 3 in {region_name}:\n"
+            region_content += "".join(
+                f"- {name}: {value:.2f}\n" for name, value in zip(top3[country_col], top3[main_indicator])
+            )
+
+        chunks.append(SearchResult(
+            content=region_content,
+            metadata={"region": region_name},
+            score=0.0,
+            source="index",
+            dataset_id=dataset_id,
+            chunk_type="regional"
+        ))
+
+    korea_chunk = create_korea_focused_chunk(agg, dataset_id)
+    if korea_chunk:
+        chunks.append(korea_chunk)
+
+    return chunks
+
+
+def create_korea_focused_chunk(agg: DatasetAggregator, dataset_id: str) -> Optional[SearchResult]:
+    """한국 중심 데이터 청크"""
+    if not agg.country_col:
+        return None
+
+    if not agg.korea_rows:
+        return None
+
+    content = f"""
+Dataset: {dataset_id}
+Country: South Korea (대한민국)
+Data Points: {agg.korea_rows}
+"""
+
+    for indicator, values in agg.korea_stats.items():
+        if values.count > 0:
+            content += f"""
+{indicator}:
+- Latest: {values.last:.2f}
+- Average: {values.mean:.2f}
+- Min/Max: {values.min:.2f} / {values.max:.2f}
+"""
+
+    content += """
+Keywords: Korea, South Korea, 한국, 대한민국, Korean statistics
+"""
+
+    return SearchResult(
+        content=content,
+        metadata={"country": "South Korea"},
+        score=0.0,
+        source="index",
+        dataset_id=dataset_id,
+        chunk_type="korea"
+    )
+
+
+def create_latest_data_chunk(agg: DatasetAggregator, dataset_id: str) -> Optional[SearchResult]:
+    """최신 데이터 청크"""
+    latest_df = agg.latest_rows
+    latest_year = agg.year_max if agg.has_year else "Recent"
+
+    if latest_df is None or latest_df.empty:
+        return None
+
+    main_indicator = agg.main_indicator
+
+    if not main_indicator:
+        return None
+
+    summary = latest_df[main_indicator].agg(['mean', 'median', 'std'])
+    content = f"""
+Dataset: {dataset_id}
+Latest Data ({latest_year}):
+Indicator: {main_indicator}
+- Countries/Entities: {len(latest_df)}
+- Average: {summary['mean']:.2f}
+- Median: {summary['median']:.2f}
+- Std Dev: {summary['std']:.2f}
+"""
+
+    country_col = agg.country_col
+
+    if country_col:
+        top5 = latest_df.nlargest(5, main_indicator)
+        content += f"\nTop 5 by {main_indicator}:\n"
+        content += "".join(
+            f"- {name}: {value:.2f}\n" for name, value in zip(top5[country_col], top5[main_indicator])
+        )
+
+    content += "\nKeywords: latest, recent, current, 최신, 현재"
+
+    return SearchResult(
+        content=content,
+        metadata={"year": int(latest_year) if latest_year != "Recent" else 2024},
+        score=0.0,
+        source="index",
+        dataset_id=dataset_id,
+        chunk_type="latest"
+    )
+
+
+def create_statistics_summary_chunk(agg: DatasetAggregator, dataset_id: str) -> Optional[SearchResult]:
+    """전체 통계 요약 청크"""
+    if not agg.indicators:
+        return None
+
+    content = f"""
+Dataset: {dataset_id}
+Statistical Summary:
+Total Records: {agg.total_rows}
+"""
+
+    for indicator, stats in agg.summary.items():
+        content += f"""
+{indicator}:
+- Mean: {stats.mean:.2f}
+- Median: {stats.median:.2f}
+- Range: {stats.min:.2f} to {stats.max:.2f}
+- StdDev: {stats.std:.2f}
+"""
+
+    content += "\nKeywords: statistics, summary, average, 통계, 요약, 평균"
+
+    return SearchResult(
+        content=content,
+        metadata={"type": "summary"},
+        score=0.0,
+        source="index",
+        dataset_id=dataset_id,
+        chunk_type="statistics"
+    )
+
+
+def get_korean_keywords(dataset_id: str) -> str:
+    """데이터셋 ID에 대한 한국어 키워드"""
+    korean_mappings = {
+        'co2': 'CO2, 이산화탄소, 탄소배출',
+        'temperature': '온도, 기온, 지구온난화',
+        'renewable': '재생에너지, 신재생에너지',
+        'covid': '코로나, 코비드, 팬데믹',
+        'gdp': 'GDP, 국내총생산, 경제성장',
+        'poverty': '빈곤, 빈곤율, 극빈층',
+        'life-expectancy': '기대수명, 평균수명',
+        'mortality': '사망률, 사망',
+        'education': '교육, 학업',
+        'population': '인구, 인구증가'
+    }
+
+    for key, value in korean_mappings.items():
+        if key in dataset_id.lower():
+            return value
+
+    return ""
+
+
+def get_related_terms(dataset_id: str) -> str:
+    """관련 용어 생성"""
+    related_terms = {
+        'co2': 'carbon dioxide, emissions, greenhouse gas, climate change',
+        'renewable': 'solar, wind, clean energy, sustainable',
+        'gdp': 'economic growth, income, development',
+        'covid': 'pandemic, coronavirus, SARS-CoV-2'
+    }
+
+    for key, value in related_terms.items():
+        if key in dataset_id.lower():
+            return value
+
+    return ""
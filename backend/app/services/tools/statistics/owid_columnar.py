@@ -0,0 +1,213 @@
+"""
+Columnar store for OWID datasets
+owid_datasets/의 CSV를 Arrow IPC 파일로 변환해 캐시 디렉터리(OWID_COLUMNAR_DIR, 기본 .cache/owid_columnar)의
+<데이터셋 ID>/<csv 이름>.arrow에 두고 memory-map으로 읽는다. git이 추적하는 owid_datasets/에는 쓰지 않는다.
+
+    Entity/Country/Location/Code   dictionary(categorical) 열
+    정수 열(Year 등)                값 범위에 맞는 가장 작은 정수 타입
+    실수 열                         float32로 손실 없이 표현되면 float32, 아니면 float64
+
+Arrow IPC 파일은 압축하지 않으므로 pa.memory_map으로 열면 열 버퍼를 복사 없이 공유한다.
+원본 CSV의 SHA-256(증분 인덱스 manifest와 같은 file_digest)을 스키마 메타데이터에 기록해 두고,
+달라졌으면 변환본을 쓰지 않는다. 해시는 (경로, 크기, 수정 시각)별로 프로세스 안에서 한 번만 계산한다.
+pyarrow가 없거나 변환본이 없으면 모든 로더는 pandas.read_csv로 대체한다.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+OWID_COLUMNAR_CONFIG = {
+    "enabled": os.getenv("OWID_COLUMNAR", "1").strip().lower() not in ("0", "false", "no"),
+    "cache_dir": os.getenv("OWID_COLUMNAR_DIR", "./.cache/owid_columnar"),
+    "suffix": ".arrow",
+    "batch_rows": 65536,  # IPC 레코드 배치 크기
+}
+
+CATEGORICAL_COLUMNS = ('Entity', 'Country', 'Location', 'Code')
+COLUMNAR_FORMAT_VERSION = "2"
+_META_PREFIX = b"owid."
+
+PathLike = Union[str, Path]
+
+
+_digests: Dict[tuple, str] = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path: PathLike) -> str:
+    """파일 콘텐츠 SHA-256 (같은 크기/수정 시각이면 프로세스 안에서 재사용)"""
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _digests_lock:
+        cached = _digests.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    value = digest.hexdigest()
+    with _digests_lock:
+        _digests[key] = value
+    return value
+
+
+def columnar_path(csv_path: PathLike) -> Path:
+    """캐시 디렉터리의 변환본 경로 (<cache_dir>/<데이터셋 ID>/<csv 이름>.arrow)"""
+    csv_path = Path(csv_path)
+    return (Path(OWID_COLUMNAR_CONFIG["cache_dir"]) / csv_path.parent.name
+            / (csv_path.stem + OWID_COLUMNAR_CONFIG["suffix"]))
+
+
+def _source_signature(csv_path: Path) -> Dict[bytes, bytes]:
+    return {
+        _META_PREFIX + b"format": COLUMNAR_FORMAT_VERSION.encode(),
+        _META_PREFIX + b"source_sha256": file_digest(csv_path).encode(),
+    }
+
+
+def _narrow_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """국가/코드 열은 categorical, 숫자 열은 값을 바꾸지 않는 가장 작은 타입으로"""
+    narrowed = {}
+    for col in frame.columns:
+        series = frame[col]
+        if col in CATEGORICAL_COLUMNS and series.dtype == object:
+            narrowed[col] = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series):
+            narrowed[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            values = series.to_numpy()
+            as_float32 = values.astype(np.float32)
+            lossless = np.array_equal(as_float32.astype(np.float64), values, equal_nan=True)
+            narrowed[col] = series.astype(np.float32) if lossless else series
+        else:
+            narrowed[col] = series
+    return pd.DataFrame(narrowed)
+
+
+def convert_csv(csv_path: PathLike, force: bool = False) -> Optional[Path]:
+    """CSV 하나를 Arrow IPC 파일로 변환 (이미 최신이면 건너뜀) - 변환본 경로 반환"""
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow is required to build the OWID columnar store")
+
+    csv_path = Path(csv_path)
+    target = columnar_path(csv_path)
+    if not force and is_fresh(csv_path):
+        return target
+
+    frame = _narrow_frame(pd.read_csv(csv_path))
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update(_source_signature(csv_path))
+    table = table.replace_schema_metadata(metadata)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + ".tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=OWID_COLUMNAR_CONFIG["batch_rows"])
+    os.replace(tmp_path, target)
+    return target
+
+
+def convert_datasets(data_dir: PathLike, force: bool = False) -> Dict[str, int]:
+    """data_dir 아래 모든 데이터셋 CSV 변환 - {"converted", "fresh", "failed"} 개수"""
+    counts = {"converted": 0, "fresh": 0, "failed": 0}
+    if not HAS_PYARROW:
+        logger.warning("pyarrow not installed, skipping OWID columnar conversion")
+        return counts
+
+    for csv_path in sorted(Path(data_dir).glob("*/*.csv")):
+        if not force and is_fresh(csv_path):
+            counts["fresh"] += 1
+            continue
+        try:
+            convert_csv(csv_path, force=True)
+            counts["converted"] += 1
+        except Exception as e:
+            logger.warning(f"Columnar conversion failed ({csv_path.parent.name}): {e}")
+            counts["failed"] += 1
+
+    logger.info(f"OWID columnar store: {counts}")
+    return counts
+
+
+def _open_reader(path: Path):
+    return pa.ipc.open_file(pa.memory_map(str(path), "r"))
+
+
+def is_fresh(csv_path: PathLike) -> bool:
+    """변환본이 있고 원본 CSV와 콘텐츠 해시가 같은지"""
+    if not HAS_PYARROW:
+        return False
+    csv_path = Path(csv_path)
+    target = columnar_path(csv_path)
+    if not target.exists() or not csv_path.exists():
+        return False
+    try:
+        metadata = _open_reader(target).schema.metadata or {}
+    except Exception:
+        return False
+    expected = _source_signature(csv_path)
+    return all(metadata.get(key) == value for key, value in expected.items())
+
+
+def open_table(csv_path: PathLike, columns: Optional[List[str]] = None) -> Optional["pa.Table"]:
+    """memory-map된 Arrow 테이블 (변환본을 쓸 수 없으면 None)"""
+    if not (HAS_PYARROW and OWID_COLUMNAR_CONFIG["enabled"] and is_fresh(csv_path)):
+        return None
+    table = _open_reader(columnar_path(csv_path)).read_all()
+    if columns is not None:
+        table = table.select([col for col in columns if col in table.column_names])
+    return table
+
+
+def load_frame(csv_path: PathLike, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """데이터셋 전체를 DataFrame으로 (변환본 우선, 없으면 CSV)"""
+    table = open_table(csv_path, columns)
+    if table is not None:
+        return table.to_pandas(split_blocks=True)
+    if columns is None:
+        return pd.read_csv(csv_path)
+    return pd.read_csv(csv_path, usecols=lambda col: col in columns)
+
+
+def iter_frames(csv_path: PathLike, chunksize: int) -> Iterator[pd.DataFrame]:
+    """파일 순서대로 chunksize 행씩 DataFrame 생성 (변환본 우선, 없으면 CSV 스트리밍)"""
+    table = open_table(csv_path)
+    if table is None:
+        yield from pd.read_csv(csv_path, chunksize=chunksize)
+        return
+    if table.num_rows == 0:
+        yield table.to_pandas()
+        return
+    for batch in table.to_batches(max_chunksize=chunksize):
+        yield batch.to_pandas(split_blocks=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="OWID CSV -> Arrow 변환")
+    parser.add_argument("data_dir", nargs="?", default="owid_datasets")
+    parser.add_argument("--force", action="store_true", help="최신 변환본도 다시 생성")
+    args = parser.parse_args()
+    print(convert_datasets(args.data_dir, force=args.force))
@@ -5,17 +5,28 @@ Multilingual embeddings + Hybrid search + Reranking
 
 import os
 import json
-import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
-from dataclasses import dataclass
 import hashlib
+import pickle
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from collections import defaultdict
 import re
 
+from ....utils.cache_registry import LRUCache
+from .owid_bm25 import HAS_SCIPY, SparseBM25, top_k_indices
+from .owid_chunking import OWID_DATA_DIR, SearchResult, create_smart_chunks, dataset_csv_path
+from .owid_columnar import file_digest
+from .owid_models import get_backend, load_encoder, load_reranker
+from .owid_tokenizer import get_tokenizer_name, tokenize, tokenize_query
+from .owid_vector_store import FlatVectorCollection, get_vector_backend
+
 # Vector DB imports
 try:
     import chromadb
@@ -41,33 +52,49 @@ except ImportError:
     HAS_BM25 = False
     print("rank-bm25 not installed. Install with: pip install rank-bm25")
 
-# Text processing
-try:
-    from konlpy.tag import Okt
-    HAS_KONLPY = True
-    okt = Okt()
-except ImportError:
-    HAS_KONLPY = False
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# BM25 인덱스 영속화 (ChromaDB 파일 옆에 저장, 코퍼스 해시가 다르면 재구축)
+BM25_INDEX_FILE = "bm25_index.pkl"
+BM25_INDEX_VERSION = 2  # _preprocess_for_bm25 토크나이징이나 인덱스 형식이 바뀌면 올릴 것
+
+# 증분 인덱싱 - 데이터셋별 콘텐츠 해시와 청크 ID 목록을 ChromaDB 파일 옆에 기록
+INDEX_MANIFEST_FILE = "index_manifest.json"
+FLAT_INDEX_DIR = "flat_index"  # OWID_VECTOR_BACKEND=flat일 때 벡터 저장 위치 (db_path 아래)
+CHUNK_SCHEMA_VERSION = 2  # 청킹 로직이 바뀌면 올릴 것 (모든 데이터셋 재인덱싱)
+EMBEDDING_MODEL = 'intfloat/multilingual-e5-base'
+RERANKER_MODEL = 'cross-encoder/ms-marco-MiniLM-L-6-v2'
+
+# 질의 임베딩 LRU 캐시 크기 (정규화된 질의 텍스트 기준, 결과 캐시와 별도)
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("OWID_QUERY_EMBEDDING_CACHE_SIZE", "1024"))
 
-@dataclass
-class SearchResult:
-    """검색 결과 데이터 클래스"""
-    content: str
-    metadata: Dict[str, Any]
-    score: float
-    source: str
-    dataset_id: str
-    chunk_type: str
+# Cross-encoder 재순위화 설정 (환경변수로 조정 가능)
+OWID_RERANK_CONFIG = {
+    "max_candidates": 20,   # 재순위화 최대 후보 수
+    # 인접 후보 간 RRF 점수 차가 후보 전체 점수 폭의 이 비율 이상이면 그 지점에서 자름 (0 = 끔, 항상 max_candidates)
+    # 0.25면 두 검색기 모두에서 찾은 후보가 n_results개 이상일 때 한쪽에서만 찾은 후보는 재순위화하지 않음
+    "min_gap": float(os.getenv("OWID_RERANK_MIN_GAP", "0.25")),
+    "budget_ms": float(os.getenv("OWID_RERANK_BUDGET_MS", "0")),  # 기본 지연 예산 (0이면 제한 없음)
+    "batch_size": 8,        # 예산이 있을 때 predict 한 번에 넣는 쌍 수
+    "score_cache_size": int(os.getenv("OWID_RERANK_CACHE_SIZE", "20000")),  # (질의, 청크) 점수 캐시
+}
+
+# 인덱스 빌드 파이프라인 설정 (환경변수로 조정 가능)
+OWID_BUILD_CONFIG = {
+    "workers": int(os.getenv("OWID_BUILD_WORKERS", "0")) or (os.cpu_count() or 1),  # 청킹 프로세스 수
+    "embed_batch_chars": int(os.getenv("OWID_EMBED_BATCH_CHARS", "200000")),       # 인코딩 배치 글자 수 한도
+    "embed_batch_max": 512,        # 인코딩 배치 최대 청크 수
+    "encode_batch_size": 64,       # SentenceTransformer 내부 미니배치 크기
+    "upsert_batch_size": 1000,     # ChromaDB upsert 한 번에 보낼 청크 수
+}
 
 
 class EnhancedOWIDRAG:
     """향상된 OWID RAG 시스템"""
     
-    def __init__(self, data_dir: str = "./owid_datasets", db_path: str = "./owid_enhanced_vectordb"):
+    def __init__(self, data_dir: str = str(OWID_DATA_DIR),
+                 db_path: str = str(OWID_DATA_DIR.parent / "owid_enhanced_vectordb")):
         self.data_dir = Path(data_dir)
         self.db_path = Path(db_path)
         self.db_path.mkdir(exist_ok=True)
@@ -77,23 +104,30 @@ class EnhancedOWIDRAG:
         self.bm25_index = None
         self.bm25_documents = []
         self.bm25_metadata = []
+        self.bm25_ids = []
         
         self._initialize_chromadb()
         self.datasets = self._load_datasets()
         
-        self.cache = {}
         self.cache_size = 100
+        self.cache = LRUCache(max_items=self.cache_size, name="owid_search")
+        # n_results/use_reranker만 다른 재검색이나 공백만 다른 질의는 인코딩 생략
+        self.query_embeddings = LRUCache(max_items=QUERY_EMBEDDING_CACHE_SIZE, name="owid_query_embedding")
+        # "질의해시:청크ID" -> cross-encoder 점수 (인덱스 내용이 바뀌면 비움)
+        self.rerank_scores = LRUCache(max_items=OWID_RERANK_CONFIG["score_cache_size"], name="owid_rerank")
+        self._rerank_ms_per_pair: Optional[float] = None
     
     def _initialize_models(self):
         """모델 초기화"""
         if HAS_SENTENCE_TRANSFORMERS:
-            logger.info("Initializing enhanced models...")
+            logger.info(f"Initializing enhanced models (backend: {get_backend()})...")
             
-            self.encoder = SentenceTransformer('intfloat/multilingual-e5-base')
+            # OWID_MODEL_BACKEND=onnx면 int8 양자화 ONNX 모델 (parity 실패 시 PyTorch)
+            self.encoder = load_encoder(EMBEDDING_MODEL)
             logger.info("✅ Loaded multilingual-e5-base (768d embeddings)")
             
             # Cross-encoder for reranking
-            self.reranker = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-6-v2')
+            self.reranker = load_reranker(RERANKER_MODEL)
             logger.info("✅ Loaded cross-encoder reranker")
         else:
             logger.error("sentence-transformers not available")
@@ -101,7 +135,12 @@ class EnhancedOWIDRAG:
             self.reranker = None
     
     def _initialize_chromadb(self):
-        """ChromaDB 초기화"""
+        """ChromaDB 초기화 (OWID_VECTOR_BACKEND=flat이면 프로세스 내 flat 인덱스)"""
+        self.collection = None
+        if self.encoder and get_vector_backend() == "flat":
+            self.collection = FlatVectorCollection(self.db_path / FLAT_INDEX_DIR)
+            logger.info(f"✅ Using flat vector index with {self.collection.count()} chunks")
+            return
         if HAS_CHROMADB and self.encoder:
             self.chroma_client = chromadb.PersistentClient(
                 path=str(self.db_path),
@@ -141,15 +180,16 @@ class EnhancedOWIDRAG:
             if not folder.is_dir():
                 continue
             
-            csv_files = list(folder.glob("*.csv"))
-            if not csv_files:
+            csv_path = dataset_csv_path(folder)
+            if csv_path is None:
                 continue
             
+            metadata_path = csv_path.with_name(csv_path.stem + ".metadata.json")
             dataset_info = {
                 "id": folder.name,
-                "csv_path": csv_files[0],
+                "csv_path": csv_path,
                 "readme_path": next(folder.glob("*readme.md"), None),
-                "metadata_path": next(folder.glob("*.metadata.json"), None)
+                "metadata_path": metadata_path if metadata_path.exists() else next(folder.glob("*.metadata.json"), None)
             }
             datasets.append(dataset_info)
         
@@ -157,556 +197,535 @@ class EnhancedOWIDRAG:
         return datasets
     
     def build_enhanced_index(self, force_rebuild: bool = False):
-        """향상된 인덱스 구축"""
-        if not force_rebuild and self.collection.count() > 0:
-            logger.info(f"Index exists with {self.collection.count()} chunks")
-            self._build_bm25_index()
-            return
-        
-        logger.info("Building enhanced index...")
-        
-        all_chunks = []
-        all_metadata = []
-        all_texts_for_bm25 = []
+        """향상된 인덱스 구축 (증분)
+
+        데이터셋별 CSV/README/메타데이터 해시를 manifest와 비교해 새로 생겼거나 바뀐 데이터셋만
+        다시 청킹/임베딩하여 upsert하고, 더 이상 생성되지 않는 청크(삭제된 데이터셋, 이전 ID)는 지운다.
+        파일 크기/수정 시각이 manifest와 같으면 해시를 다시 계산하지 않는다.
+        force_rebuild=True면 manifest를 무시하고 모든 데이터셋을 다시 처리한다.
+        벡터 인덱스가 없으면(인코더/벡터 DB 없음) 모든 청크로 BM25만 구축한다.
+        """
+        manifest = self._load_manifest()
+        has_index = bool(self.collection) and self.collection.count() > 0
+        if force_rebuild or not has_index or not self._manifest_compatible(manifest):
+            previous = {}
+        else:
+            previous = manifest["datasets"]
         
+        datasets_state = {}
+        changed = []
+        restamped = False
         for dataset in self.datasets:
-            logger.info(f"Processing {dataset['id']}...")
-            
-            chunks = self._create_smart_chunks(dataset)
-            
-            for chunk in chunks:
-                all_chunks.append(chunk.content)
-                all_metadata.append({
-                    "dataset_id": chunk.dataset_id,
-                    "chunk_type": chunk.chunk_type,
-                    **chunk.metadata
-                })
-                
-                processed_text = self._preprocess_for_bm25(chunk.content)
-                all_texts_for_bm25.append(processed_text)
-        
-        if self.collection:
-            batch_size = 50
-            for i in range(0, len(all_chunks), batch_size):
-                batch_end = min(i + batch_size, len(all_chunks))
-                
-                embeddings = self.encoder.encode(
-                    ["passage: " + text for text in all_chunks[i:batch_end]],
-                    normalize_embeddings=True
-                )
-                
-                ids = []
-                for j, (text, metadata) in enumerate(zip(all_chunks[i:batch_end], all_metadata[i:batch_end])):
-                    unique_string = f"{i+j}_{metadata.get('dataset_id', '')}_{metadata.get('chunk_type', '')}_{text[:30]}"
-                    ids.append(hashlib.md5(unique_string.encode()).hexdigest())
-                
-                self.collection.add(
-                    embeddings=embeddings.tolist(),
-                    documents=all_chunks[i:batch_end],
-                    metadatas=all_metadata[i:batch_end],
-                    ids=ids
-                )
-                logger.info(f"Added {batch_end}/{len(all_chunks)} to vector index")
-        
-        self.bm25_documents = all_chunks
-        self.bm25_metadata = all_metadata
-        self._build_bm25_index()
+            files = self._dataset_files(dataset)
+            entry = previous.get(dataset['id'])
+            if entry and entry.get("files") == files:
+                datasets_state[dataset['id']] = entry
+                continue
+            content_hash = self._dataset_hash(dataset)
+            if entry and entry.get("hash") == content_hash:
+                # 내용은 같고 수정 시각만 바뀜 (복사/체크아웃 등) - 다음 빌드부터 해시 생략
+                datasets_state[dataset['id']] = {**entry, "files": files}
+                restamped = True
+            else:
+                changed.append((dataset, content_hash, files))
         
-        logger.info(f"✅ Enhanced index built: {len(all_chunks)} chunks")
-    
-    def _create_smart_chunks(self, dataset: Dict) -> List[SearchResult]:
-        """통계 데이터에 최적화된 스마트 청킹 - 모든 국가 포함"""
-        chunks = []
-        dataset_id = dataset['id']
+        removed = sorted(set(previous) - {d['id'] for d in self.datasets})
+        if not changed and not removed:
+            logger.info(f"Index is up to date with {self.collection.count()} chunks")
+            if restamped:
+                self._save_manifest(datasets_state)
+            self._build_bm25_index()
+            return
         
-        # 1. Overview chunk (README 기반)
-        if dataset['readme_path'] and dataset['readme_path'].exists():
-            try:
-                readme = dataset['readme_path'].read_text(encoding='utf-8')
-                
-                korean_keywords = self._get_korean_keywords(dataset_id)
+        logger.info(f"Building enhanced index: {len(changed)} changed, {len(removed)} removed datasets")
+        
+        hashes = {dataset['id']: (content_hash, files) for dataset, content_hash, files in changed}
+        pending = {"texts": [], "metadatas": [], "ids": [], "chars": 0}
+        updated = 0
+        
+        # 벡터 인덱스가 없으면 BM25 코퍼스를 청크에서 직접 구성 (컬렉션에서 읽어올 수 없음)
+        bm25_corpus = {"ids": [], "documents": [], "metadatas": []}
+        rebuilt_ids = set()
+        # flat 인덱스는 빌드 전체의 upsert/delete를 메모리에 모았다가 한 번만 저장 (manifest보다 먼저)
+        writes = self.collection.batch() if isinstance(self.collection, FlatVectorCollection) else nullcontext()
+        with writes:
+            for dataset_id, chunks in self._iter_dataset_chunks([dataset for dataset, _, _ in changed]):
+                dataset_ids = []
+                seen_ids = set()
+                for chunk in chunks:
+                    chunk_id = self._chunk_id(chunk.dataset_id, chunk.chunk_type, self._chunk_key(chunk))
+                    if chunk_id in seen_ids:
+                        # 같은 (dataset, type, key) 청크가 여럿이면 순번으로 구분
+                        chunk_id = self._chunk_id(chunk.dataset_id, chunk.chunk_type, f"{self._chunk_key(chunk)}#{len(dataset_ids)}")
+                    dataset_ids.append(chunk_id)
+                    seen_ids.add(chunk_id)
                 
-                overview = f"""
-Dataset: {dataset_id}
-Description: {readme[:500]}
-Korean Keywords: {korean_keywords}
-Related Terms: {self._get_related_terms(dataset_id)}
-"""
-                chunks.append(SearchResult(
-                    content=overview,
-                    metadata={"lang": "multi"},
-                    score=0.0,
-                    source="index",
-                    dataset_id=dataset_id,
-                    chunk_type="overview"
-                ))
-            except:
-                pass
-        
-        # 2. Statistical chunks (CSV 데이터 기반)
-        try:
-            df = pd.read_csv(dataset['csv_path'], nrows=5000)
+                    pending["texts"].append(chunk.content)
+                    pending["metadatas"].append({
+                        "dataset_id": chunk.dataset_id,
+                        "chunk_type": chunk.chunk_type,
+                        **chunk.metadata
+                    })
+                    pending["ids"].append(chunk_id)
+                    pending["chars"] += len(chunk.content)
+                    if not self.collection:
+                        bm25_corpus["ids"].append(chunk_id)
+                        bm25_corpus["documents"].append(chunk.content)
+                        bm25_corpus["metadatas"].append(pending["metadatas"][-1])
+                content_hash, files = hashes[dataset_id]
+                datasets_state[dataset_id] = {"hash": content_hash, "files": files, "ids": dataset_ids}
+                rebuilt_ids.update(dataset_ids)
             
-            # 시계열 트렌드 청크
-            if 'Year' in df.columns:
-                trend_chunk = self._create_trend_chunk(df, dataset_id)
-                if trend_chunk:
-                    chunks.append(trend_chunk)
-            
-            country_chunks = self._create_country_chunks(df, dataset_id)
-            chunks.extend(country_chunks)
-            
-            latest_chunk = self._create_latest_data_chunk(df, dataset_id)
-            if latest_chunk:
-                chunks.append(latest_chunk)
-            
-            stats_chunk = self._create_statistics_summary_chunk(df, dataset_id)
-            if stats_chunk:
-                chunks.append(stats_chunk)
-                
-        except Exception as e:
-            logger.warning(f"Error processing {dataset_id}: {e}")
+                # 청킹이 끝나는 대로 인코딩 (긴 청크가 많으면 배치가 작아짐)
+                if (pending["chars"] >= OWID_BUILD_CONFIG["embed_batch_chars"]
+                        or len(pending["ids"]) >= OWID_BUILD_CONFIG["embed_batch_max"]):
+                    updated += self._embed_and_upsert(pending)
+            updated += self._embed_and_upsert(pending)
         
-        return chunks
-    
-    def _create_trend_chunk(self, df: pd.DataFrame, dataset_id: str) -> Optional[SearchResult]:
-        """시계열 트렌드 분석 청크"""
-        if 'Year' not in df.columns:
-            return None
-        
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        main_indicator = [col for col in numeric_cols if col != 'Year'][0] if len(numeric_cols) > 1 else None
-        
-        if not main_indicator:
-            return None
-        
-        yearly_avg = df.groupby('Year')[main_indicator].mean()
-        
-        content = f"""
-Dataset: {dataset_id}
-Indicator: {main_indicator}
-Time Range: {df['Year'].min()}-{df['Year'].max()}
-Trend Analysis:
-- Starting Value ({df['Year'].min()}): {yearly_avg.iloc[0]:.2f}
-- Ending Value ({df['Year'].max()}): {yearly_avg.iloc[-1]:.2f}
-- Change: {((yearly_avg.iloc[-1] / yearly_avg.iloc[0] - 1) * 100):.1f}%
-- Average Annual Growth: {((yearly_avg.pct_change().mean()) * 100):.2f}%
-Keywords: trend, time series, growth rate, 추세, 시계열, 성장률
-"""
-        
-        return SearchResult(
-            content=content,
-            metadata={"year_range": f"{df['Year'].min()}-{df['Year'].max()}"},
-            score=0.0,
-            source="index",
-            dataset_id=dataset_id,
-            chunk_type="trend"
-        )
-    
-    def _create_country_chunks(self, df: pd.DataFrame, dataset_id: str) -> List[SearchResult]:
-        """모든 국가 데이터를 포함하는 청크 생성"""
-        chunks = []
-        
-        country_col = None
-        for col in ['Entity', 'Country', 'Location']:
-            if col in df.columns:
-                country_col = col
-                break
+            if self.collection:
+                self._delete_orphans(datasets_state)
         
-        if not country_col:
-            return chunks
-        
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        indicators = [col for col in numeric_cols if col not in ['Year', 'Code']]
-        if not indicators:
-            return chunks
-        
-        main_indicator = indicators[0]
-        
-        countries_data = {}
-        unique_countries = df[country_col].unique()
-        
-        MAX_COUNTRIES_PER_CHUNK = 100
-        if len(unique_countries) > MAX_COUNTRIES_PER_CHUNK:
-            if 'Year' in df.columns:
-                latest_year = df['Year'].max()
-                latest_df = df[df['Year'] == latest_year]
-                top_countries = latest_df.nlargest(MAX_COUNTRIES_PER_CHUNK, main_indicator)[country_col].tolist()
-            else:
-                top_countries = unique_countries[:MAX_COUNTRIES_PER_CHUNK]
-            
-            logger.info(f"{dataset_id}: {len(unique_countries)} countries found, using top {MAX_COUNTRIES_PER_CHUNK}")
-        else:
-            top_countries = unique_countries.tolist()
-        
-        for country in top_countries:
-            country_data = df[df[country_col] == country]
-            if not country_data.empty:
-                if 'Year' in df.columns:
-                    latest = country_data.iloc[-1]
-                    countries_data[country] = {
-                        'value': float(latest[main_indicator]) if pd.notna(latest[main_indicator]) else None,
-                        'year': int(latest['Year'])
-                    }
-                else:
-                    latest = country_data.iloc[-1]
-                    countries_data[country] = {
-                        'value': float(latest[main_indicator]) if pd.notna(latest[main_indicator]) else None
-                    }
-        
-        content = f"""
-Dataset: {dataset_id}
-Indicator: {main_indicator}
-Countries Coverage: {len(countries_data)} countries
-Country Data:
-"""
-        sorted_countries = sorted(countries_data.items(), 
-                                key=lambda x: x[1].get('value', 0) if x[1].get('value') else 0, 
-                                reverse=True)
-        
-        for country, data in sorted_countries[:20]:
-            if data.get('value') is not None:
-                content += f"- {country}: {data['value']:.2f}"
-                if 'year' in data:
-                    content += f" ({data['year']})"
-                content += "\n"
-        
-        all_country_names = ', '.join(top_countries[:50])
-        content += f"\nAll Countries: {all_country_names[:500]}..."
-        
-        chunks.append(SearchResult(
-            content=content,
-            metadata={
-                "countries_count": len(countries_data),
-                "has_all_countries": True
-            },
-            score=0.0,
-            source="index",
-            dataset_id=dataset_id,
-            chunk_type="countries"
-        ))
-        
-        # 2. Regional Chunks (대륙별 청크)
-        regions = {
-            'Asia': ['China', 'India', 'Japan', 'South Korea', 'Indonesia', 'Thailand', 'Vietnam', 
-                    'Philippines', 'Malaysia', 'Singapore', 'Bangladesh', 'Pakistan'],
-            'Europe': ['Germany', 'France', 'United Kingdom', 'Italy', 'Spain', 'Netherlands', 
-                      'Belgium', 'Sweden', 'Poland', 'Austria', 'Switzerland', 'Norway'],
-            'Americas': ['United States', 'Canada', 'Brazil', 'Mexico', 'Argentina', 'Colombia', 
-                        'Chile', 'Peru', 'Venezuela', 'Ecuador'],
-            'Africa': ['Nigeria', 'Egypt', 'South Africa', 'Kenya', 'Ethiopia', 'Ghana', 
-                      'Morocco', 'Algeria', 'Tunisia', 'Uganda'],
-            'Oceania': ['Australia', 'New Zealand', 'Papua New Guinea', 'Fiji']
-        }
-        
-        for region_name, region_countries in regions.items():
-            region_df = df[df[country_col].isin(region_countries)]
-            if not region_df.empty:
-                region_content = f"""
-Dataset: {dataset_id}
-Region: {region_name}
-Indicator: {main_indicator}
-Regional Statistics:
-"""
-                if main_indicator in region_df.columns:
-                    values = region_df[main_indicator].dropna()
-                    if len(values) > 0:
-                        region_content += f"- Average: {values.mean():.2f}\n"
-                        region_content += f"- Median: {values.median():.2f}\n"
-                        region_content += f"- Countries with data: {region_df[country_col].nunique()}\n"
-                        
-                        if 'Year' in region_df.columns:
-                            latest_year = region_df['Year'].max()
-                            latest_regional = region_df[region_df['Year'] == latest_year]
-                        else:
-                            latest_regional = region_df
-                        
-                        top3 = latest_regional.nlargest(3, main_indicator)
-                        region_content += f"\nTop 3 in {region_name}:\n"
-                        for _, row in top3.iterrows():
-                            region_content += f"- {row[country_col]}: {row[main_indicator]:.2f}\n"
-                
-                chunks.append(SearchResult(
-                    content=region_content,
-                    metadata={"region": region_name},
-                    score=0.0,
-                    source="index",
-                    dataset_id=dataset_id,
-                    chunk_type="regional"
-                ))
-        
-        korea_chunk = self._create_korea_focused_chunk(df, dataset_id)
-        if korea_chunk:
-            chunks.append(korea_chunk)
-        
-        return chunks
-    
-    def _create_korea_focused_chunk(self, df: pd.DataFrame, dataset_id: str) -> Optional[SearchResult]:
-        """한국 중심 데이터 청크"""
-        country_col = None
-        for col in ['Entity', 'Country', 'Location']:
-            if col in df.columns:
-                country_col = col
-                break
-        
-        if not country_col:
-            return None
-        
-        korea_names = ['South Korea', 'Korea, Republic of', 'Republic of Korea', 'Korea']
-        korea_df = df[df[country_col].isin(korea_names)]
-        
-        if korea_df.empty:
-            return None
-        
-        numeric_cols = korea_df.select_dtypes(include=[np.number]).columns
-        indicators = [col for col in numeric_cols if col not in ['Year', 'Code']]
+        if self.collection:
+            self._save_manifest(datasets_state)
+        
+        # 청크 ID는 내용과 무관하므로 바뀐 청크의 점수/결과 캐시를 비움
+        self.rerank_scores.purge()
+        self.cache.purge()
+        
+        # 전체 코퍼스 기준으로 BM25 재구축 (코퍼스 해시가 바뀌었으므로 저장본은 무시됨)
+        # 바뀌지 않은 청크는 저장본의 토큰을 재사용하고 다시 청킹한 청크만 토큰화
+        self.bm25_ids = bm25_corpus["ids"]
+        self.bm25_documents = bm25_corpus["documents"]
+        self.bm25_metadata = bm25_corpus["metadatas"]
+        self._build_bm25_index(retokenize=rebuilt_ids)
+        
+        logger.info(f"✅ Enhanced index built: {updated} chunks updated")
+    
+    def _iter_dataset_chunks(self, datasets: List[Dict]):
+        """(dataset_id, chunks)를 완료 순서대로 생성 - 데이터셋별 CSV 읽기/청킹은 프로세스 풀에서 실행"""
+        workers = min(OWID_BUILD_CONFIG["workers"], len(datasets))
+        if workers <= 1:
+            for dataset in datasets:
+                logger.info(f"Processing {dataset['id']}...")
+                yield dataset['id'], create_smart_chunks(dataset)
+            return
         
-        content = f"""
-Dataset: {dataset_id}
-Country: South Korea (대한민국)
-Data Points: {len(korea_df)}
-"""
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"Process pool unavailable ({e}), chunking serially")
+            for dataset in datasets:
+                yield dataset['id'], create_smart_chunks(dataset)
+            return
         
-        for indicator in indicators[:3]:
-            if indicator in korea_df.columns:
-                values = korea_df[indicator].dropna()
-                if len(values) > 0:
-                    content += f"""
-{indicator}:
-- Latest: {values.iloc[-1]:.2f}
-- Average: {values.mean():.2f}
-- Min/Max: {values.min():.2f} / {values.max():.2f}
-"""
+        logger.info(f"Chunking {len(datasets)} datasets with {workers} processes...")
+        with executor:
+            futures = {executor.submit(create_smart_chunks, dataset): dataset for dataset in datasets}
+            for future in as_completed(futures):
+                dataset = futures[future]
+                try:
+                    chunks = future.result()
+                except Exception as e:
+                    logger.warning(f"Worker failed for {dataset['id']}, retrying in-process: {e}")
+                    chunks = create_smart_chunks(dataset)
+                logger.info(f"Chunked {dataset['id']} ({len(chunks)} chunks)")
+                yield dataset['id'], chunks
+    
+    def _embed_and_upsert(self, pending: Dict[str, Any]) -> int:
+        """대기 중인 청크를 한 번에 인코딩하고 나눠서 upsert (pending은 비움)"""
+        count = len(pending["ids"])
+        if not count:
+            return 0
+        texts, metadatas, ids = pending["texts"], pending["metadatas"], pending["ids"]
+        pending.update(texts=[], metadatas=[], ids=[], chars=0)
         
-        content += """
-Keywords: Korea, South Korea, 한국, 대한민국, Korean statistics
-"""
+        if not self.collection:
+            return count
         
-        return SearchResult(
-            content=content,
-            metadata={"country": "South Korea"},
-            score=0.0,
-            source="index",
-            dataset_id=dataset_id,
-            chunk_type="korea"
+        embeddings = self.encoder.encode(
+            ["passage: " + text for text in texts],
+            batch_size=OWID_BUILD_CONFIG["encode_batch_size"],
+            normalize_embeddings=True
+        ).tolist()
+        
+        step = OWID_BUILD_CONFIG["upsert_batch_size"]
+        for i in range(0, count, step):
+            self.collection.upsert(
+                embeddings=embeddings[i:i + step],
+                documents=texts[i:i + step],
+                metadatas=metadatas[i:i + step],
+                ids=ids[i:i + step]
+            )
+        logger.info(f"Upserted {count} chunks to vector index")
+        return count
+    
+    @staticmethod
+    def _chunk_key(chunk: SearchResult) -> str:
+        """같은 데이터셋/타입 안에서 청크를 구분하는 키 (지역/국가 등, 없으면 빈 문자열)"""
+        return str(chunk.metadata.get("region") or chunk.metadata.get("country") or "")
+    
+    @staticmethod
+    def _chunk_id(dataset_id: str, chunk_type: str, key: str) -> str:
+        """빌드 순서와 무관한 안정적인 청크 ID"""
+        return hashlib.md5(f"{dataset_id}:{chunk_type}:{key}".encode()).hexdigest()
+    
+    @staticmethod
+    def _dataset_files(dataset: Dict) -> Dict[str, Optional[List]]:
+        """데이터셋 파일별 [파일명, 크기, 수정 시각(ns)] - manifest에 저장해 해시 재계산 여부 판단"""
+        files = {}
+        for key in ("csv_path", "readme_path", "metadata_path"):
+            path = dataset.get(key)
+            try:
+                stat = Path(path).stat() if path else None
+            except OSError:
+                stat = None
+            files[key] = [Path(path).name, stat.st_size, stat.st_mtime_ns] if stat else None
+        return files
+    
+    @staticmethod
+    def _dataset_hash(dataset: Dict) -> str:
+        """데이터셋 파일(CSV/README/메타데이터) 콘텐츠 해시 (파일 해시는 Arrow 변환본 검사와 공유)"""
+        digest = hashlib.sha256(f"{dataset['id']}:{CHUNK_SCHEMA_VERSION}".encode())
+        for key in ("csv_path", "readme_path", "metadata_path"):
+            path = dataset.get(key)
+            digest.update(f"|{key}|".encode())
+            if not path or not Path(path).exists():
+                continue
+            digest.update(file_digest(path).encode())
+        return digest.hexdigest()
+    
+    def _manifest_compatible(self, manifest: Optional[Dict]) -> bool:
+        """manifest가 현재 청킹 스키마/임베딩 모델로 만들어졌는지"""
+        return bool(
+            manifest
+            and manifest.get("schema_version") == CHUNK_SCHEMA_VERSION
+            and manifest.get("embedding_model") == EMBEDDING_MODEL
+            and manifest.get("vector_backend", "chroma") == get_vector_backend()
         )
     
-    def _create_latest_data_chunk(self, df: pd.DataFrame, dataset_id: str) -> Optional[SearchResult]:
-        """최신 데이터 청크"""
-        if 'Year' in df.columns:
-            latest_year = df['Year'].max()
-            latest_df = df[df['Year'] == latest_year]
-        else:
-            latest_df = df.tail(100)
-            latest_year = "Recent"
-        
-        if latest_df.empty:
+    def _load_manifest(self) -> Optional[Dict]:
+        path = self.db_path / INDEX_MANIFEST_FILE
+        if not path.exists():
             return None
-        
-        numeric_cols = latest_df.select_dtypes(include=[np.number]).columns
-        main_indicator = [col for col in numeric_cols if col not in ['Year', 'Code']][0] if len(numeric_cols) > 0 else None
-        
-        if not main_indicator:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read index manifest, rebuilding: {e}")
             return None
-        
-        content = f"""
-Dataset: {dataset_id}
-Latest Data ({latest_year}):
-Indicator: {main_indicator}
-- Countries/Entities: {len(latest_df)}
-- Average: {latest_df[main_indicator].mean():.2f}
-- Median: {latest_df[main_indicator].median():.2f}
-- Std Dev: {latest_df[main_indicator].std():.2f}
-"""
-        
-        country_col = None
-        for col in ['Entity', 'Country', 'Location']:
-            if col in df.columns:
-                country_col = col
-                break
-        
-        if country_col:
-            top5 = latest_df.nlargest(5, main_indicator)
-            content += f"\nTop 5 by {main_indicator}:\n"
-            for _, row in top5.iterrows():
-                content += f"- {row[country_col]}: {row[main_indicator]:.2f}\n"
-        
-        content += "\nKeywords: latest, recent, current, 최신, 현재"
-        
-        return SearchResult(
-            content=content,
-            metadata={"year": int(latest_year) if latest_year != "Recent" else 2024},
-            score=0.0,
-            source="index",
-            dataset_id=dataset_id,
-            chunk_type="latest"
-        )
     
-    def _create_statistics_summary_chunk(self, df: pd.DataFrame, dataset_id: str) -> Optional[SearchResult]:
-        """전체 통계 요약 청크"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        indicators = [col for col in numeric_cols if col not in ['Year', 'Code']]
-        
-        if not indicators:
-            return None
-        
-        content = f"""
-Dataset: {dataset_id}
-Statistical Summary:
-Total Records: {len(df)}
-"""
-        
-        for indicator in indicators[:3]:
-            stats = df[indicator].describe()
-            content += f"""
-{indicator}:
-- Mean: {stats['mean']:.2f}
-- Median: {stats['50%']:.2f}
-- Range: {stats['min']:.2f} to {stats['max']:.2f}
-- StdDev: {stats['std']:.2f}
-"""
-        
-        content += "\nKeywords: statistics, summary, average, 통계, 요약, 평균"
-        
-        return SearchResult(
-            content=content,
-            metadata={"type": "summary"},
-            score=0.0,
-            source="index",
-            dataset_id=dataset_id,
-            chunk_type="statistics"
-        )
+    def _save_manifest(self, datasets_state: Dict[str, Dict]):
+        """manifest 저장 (임시 파일 후 교체)"""
+        path = self.db_path / INDEX_MANIFEST_FILE
+        manifest = {
+            "schema_version": CHUNK_SCHEMA_VERSION,
+            "embedding_model": EMBEDDING_MODEL,
+            "vector_backend": get_vector_backend(),
+            "updated_at": datetime.now().isoformat(),
+            "datasets": datasets_state,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, path)
+    
+    def _delete_orphans(self, datasets_state: Dict[str, Dict]):
+        """manifest에 없는 청크 삭제 (삭제된 데이터셋, 바뀐 데이터셋의 사라진 청크, 이전 위치 기반 ID)"""
+        expected = {chunk_id for entry in datasets_state.values() for chunk_id in entry["ids"]}
+        existing = self.collection.get(include=[])['ids']
+        orphans = [chunk_id for chunk_id in existing if chunk_id not in expected]
+        for i in range(0, len(orphans), 500):
+            self.collection.delete(ids=orphans[i:i + 500])
+        if orphans:
+            logger.info(f"Deleted {len(orphans)} orphaned chunks")
     
     def _preprocess_for_bm25(self, text: str) -> str:
-        """BM25를 위한 텍스트 전처리"""
-        # 소문자 변환
-        text = text.lower()
-        
-        # 숫자 정규화 (소수점 제거)
-        text = re.sub(r'\d+\.\d+', lambda m: str(int(float(m.group()))), text)
-        
-        # 한국어 토크나이징 (가능한 경우)
-        if HAS_KONLPY and self._contains_korean(text):
-            tokens = okt.morphs(text)
-            text = ' '.join(tokens)
-        
-        return text
+        """BM25를 위한 텍스트 전처리 (소문자/숫자 정규화 + OWID_BM25_TOKENIZER 토크나이징)"""
+        return ' '.join(tokenize(text))
     
     def _contains_korean(self, text: str) -> bool:
         """한국어 포함 여부 확인"""
         return bool(re.search(r'[가-힣]', text))
     
-    def _build_bm25_index(self):
-        """BM25 인덱스 구축"""
-        if not HAS_BM25:
+    def _build_bm25_index(self, retokenize: Optional[set] = None):
+        """BM25 인덱스 구축 (저장된 인덱스가 현재 코퍼스와 같으면 그대로 로드)
+
+        scipy가 있으면 희소 행렬 기반 SparseBM25, 없으면 rank_bm25.BM25Okapi를 사용한다.
+        retokenize가 주어지면 그 밖의 청크는 저장본의 토큰(같은 토크나이저/버전일 때)을 재사용한다.
+        """
+        if not (HAS_SCIPY or HAS_BM25):
             logger.warning("BM25 not available")
             return
         
+        if self.bm25_ids:
+            corpus_hash = self._corpus_hash(self.bm25_ids)
+        elif self.collection:
+            corpus_hash = self._corpus_hash(self.collection.get(include=[])['ids'])
+        else:
+            corpus_hash = None
+        
+        if corpus_hash and self._load_bm25_index(corpus_hash):
+            return
+        
         if not self.bm25_documents:
+            if not self.collection:
+                return
             results = self.collection.get()
+            self.bm25_ids = results['ids']
             self.bm25_documents = results['documents']
             self.bm25_metadata = results['metadatas']
+            corpus_hash = self._corpus_hash(self.bm25_ids)
         
+        stored_tokens = self._load_bm25_tokens() if retokenize is not None else {}
+        retokenize = retokenize or set()
         tokenized_docs = []
-        for doc in self.bm25_documents:
-            processed = self._preprocess_for_bm25(doc)
-            tokens = processed.split()
+        reused = 0
+        for chunk_id, doc in zip(self.bm25_ids, self.bm25_documents):
+            tokens = None if chunk_id in retokenize else stored_tokens.get(chunk_id)
+            if tokens is None:
+                tokens = self._preprocess_for_bm25(doc).split()
+            else:
+                reused += 1
             tokenized_docs.append(tokens)
+        if reused:
+            logger.info(f"Reused stored BM25 tokens for {reused}/{len(tokenized_docs)} chunks")
         
-        self.bm25_index = BM25Okapi(tokenized_docs)
+        self.bm25_index = SparseBM25(tokenized_docs) if HAS_SCIPY else BM25Okapi(tokenized_docs)
         logger.info(f"✅ BM25 index built with {len(tokenized_docs)} documents")
+        if corpus_hash:
+            self._save_bm25_index(corpus_hash, tokenized_docs)
     
-    def search(self, query: str, n_results: int = 5, use_reranker: bool = True) -> List[Dict]:
-        """향상된 하이브리드 검색"""
-        cache_key = f"{query}_{n_results}_{use_reranker}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        vector_results = self._vector_search(query, k=20)
-        bm25_results = self._bm25_search(query, k=20)
-        
-        combined_results = self._reciprocal_rank_fusion(
-            vector_results, 
-            bm25_results,
-            k=60
-        )
-        
-        if use_reranker and self.reranker and len(combined_results) > 0:
-            reranked_results = self._rerank_results(query, combined_results[:20])
-            final_results = reranked_results[:n_results]
-        else:
-            final_results = combined_results[:n_results]
-        
-        formatted_results = []
-        for result in final_results:
-            formatted_results.append({
-                'content': result.content,
-                'metadata': result.metadata,
-                'score': result.score,
-                'dataset_id': result.dataset_id,
-                'chunk_type': result.chunk_type,
-                'source': result.source
-            })
-        
-        self.cache[cache_key] = formatted_results
-        if len(self.cache) > self.cache_size:
-            self.cache.pop(next(iter(self.cache)))
+    def _corpus_hash(self, ids: List[str]) -> str:
+        """청크 ID 집합 + 데이터셋 콘텐츠 해시 + 토크나이저 기준 코퍼스 해시 (순서 무관)
+
+        청크 ID는 내용과 무관하게 안정적이므로 manifest의 데이터셋 해시를 함께 반영한다.
+        """
+        digest = hashlib.sha256(f"v{BM25_INDEX_VERSION}:{get_tokenizer_name()}:{len(ids)}".encode())
+        for chunk_id in sorted(ids):
+            digest.update(chunk_id.encode())
+        manifest = self._load_manifest() or {}
+        for dataset_id, entry in sorted(manifest.get("datasets", {}).items()):
+            digest.update(f"|{dataset_id}={entry.get('hash')}".encode())
+        return digest.hexdigest()
+    
+    def _save_bm25_index(self, corpus_hash: str, tokenized_docs: List[List[str]]):
+        """토큰화된 코퍼스와 BM25 통계를 db_path에 저장 (임시 파일 후 교체)"""
+        path = self.db_path / BM25_INDEX_FILE
+        payload = {
+            "version": BM25_INDEX_VERSION,
+            "corpus_hash": corpus_hash,
+            "ids": self.bm25_ids,
+            "documents": self.bm25_documents,
+            "metadata": self.bm25_metadata,
+            "tokenizer": get_tokenizer_name(),
+            "tokenized": tokenized_docs,
+            "index": self.bm25_index,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            logger.info(f"💾 BM25 index saved to {path}")
+        except Exception as e:
+            logger.warning(f"Failed to save BM25 index: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def _load_bm25_tokens(self) -> Dict[str, List[str]]:
+        """저장된 BM25 인덱스의 청크별 토큰 (버전/토크나이저가 다르거나 없으면 빈 dict)"""
+        path = self.db_path / BM25_INDEX_FILE
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load stored BM25 tokens: {e}")
+            return {}
+        if payload.get("version") != BM25_INDEX_VERSION or payload.get("tokenizer") != get_tokenizer_name():
+            return {}
+        return dict(zip(payload["ids"], payload["tokenized"]))
+    
+    def _load_bm25_index(self, corpus_hash: str) -> bool:
+        """저장된 BM25 인덱스 로드 (버전/토크나이저/코퍼스 해시가 다르면 False)"""
+        path = self.db_path / BM25_INDEX_FILE
+        if not path.exists():
+            return False
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load BM25 index, rebuilding: {e}")
+            return False
+        
+        if (payload.get("version") != BM25_INDEX_VERSION
+                or payload.get("tokenizer") != get_tokenizer_name()
+                or payload.get("corpus_hash") != corpus_hash):
+            logger.info("Stored BM25 index is stale, rebuilding")
+            return False
+        
+        self.bm25_ids = payload["ids"]
+        self.bm25_documents = payload["documents"]
+        self.bm25_metadata = payload["metadata"]
+        self.bm25_index = payload["index"]
+        logger.info(f"✅ BM25 index loaded with {len(self.bm25_documents)} documents")
+        return True
+    
+    def search(self, query: str, n_results: int = 5, use_reranker: bool = True,
+               rerank_budget_ms: Optional[float] = None) -> List[Dict]:
+        """향상된 하이브리드 검색
+
+        rerank_budget_ms: 재순위화 지연 예산 (None이면 OWID_RERANK_BUDGET_MS, 0이면 제한 없음)
+        """
+        return self.search_many([query], n_results, use_reranker, rerank_budget_ms)[0]
+    
+    def search_many(self, queries: List[str], n_results: int = 5, use_reranker: bool = True,
+                    rerank_budget_ms: Optional[float] = None) -> List[List[Dict]]:
+        """여러 질의 하이브리드 검색 - 질의마다 search()를 호출한 것과 같은 결과 (입력 순서)
+        
+        캐시에 없는 질의만 모아 임베딩 인코딩, BM25 채점, cross-encoder predict를 각각 한 번에 수행한다.
+        결과 캐시와 검색은 정규화된 질의(_normalize_query) 기준이라 공백/NFC만 다른 질의는 같은 결과를 공유한다.
+        rerank_budget_ms는 전체 배치의 재순위화 시간에 적용된다.
+        """
+        normalized = [self._normalize_query(query) for query in queries]
+        outputs: Dict[str, List[Dict]] = {}
+        pending = []
+        for query in dict.fromkeys(normalized):
+            cached = self.cache.get(self._result_cache_key(query, n_results, use_reranker))
+            if cached is not None:
+                outputs[query] = cached
+            else:
+                pending.append(query)
+        
+        if pending:
+            vector_lists = self._vector_search_many(pending, k=20)
+            bm25_lists = self._bm25_search_many(pending, k=20)
+            combined = [
+                self._reciprocal_rank_fusion(vector_results, bm25_results, k=60)
+                for vector_results, bm25_results in zip(vector_lists, bm25_lists)
+            ]
+            
+            final = [(results[:n_results], True) for results in combined]
+            to_rerank = [i for i, results in enumerate(combined) if results]
+            if use_reranker and self.reranker and to_rerank:
+                reranked = self._rerank_batch(
+                    [(pending[i], combined[i][:OWID_RERANK_CONFIG["max_candidates"]]) for i in to_rerank],
+                    n_results, rerank_budget_ms
+                )
+                for i, (results, complete) in zip(to_rerank, reranked):
+                    final[i] = (results[:n_results], complete)
+            
+            for query, (final_results, complete) in zip(pending, final):
+                formatted_results = []
+                for result in final_results:
+                    formatted_results.append({
+                        'content': result.content,
+                        'metadata': result.metadata,
+                        'score': result.score,
+                        'dataset_id': result.dataset_id,
+                        'chunk_type': result.chunk_type,
+                        'source': result.source
+                    })
+                
+                # 예산 때문에 일부만 재순위화한 결과는 캐시하지 않음
+                if complete:
+                    self.cache.set(self._result_cache_key(query, n_results, use_reranker), formatted_results)
+                outputs[query] = formatted_results
         
-        return formatted_results
+        return [outputs[query] for query in normalized]
+    
+    def _result_cache_key(self, query: str, n_results: int, use_reranker: bool) -> str:
+        """검색 결과 캐시 키 (search/search_many 공통, 정규화된 질의 기준)"""
+        return f"{self._normalize_query(query)}_{n_results}_{use_reranker}"
     
     def _vector_search(self, query: str, k: int = 20) -> List[SearchResult]:
         """벡터 검색"""
-        if not self.collection:
-            return []
+        return self._vector_search_many([query], k)[0]
+    
+    def _vector_search_many(self, queries: List[str], k: int = 20) -> List[List[SearchResult]]:
+        """벡터 검색 (질의 임베딩 배치 인코딩 + 컬렉션 질의 한 번)"""
+        if not self.collection or not queries:
+            return [[] for _ in queries]
         
-        query_embedding = self.encoder.encode(
-            ["query: " + query],
-            normalize_embeddings=True
-        )
+        query_embeddings = self._encode_queries(queries)
         
         results = self.collection.query(
-            query_embeddings=query_embedding.tolist(),
+            query_embeddings=query_embeddings.tolist(),
             n_results=k
         )
         
-        search_results = []
-        for i in range(len(results['documents'][0])):
-            search_results.append(SearchResult(
-                content=results['documents'][0][i],
-                metadata=results['metadatas'][0][i],
-                score=1.0 / (1.0 + results['distances'][0][i]),
-                source='vector',
-                dataset_id=results['metadatas'][0][i].get('dataset_id', ''),
-                chunk_type=results['metadatas'][0][i].get('chunk_type', '')
-            ))
-        
-        return search_results
+        all_results = []
+        for q in range(len(queries)):
+            search_results = []
+            for i in range(len(results['documents'][q])):
+                search_results.append(SearchResult(
+                    content=results['documents'][q][i],
+                    metadata=results['metadatas'][q][i],
+                    score=1.0 / (1.0 + results['distances'][q][i]),
+                    source='vector',
+                    dataset_id=results['metadatas'][q][i].get('dataset_id', ''),
+                    chunk_type=results['metadatas'][q][i].get('chunk_type', ''),
+                    chunk_id=results['ids'][q][i]
+                ))
+            all_results.append(search_results)
+        
+        return all_results
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """임베딩 캐시 키 겸 인코딩 입력 (NFC + 공백 정리, 대소문자는 유지)"""
+        return " ".join(unicodedata.normalize("NFC", query).split())
+    
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """질의 임베딩 (N x D) - 캐시에 없는 질의만 한 번에 인코딩"""
+        keys = [self._normalize_query(query) for query in queries]
+        embeddings = {key: self.query_embeddings.get(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, embedding in embeddings.items() if embedding is None]
+        if missing:
+            encoded = self.encoder.encode(
+                ["query: " + key for key in missing],
+                normalize_embeddings=True
+            )
+            for key, embedding in zip(missing, encoded):
+                embedding = np.array(embedding)
+                embedding.setflags(write=False)
+                self.query_embeddings.set(key, embedding)
+                embeddings[key] = embedding
+        return np.vstack([embeddings[key] for key in keys])
     
     def _bm25_search(self, query: str, k: int = 20) -> List[SearchResult]:
         """BM25 키워드 검색"""
+        return self._bm25_search_many([query], k)[0]
+    
+    def _bm25_search_many(self, queries: List[str], k: int = 20) -> List[List[SearchResult]]:
+        """BM25 키워드 검색 (SparseBM25면 질의 x 문서 점수 행렬을 한 번에 계산)"""
         if not self.bm25_index:
-            return []
-        
-        processed_query = self._preprocess_for_bm25(query)
-        query_tokens = processed_query.split()
-        
-        scores = self.bm25_index.get_scores(query_tokens)
+            return [[] for _ in queries]
         
-        top_indices = np.argsort(scores)[-k:][::-1]
+        query_tokens = [tokenize_query(query) for query in queries]
         
-        search_results = []
-        for idx in top_indices:
-            if scores[idx] > 0:
-                search_results.append(SearchResult(
-                    content=self.bm25_documents[idx],
-                    metadata=self.bm25_metadata[idx],
-                    score=scores[idx],
-                    source='bm25',
-                    dataset_id=self.bm25_metadata[idx].get('dataset_id', ''),
-                    chunk_type=self.bm25_metadata[idx].get('chunk_type', '')
-                ))
+        if isinstance(self.bm25_index, SparseBM25):
+            score_rows = self.bm25_index.get_scores_batch(query_tokens)
+        else:
+            score_rows = [self.bm25_index.get_scores(tokens) for tokens in query_tokens]
         
-        return search_results
+        all_results = []
+        for scores in score_rows:
+            top_indices = top_k_indices(scores, k)
+            
+            search_results = []
+            for idx in top_indices:
+                if scores[idx] > 0:
+                    search_results.append(SearchResult(
+                        content=self.bm25_documents[idx],
+                        metadata=self.bm25_metadata[idx],
+                        score=scores[idx],
+                        source='bm25',
+                        dataset_id=self.bm25_metadata[idx].get('dataset_id', ''),
+                        chunk_type=self.bm25_metadata[idx].get('chunk_type', ''),
+                        chunk_id=self.bm25_ids[idx] if idx < len(self.bm25_ids) else ''
+                    ))
+            all_results.append(search_results)
+        
+        return all_results
     
     def _reciprocal_rank_fusion(self, vector_results: List[SearchResult], 
                                 bm25_results: List[SearchResult], 
@@ -739,59 +758,103 @@ Total Records: {len(df)}
         
         return combined_results
     
-    def _rerank_results(self, query: str, results: List[SearchResult]) -> List[SearchResult]:
-        """Cross-encoder로 재순위화"""
-        if not self.reranker or not results:
-            return results
-        
-        # Query-document 쌍 생성
-        pairs = [[query, result.content] for result in results]
-        
-        # Cross-encoder 점수 계산
-        scores = self.reranker.predict(pairs)
-        
-        for i, score in enumerate(scores):
-            results[i].score = float(score)
-        
-        sorted_results = sorted(results, key=lambda x: x.score, reverse=True)
-        
-        return sorted_results
-    
-    def _get_korean_keywords(self, dataset_id: str) -> str:
-        """데이터셋 ID에 대한 한국어 키워드"""
-        korean_mappings = {
-            'co2': 'CO2, 이산화탄소, 탄소배출',
-            'temperature': '온도, 기온, 지구온난화',
-            'renewable': '재생에너지, 신재생에너지',
-            'covid': '코로나, 코비드, 팬데믹',
-            'gdp': 'GDP, 국내총생산, 경제성장',
-            'poverty': '빈곤, 빈곤율, 극빈층',
-            'life-expectancy': '기대수명, 평균수명',
-            'mortality': '사망률, 사망',
-            'education': '교육, 학업',
-            'population': '인구, 인구증가'
-        }
-        
-        for key, value in korean_mappings.items():
-            if key in dataset_id.lower():
-                return value
-        
-        return ""
-    
-    def _get_related_terms(self, dataset_id: str) -> str:
-        """관련 용어 생성"""
-        related_terms = {
-            'co2': 'carbon dioxide, emissions, greenhouse gas, climate change',
-            'renewable': 'solar, wind, clean energy, sustainable',
-            'gdp': 'economic growth, income, development',
-            'covid': 'pandemic, coronavirus, SARS-CoV-2'
-        }
-        
-        for key, value in related_terms.items():
-            if key in dataset_id.lower():
-                return value
-        
-        return ""
+    @staticmethod
+    def _rerank_depth(results: List[SearchResult], n_results: int) -> int:
+        """재순위화할 후보 수 - n_results 이후 RRF 점수가 크게 떨어지는 첫 지점까지
+
+        RRF 점수는 순위의 역수 합이라 상위 후보 간 비율이 2배를 넘지 않으므로,
+        점수 차를 후보 전체 점수 폭(최고 - 최저)으로 정규화해 min_gap과 비교한다.
+        """
+        min_gap = OWID_RERANK_CONFIG["min_gap"]
+        depth = len(results)
+        start = max(n_results, 1)
+        if min_gap <= 0 or depth <= start:
+            return depth
+        span = results[0].score - results[-1].score
+        if span <= 0:
+            return depth
+        for i in range(start, depth):
+            if (results[i - 1].score - results[i].score) / span >= min_gap:
+                return i
+        return depth
+    
+    def _rerank_results(self, query: str, results: List[SearchResult], n_results: int = 5,
+                        budget_ms: Optional[float] = None) -> Tuple[List[SearchResult], bool]:
+        """Cross-encoder로 재순위화 - (결과, 모든 후보를 채점했는지)"""
+        return self._rerank_batch([(query, results)], n_results, budget_ms)[0]
+    
+    def _rerank_batch(self, items: List[Tuple[str, List[SearchResult]]], n_results: int = 5,
+                      budget_ms: Optional[float] = None) -> List[Tuple[List[SearchResult], bool]]:
+        """여러 (질의, 후보) 재순위화 - 질의별 (결과, 모든 후보를 채점했는지)
+        
+        (질의, 청크) 점수는 캐시하고 캐시에 없는 쌍만 모든 질의를 합쳐 predict한다.
+        예산을 넘기면 남은 후보는 채점된 후보 뒤에 RRF 순서로 두고, RRF 점수가 cross-encoder 점수와
+        섞여 정렬되지 않도록 최저 채점 점수보다 1씩 낮은 점수를 준다 (채점된 후보가 없으면 RRF 점수 유지).
+        """
+        if not self.reranker:
+            return [(results, True) for _, results in items]
+        
+        budget_ms = OWID_RERANK_CONFIG["budget_ms"] if budget_ms is None else budget_ms
+        
+        plans = []
+        pending: List[Tuple[int, int]] = []
+        for item_idx, (query, results) in enumerate(items):
+            depth = self._rerank_depth(results, n_results)
+            candidates = results[:depth]
+            query_hash = hashlib.md5(self._normalize_query(query).encode()).hexdigest()
+            keys = [
+                f"{query_hash}:{result.chunk_id or hashlib.md5(result.content.encode()).hexdigest()}"
+                for result in candidates
+            ]
+            scores: Dict[int, float] = {}
+            for i, key in enumerate(keys):
+                cached = self.rerank_scores.get(key)
+                if cached is not None:
+                    scores[i] = cached
+                else:
+                    pending.append((item_idx, i))
+            plans.append((query, candidates, results[depth:], keys, scores))
+        
+        # 캐시에 없는 쌍 채점 (예산이 없으면 한 번에, 있으면 배치마다 남은 시간 확인)
+        step = OWID_RERANK_CONFIG["batch_size"] if budget_ms > 0 else max(len(pending), 1)
+        start = time.perf_counter()
+        for offset in range(0, len(pending), step):
+            batch = pending[offset:offset + step]
+            if budget_ms > 0 and self._rerank_ms_per_pair is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if elapsed_ms + self._rerank_ms_per_pair * len(batch) > budget_ms:
+                    break
+            
+            batch_start = time.perf_counter()
+            batch_scores = self.reranker.predict(
+                [[plans[item_idx][0], plans[item_idx][1][i].content] for item_idx, i in batch]
+            )
+            per_pair = (time.perf_counter() - batch_start) * 1000 / len(batch)
+            self._rerank_ms_per_pair = per_pair if self._rerank_ms_per_pair is None \
+                else 0.8 * self._rerank_ms_per_pair + 0.2 * per_pair
+            
+            for (item_idx, i), score in zip(batch, batch_scores):
+                _, _, _, keys, scores = plans[item_idx]
+                scores[i] = float(score)
+                self.rerank_scores.set(keys[i], scores[i])
+        
+        outputs = []
+        for _, candidates, rest, _, scores in plans:
+            scored = [candidates[i] for i in range(len(candidates)) if i in scores]
+            unscored = [candidates[i] for i in range(len(candidates)) if i not in scores]
+            for i, result in enumerate(candidates):
+                if i in scores:
+                    result.score = scores[i]
+            
+            sorted_results = sorted(scored, key=lambda x: x.score, reverse=True)
+            tail = unscored + rest
+            if sorted_results:
+                floor = sorted_results[-1].score
+                for rank, result in enumerate(tail, 1):
+                    result.score = floor - rank
+            outputs.append((sorted_results + tail, not unscored))
+        
+        return outputs
 
 
 def test_enhanced_rag():
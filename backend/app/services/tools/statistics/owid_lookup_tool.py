@@ -0,0 +1,139 @@
+"""
+OWID Lookup Tool - 국가/연도/지표 정확 수치 조회
+OWID_Statistics_Search(RAG)와 달리 임베딩/리랭킹 없이 메모리 인덱스에서 값을 바로 찾는다.
+"""
+
+from typing import Any, Dict, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+import logging
+
+from .owid_chunking import OWID_DATA_DIR
+from .owid_numeric_index import OWIDNumericIndex, get_numeric_index
+
+logger = logging.getLogger(__name__)
+
+
+class OWIDLookupToolInput(BaseModel):
+    """OWID Lookup Tool 입력 스키마"""
+    query: str = Field(
+        description="국가 + 지표 (+ 연도) 질의. 예: '한국 1인당 CO2 배출량 2020', 'Japan life expectancy 2000 2020'"
+    )
+    entity: Optional[str] = Field(
+        default=None,
+        description="국가/지역명 (한국어 가능, 생략하면 query에서 추출)"
+    )
+    year: Optional[int] = Field(default=None, description="조회 연도 (생략하면 최신값)")
+    start_year: Optional[int] = Field(default=None, description="기간 조회 시작 연도")
+    end_year: Optional[int] = Field(default=None, description="기간 조회 종료 연도")
+
+
+def _format_number(value: Optional[float]) -> str:
+    if value is None:
+        return "N/A"
+    if abs(value) >= 1000:
+        return f"{value:,.0f}"
+    return f"{value:.4g}"
+
+
+class OWIDLookupTool(BaseTool):
+    """
+    OWID Exact Lookup Tool
+
+    - 38개 OWID 데이터셋의 국가 x 연도 x 지표 값을 정확히 조회
+    - 연도 하나: 해당 연도 값 (없으면 가장 가까운 연도 표시)
+    - 연도 둘: 기간 시작/끝 값, 변화량, 변화율, 연평균 증가율(CAGR), 최소/최대
+    - 한국어 국가명/지표명 지원 (한국, 미국, 기대수명, 재생에너지 등)
+    """
+
+    name: str = "OWID_Exact_Lookup"
+    description: str = """
+    Look up exact values from Our World in Data by country, indicator and year.
+    Use this instead of OWID_Statistics_Search when the claim names a specific country/indicator/year.
+    Supports Korean and English.
+
+    Example queries:
+    - "2020년 한국 1인당 CO2 배출량"
+    - "Japan life expectancy 2000 2020"  (range + growth rate)
+    - "세계 재생에너지 비율"  (latest value)
+    """
+
+    args_schema: Type[BaseModel] = OWIDLookupToolInput
+    index: Optional[OWIDNumericIndex] = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.index = None
+
+    def _get_index(self) -> OWIDNumericIndex:
+        """최초 호출 시 인덱스 구축 (프로세스 내 공유)"""
+        if self.index is None:
+            self.index = get_numeric_index(str(OWID_DATA_DIR))
+        return self.index
+
+    def _run(self, query: str, entity: Optional[str] = None, year: Optional[int] = None,
+             start_year: Optional[int] = None, end_year: Optional[int] = None) -> str:
+        try:
+            result = self._get_index().query(
+                query, entity=entity, year=year, start_year=start_year, end_year=end_year
+            )
+        except Exception as e:
+            logger.error(f"OWID lookup error: {e}")
+            return f"Error performing lookup: {str(e)}"
+
+        return self._format_result(query, result)
+
+    def _format_result(self, query: str, result: Dict[str, Any]) -> str:
+        lines = [f"📊 OWID 정확 수치 조회: '{query}'", "━" * 60, "📌 출처: Our World in Data"]
+
+        if not result["indicators"]:
+            lines.append("❌ 질의에 맞는 지표를 찾지 못했습니다. 지표명(예: 기대수명, CO2, GDP 성장률)을 포함해 주세요.")
+            lines.append("   자유 검색은 OWID_Statistics_Search를 사용하세요.")
+            return "\n".join(lines)
+        if not result["results"]:
+            entities = ", ".join(result["entities"]) or "(국가 미지정 → World)"
+            indicators = ", ".join(f"{item['dataset_id']}: {item['indicator']}" for item in result["indicators"])
+            lines.append(f"❌ 해당 국가/기간의 데이터가 없습니다. 국가: {entities} / 지표: {indicators}")
+            return "\n".join(lines)
+
+        lines.append(f"📊 조회 결과: {len(result['results'])}개\n")
+        for i, item in enumerate(result["results"], 1):
+            lines.append(f"📈 [{i}] {item['entity']} · {item['indicator']}")
+            lines.append(f"  📋 dataset: {item['dataset_id']}")
+
+            if "range" in item:
+                span = item["range"]
+                lines.append(f"  📅 기간: {span['start_year']}~{span['end_year']} ({span['observations']}개 관측)")
+                if span["projection"]:
+                    lines.append(f"  ⚠️ {span['observed_until'] + 1}년 이후는 관측값이 아닌 전망치(projection)입니다")
+                lines.append(f"  시작값: {_format_number(span['start_value'])} ({span['start_year']})")
+                lines.append(f"  종료값: {_format_number(span['end_value'])} ({span['end_year']})")
+                lines.append(f"  변화량: {_format_number(span['change'])}")
+                if span["pct_change"] is not None:
+                    lines.append(f"  변화율: {span['pct_change']:+.2f}%")
+                if span["cagr"] is not None:
+                    lines.append(f"  연평균 증가율(CAGR): {span['cagr']:+.2f}%")
+                lines.append(f"  최솟값: {_format_number(span['min']['value'])} ({span['min']['year']})")
+                lines.append(f"  최댓값: {_format_number(span['max']['value'])} ({span['max']['year']})")
+            else:
+                point = item["value"]
+                if point["projection"]:
+                    note = "전망치(projection), 관측값 아님"
+                elif result["year"] is None:
+                    note = "최신 관측값"
+                    if point["has_projection"]:
+                        note += f", {point['observed_until'] + 1}년 이후는 전망치"
+                elif point["exact"]:
+                    note = "정확히 일치"
+                else:
+                    note = f"{result['year']}년 데이터 없음, 가장 가까운 연도"
+                lines.append(f"  {point['year']}년: {_format_number(point['value'])} ({note})")
+            lines.append("")
+
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    tool = OWIDLookupTool()
+    for q in ["2020년 한국 1인당 CO2 배출량", "Japan life expectancy 2000 2020", "세계 재생에너지 비율"]:
+        print(tool._run(q))
@@ -0,0 +1,202 @@
+"""
+Encoder / reranker loading for OWID RAG
+OWID_MODEL_BACKEND=onnx이면 e5 인코더와 cross-encoder를 ONNX로 내보내고 int8 동적 양자화한 뒤
+onnxruntime(CPU)으로 실행한다. 기본값 torch는 기존과 같은 PyTorch 모델.
+
+    1. 원본 모델을 backend="onnx"로 로드 (optimum이 fp32 ONNX로 변환) 후 로컬 디렉터리에 저장
+    2. export_dynamic_quantized_onnx_model로 onnx/model_*_{quantization}.onnx 생성
+    3. 고정 샘플 문장으로 PyTorch 모델과 점수 비교 (parity.json 기록)
+
+변환은 모델별로 한 번만 수행한다. parity 검사를 통과하지 못했거나 optimum/onnxruntime이 없으면
+경고를 남기고 PyTorch 모델을 사용한다.
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer, CrossEncoder
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+try:
+    import onnxruntime  # noqa: F401
+    import optimum  # noqa: F401
+    HAS_ONNX = True
+except ImportError:
+    HAS_ONNX = False
+
+logger = logging.getLogger(__name__)
+
+OWID_MODEL_CONFIG = {
+    "backend": os.getenv("OWID_MODEL_BACKEND", "torch").strip().lower(),           # torch | onnx
+    "quantization": os.getenv("OWID_ONNX_QUANTIZATION", "avx2").strip().lower(),   # arm64 | avx2 | avx512 | avx512_vnni
+    "onnx_dir": os.getenv("OWID_ONNX_DIR", "./owid_onnx_models"),                  # 변환된 모델 저장 위치
+    "min_cosine": 0.99,      # 인코더: 샘플별 PyTorch 임베딩과의 최소 코사인 유사도
+    "min_rank_corr": 0.95,   # 리랭커: PyTorch 점수와의 최소 Spearman 상관계수
+}
+
+QUANTIZATION_CONFIGS = ("arm64", "avx2", "avx512", "avx512_vnni")
+PARITY_FILE = "parity.json"
+
+# parity 검사용 고정 샘플 (한국어/영어 질의 + OWID 청크 형식 문서)
+PARITY_QUERIES = [
+    "한국의 1인당 CO2 배출량",
+    "South Korea life expectancy",
+    "세계 재생에너지 비율 추세",
+    "COVID-19 vaccination statistics",
+    "GDP growth rate in Japan",
+]
+PARITY_PASSAGES = [
+    "Dataset: co2-per-capita\nCountry: South Korea (대한민국)\nAnnual CO₂ emissions (per capita):\n- Latest: 11.16",
+    "Dataset: life-expectancy\nIndicator: Period life expectancy at birth\nTop 5: Japan 84.71, South Korea 83.43",
+    "Dataset: renewable-energy\nTrend Analysis:\n- Starting Value (1965): 6.20\n- Ending Value (2024): 14.82",
+    "Dataset: covid-vaccinations\nLatest Data (2024):\nIndicator: People vaccinated (cumulative)",
+    "Dataset: gdp-growth\nRegion: Asia\nIndicator: Gross domestic product, constant prices - Percent change",
+    "Dataset: plastic-waste\nStatistical Summary:\nPer capita plastic waste (kg/person/day)",
+]
+
+
+def get_backend() -> str:
+    """설정된 추론 백엔드 (onnx 의존성이 없으면 torch)"""
+    backend = OWID_MODEL_CONFIG["backend"]
+    if backend not in ("torch", "onnx"):
+        logger.warning(f"Unknown OWID_MODEL_BACKEND={backend!r}, using torch")
+        return "torch"
+    if backend == "onnx" and not HAS_ONNX:
+        logger.warning("optimum/onnxruntime not installed, using torch backend "
+                       "(install with: uv pip install 'optimum[onnxruntime]')")
+        return "torch"
+    return backend
+
+
+def _model_dir(model_name: str) -> Path:
+    return Path(OWID_MODEL_CONFIG["onnx_dir"]) / model_name.replace("/", "__")
+
+
+def _quantized_file(model_dir: Path, quantization: str) -> Optional[str]:
+    """양자화 모델 파일의 model_dir 기준 상대 경로 (avx2는 quint8, 나머지는 qint8)"""
+    found = sorted((model_dir / "onnx").glob(f"model_q*int8_{quantization}.onnx"))
+    return f"onnx/{found[0].name}" if found else None
+
+
+def _spearman(a: np.ndarray, b: np.ndarray) -> float:
+    rank_a = np.argsort(np.argsort(a)).astype(np.float64)
+    rank_b = np.argsort(np.argsort(b)).astype(np.float64)
+    if rank_a.std() == 0 or rank_b.std() == 0:
+        return 1.0
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+def encoder_parity(reference, candidate) -> Dict[str, Any]:
+    """e5 인코더 parity - 질의/문서 임베딩의 샘플별 코사인 유사도"""
+    texts = ["query: " + q for q in PARITY_QUERIES] + ["passage: " + p for p in PARITY_PASSAGES]
+    expected = reference.encode(texts, normalize_embeddings=True)
+    actual = candidate.encode(texts, normalize_embeddings=True)
+    cosine = np.sum(expected * actual, axis=1)
+    return {
+        "min_cosine": float(cosine.min()),
+        "mean_cosine": float(cosine.mean()),
+        "passed": bool(cosine.min() >= OWID_MODEL_CONFIG["min_cosine"]),
+    }
+
+
+def reranker_parity(reference, candidate) -> Dict[str, Any]:
+    """cross-encoder parity - 질의별 문서 점수 순위 상관과 최대 점수 차이"""
+    correlations, max_diff = [], 0.0
+    for query in PARITY_QUERIES:
+        pairs = [[query, passage] for passage in PARITY_PASSAGES]
+        expected = np.asarray(reference.predict(pairs), dtype=np.float64)
+        actual = np.asarray(candidate.predict(pairs), dtype=np.float64)
+        correlations.append(_spearman(expected, actual))
+        max_diff = max(max_diff, float(np.abs(expected - actual).max()))
+    return {
+        "min_rank_corr": min(correlations),
+        "max_abs_diff": max_diff,
+        "passed": bool(min(correlations) >= OWID_MODEL_CONFIG["min_rank_corr"]),
+    }
+
+
+def export_quantized(model_cls, model_name: str, quantization: Optional[str] = None) -> Dict[str, Any]:
+    """모델을 ONNX로 변환 + int8 동적 양자화 + PyTorch 대비 parity 검사 (결과는 parity.json에 기록)"""
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    quantization = quantization or OWID_MODEL_CONFIG["quantization"]
+    if quantization not in QUANTIZATION_CONFIGS:
+        raise ValueError(f"quantization must be one of {QUANTIZATION_CONFIGS}, got {quantization!r}")
+
+    model_dir = _model_dir(model_name)
+    model_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Exporting {model_name} to ONNX ({quantization} int8) at {model_dir}")
+
+    onnx_model = model_cls(model_name, backend="onnx")
+    onnx_model.save_pretrained(str(model_dir))
+    export_dynamic_quantized_onnx_model(onnx_model, quantization, str(model_dir))
+
+    file_name = _quantized_file(model_dir, quantization)
+    if file_name is None:
+        raise RuntimeError(f"Quantized ONNX file not found in {model_dir / 'onnx'}")
+
+    quantized = model_cls(str(model_dir), backend="onnx", model_kwargs={"file_name": file_name})
+    reference = model_cls(model_name)
+    check = encoder_parity if model_cls is SentenceTransformer else reranker_parity
+    report = {"model": model_name, "quantization": quantization, "file_name": file_name, **check(reference, quantized)}
+
+    (model_dir / PARITY_FILE).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logger.info(f"ONNX parity for {model_name}: {report}")
+    return report
+
+
+def _load(model_cls, model_name: str):
+    """백엔드 설정에 따라 모델 로드 (ONNX 실패 시 PyTorch)"""
+    if get_backend() != "onnx":
+        return model_cls(model_name)
+
+    quantization = OWID_MODEL_CONFIG["quantization"]
+    model_dir = _model_dir(model_name)
+    try:
+        report_path = model_dir / PARITY_FILE
+        report = json.loads(report_path.read_text(encoding="utf-8")) if report_path.exists() else None
+        if not report or report.get("quantization") != quantization or not _quantized_file(model_dir, quantization):
+            report = export_quantized(model_cls, model_name, quantization)
+        if not report.get("passed"):
+            logger.warning(f"ONNX parity check failed for {model_name} ({report}), using torch backend")
+            return model_cls(model_name)
+        model = model_cls(str(model_dir), backend="onnx", model_kwargs={"file_name": report["file_name"]})
+        logger.info(f"✅ Loaded {model_name} (ONNX int8, {quantization})")
+        return model
+    except Exception as e:
+        logger.warning(f"ONNX backend unavailable for {model_name}: {e}, using torch backend")
+        return model_cls(model_name)
+
+
+def load_encoder(model_name: str):
+    """임베딩 모델 (SentenceTransformer)"""
+    return _load(SentenceTransformer, model_name)
+
+
+def load_reranker(model_name: str):
+    """재순위화 모델 (CrossEncoder)"""
+    return _load(CrossEncoder, model_name)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="OWID 모델 ONNX int8 변환 + parity 검사")
+    parser.add_argument("--quantization", default=OWID_MODEL_CONFIG["quantization"], choices=QUANTIZATION_CONFIGS)
+    args = parser.parse_args()
+
+    from .owid_enhanced_rag import EMBEDDING_MODEL, RERANKER_MODEL
+    reports: List[Dict[str, Any]] = [
+        export_quantized(SentenceTransformer, EMBEDDING_MODEL, args.quantization),
+        export_quantized(CrossEncoder, RERANKER_MODEL, args.quantization),
+    ]
+    print(json.dumps(reports, indent=2))
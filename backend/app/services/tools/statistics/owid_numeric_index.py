@@ -0,0 +1,488 @@
+"""
+OWID numeric index - entity x year x indicator 정확 수치 조회
+"2020년 한국 1인당 CO2 배출량"처럼 국가/연도/지표가 정해진 질문은 임베딩/리랭킹 검색 없이
+메모리 인덱스에서 바로 값, 기간 범위, 증감률을 계산한다.
+
+    series[(dataset_id, indicator, entity)] = (연도 배열, 값 배열)   # 연도 오름차순
+
+국가명은 OWID Entity 이름과 한국어/약칭 별칭으로, 지표는 열 이름/데이터셋 ID/한국어 키워드로 찾는다.
+Day 열만 있는 데이터셋(코로나 백신, 해수면)은 연도별 마지막 관측값을 사용한다.
+지표별 마지막 관측 연도는 데이터셋 메타데이터(전망 구간 설명, lastUpdated)로 정하고, 그 이후 값은 전망치로 본다.
+"""
+
+import re
+import json
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .owid_columnar import load_frame
+from .owid_chunking import COUNTRY_COLUMNS, OWID_DATA_DIR, dataset_csv_path
+
+logger = logging.getLogger(__name__)
+
+# 한국어/약칭 국가명 -> OWID Entity
+ENTITY_ALIASES = {
+    '한국': 'South Korea', '대한민국': 'South Korea', '남한': 'South Korea',
+    'korea': 'South Korea', 'republic of korea': 'South Korea', 'rok': 'South Korea',
+    '북한': 'North Korea', '조선민주주의인민공화국': 'North Korea',
+    '미국': 'United States', 'usa': 'United States', 'us': 'United States', 'u.s.': 'United States',
+    '중국': 'China', '일본': 'Japan', '대만': 'Taiwan', '홍콩': 'Hong Kong', '몽골': 'Mongolia',
+    '인도': 'India', '인도네시아': 'Indonesia', '베트남': 'Vietnam', '태국': 'Thailand',
+    '필리핀': 'Philippines', '말레이시아': 'Malaysia', '싱가포르': 'Singapore',
+    '방글라데시': 'Bangladesh', '파키스탄': 'Pakistan', '이란': 'Iran', '이라크': 'Iraq',
+    '사우디아라비아': 'Saudi Arabia', '사우디': 'Saudi Arabia', '이스라엘': 'Israel', '튀르키예': 'Turkey',
+    '터키': 'Turkey', '아랍에미리트': 'United Arab Emirates', 'uae': 'United Arab Emirates',
+    '독일': 'Germany', '프랑스': 'France', '영국': 'United Kingdom', 'uk': 'United Kingdom',
+    '이탈리아': 'Italy', '스페인': 'Spain', '네덜란드': 'Netherlands', '벨기에': 'Belgium',
+    '스웨덴': 'Sweden', '노르웨이': 'Norway', '덴마크': 'Denmark', '핀란드': 'Finland',
+    '폴란드': 'Poland', '오스트리아': 'Austria', '스위스': 'Switzerland', '그리스': 'Greece',
+    '포르투갈': 'Portugal', '아일랜드': 'Ireland', '우크라이나': 'Ukraine', '러시아': 'Russia',
+    '캐나다': 'Canada', '멕시코': 'Mexico', '브라질': 'Brazil', '아르헨티나': 'Argentina',
+    '칠레': 'Chile', '콜롬비아': 'Colombia', '페루': 'Peru', '베네수엘라': 'Venezuela',
+    '호주': 'Australia', '오스트레일리아': 'Australia', '뉴질랜드': 'New Zealand',
+    '남아공': 'South Africa', '남아프리카공화국': 'South Africa', '나이지리아': 'Nigeria',
+    '이집트': 'Egypt', '케냐': 'Kenya', '에티오피아': 'Ethiopia',
+    '세계': 'World', '전세계': 'World', '전 세계': 'World', '글로벌': 'World', 'global': 'World',
+    '아시아': 'Asia', '유럽': 'Europe', '아프리카': 'Africa', '오세아니아': 'Oceania',
+    '북미': 'North America', '남미': 'South America',
+    '유럽연합': 'European Union (27)', 'eu': 'European Union (27)',
+}
+
+# 데이터셋별 지표 검색어 (한국어 + 영어 동의어)
+INDICATOR_ALIASES = {
+    'access-to-healthcare': ['보건의료', '의료접근', '의료 보장', '보편적 의료', 'uhc', 'health coverage'],
+    'air-pollution': ['대기오염', '미세먼지', '초미세먼지', 'pm2.5', 'air pollution', 'particulate'],
+    'arctic-ice': ['북극', '해빙', '빙하', 'sea ice', 'arctic'],
+    'biodiversity': ['생물다양성', '멸종', 'red list', 'biodiversity'],
+    'carbon-intensity': ['탄소집약도', '전력 탄소', 'carbon intensity'],
+    'child-mortality': ['아동 사망률', '영유아 사망률', '아동사망률', '5세 미만 사망', 'child mortality'],
+    'co2-per-capita': ['1인당 co2', '1인당 이산화탄소', '1인당 탄소', '1인당 배출량', 'co2 per capita', 'per capita co2'],
+    'covid-vaccinations': ['백신', '접종', '코로나 백신', 'vaccination', 'vaccinated'],
+    'diabetes': ['당뇨', '당뇨병', 'diabetes'],
+    'emissions-by-sector': ['부문별 배출', '부문별 온실가스', '수송 배출', '산업 배출', 'emissions by sector'],
+    'energy-consumption': ['에너지 소비', '에너지소비', '1차 에너지', 'energy consumption'],
+    'financial-inclusion': ['금융포용', '계좌 보유', '은행 계좌', 'account ownership', 'financial inclusion'],
+    'forest-area': ['산림', '숲', '산림면적', 'forest'],
+    'fossil-fuel-production': ['화석연료 생산', '석탄 생산', '석유 생산', '가스 생산', 'fossil fuel production'],
+    'fossil-fuel': ['화석연료', '석탄', '석유', '천연가스', 'fossil fuel'],
+    'gdp-growth': ['gdp', '경제성장률', '국내총생산', '성장률', 'gdp growth', 'economic growth'],
+    'government-effectiveness': ['정부 효과성', '국가역량', '정부 역량', 'state capacity', 'government effectiveness'],
+    'greenhouse-gas': ['온실가스', '메탄', '아산화질소', 'co2 배출', '이산화탄소 배출', '탄소배출', 'greenhouse gas', 'methane'],
+    'land-use': ['토지이용', '농지', '농경지', 'agricultural land', 'land use'],
+    'life-expectancy': ['기대수명', '평균수명', 'life expectancy'],
+    'material-footprint': ['물질 발자국', '자원 소비', 'material footprint'],
+    'maternal-mortality': ['모성 사망', '산모 사망', '모성사망비', 'maternal mortality'],
+    'mobile-phones': ['휴대전화', '이동전화', '휴대폰', '모바일 가입', 'mobile phone', 'mobile cellular'],
+    'nuclear-energy': ['원자력', '원전', '핵에너지', 'nuclear'],
+    'plastic-waste': ['플라스틱', '플라스틱 쓰레기', 'plastic waste'],
+    'population-growth': ['인구증가율', '인구 증가', '인구성장률', 'population growth'],
+    'poverty': ['빈곤', '빈곤율', '극빈', 'poverty'],
+    'renewable-energy': ['재생에너지', '신재생에너지', '재생 에너지', 'renewable'],
+    'sea-level': ['해수면', '해수면 상승', 'sea level'],
+    'smoking': ['흡연', '흡연율', '담배', 'smoking'],
+    'solar-energy': ['태양광', '태양에너지', '태양광 발전', 'solar'],
+    'suicide-rates': ['자살', '자살률', 'suicide', 'self-harm'],
+    'temperature-anomaly': ['기온', '온도', '지구온난화', '기온 편차', 'temperature', 'warming'],
+    'trade': ['무역', '교역', '무역의존도', 'trade'],
+    'voice-accountability': ['투표율', '선거', 'voter turnout'],
+    'years-of-schooling': ['교육년수', '교육 연수', '평균 교육', '학력', 'years of schooling', 'education'],
+}
+
+TIME_COLUMNS = ('Year', 'Day')
+MAX_INDICATORS_PER_QUERY = 3
+DEFAULT_ENTITY = 'World'  # 국가가 없는 질의 (해수면, 기온 편차 등 전 지구 지표)
+# 뒤에 수량 단위가 붙은 숫자(1500만, 2000명)는 연도가 아님
+_YEAR_RE = re.compile(r"(?<![\d.])(1[5-9]\d{2}|20\d{2})(?!\d|\.\d)(?!\s?(?:만|억|천|조|명|개|원|건|톤|배|달러|%))")
+# 열 이름 자체가 전망/예측치인 지표 (IMF GDP Forecasts 등)
+_PROJECTION_RE = re.compile(r"forecast|projection|projected", re.IGNORECASE)
+# 메타데이터 설명의 전망 구간 시작 연도 ("2024-2100: Projections", "For the years 2015 and beyond, the projections")
+_PROJECTION_START_RES = (
+    re.compile(r"(\d{4})\s*[-–]\s*\d{4}\s*:\s*projection", re.IGNORECASE),
+    re.compile(r"(\d{4})\s+(?:and beyond|onwards?)\W+(?:\w+\W+){0,3}projection", re.IGNORECASE),
+)
+_HANGUL = "가-힣"
+# 한국어 국가명 뒤에 올 수 있는 조사 (긴 것 우선) - 그 외 한글이 이어지면 다른 단어의 일부로 봄
+_PARTICLES = (
+    '에서는', '에서의', '에서', '에게', '에는', '으로', '보다', '까지', '부터', '처럼', '이나', '이랑', '이란',
+    '과의', '와의', '은', '는', '이', '가', '의', '에', '을', '를', '과', '와', '도', '로', '만', '랑', '나',
+)
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_GENERIC_WORDS = {'a', 'an', 'and', 'by', 'for', 'from', 'in', 'of', 'on', 'the', 'to', 'with', 'what', 'was', 'is'}
+
+
+def _normalize(text: str) -> str:
+    """소문자 + 아래첨자 숫자 정규화 (CO₂ -> co2)"""
+    return text.casefold().replace('₂', '2').replace('₄', '4')
+
+
+def _words(text: str) -> set:
+    return {word for word in _WORD_RE.findall(_normalize(text)) if word not in _GENERIC_WORDS}
+
+
+def _current_year() -> int:
+    return datetime.now().year
+
+
+def _entity_pattern(names: List[str]) -> Optional[re.Pattern]:
+    """국가명 검색 정규식 - 영문은 단어 경계, 한글은 앞에 한글이 없고 뒤가 토큰 끝 또는 조사인 경우만
+
+    한글 별칭은 단어 안에서도 부분 일치하므로('기대수명이란' -> 이란, '인도주의' -> 인도) 경계를 따로 둔다.
+    """
+    if not names:
+        return None
+    # 긴 이름 우선 (South Korea가 Korea보다 먼저)
+    names = sorted(names, key=len, reverse=True)
+    hangul = [name for name in names if re.search(f"[{_HANGUL}]", name)]
+    latin = [name for name in names if name not in hangul]
+    alternatives = []
+    if latin:
+        alternatives.append(r"(?<![a-z])(" + "|".join(re.escape(name) for name in latin) + r")(?![a-z])")
+    if hangul:
+        alternatives.append(
+            f"(?<![{_HANGUL}])(" + "|".join(re.escape(name) for name in hangul) + ")"
+            f"(?=(?:{'|'.join(_PARTICLES)})?(?![{_HANGUL}]))"
+        )
+    return re.compile("|".join(alternatives))
+
+
+def _column_metadata(csv_path: Path) -> Dict[str, Any]:
+    """<csv 이름>.metadata.json의 열별 메타데이터 (차트 부제목은 모든 열에 공통 적용)"""
+    path = csv_path.with_name(csv_path.stem + ".metadata.json")
+    try:
+        metadata = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    subtitle = (metadata.get("chart") or {}).get("subtitle") or ""
+    return {
+        name: {**column, "chartSubtitle": subtitle}
+        for name, column in (metadata.get("columns") or {}).items() if isinstance(column, dict)
+    }
+
+
+def _observed_until(column: Optional[Dict[str, Any]]) -> Optional[int]:
+    """열 메타데이터로 본 마지막 관측 연도
+
+    설명에 전망 구간("2024-2100: Projections")이 있으면 그 직전 연도,
+    없으면 lastUpdated 연도 (발표 시점 이후 연도의 값은 관측값일 수 없음), 둘 다 없으면 None.
+    """
+    if not column:
+        return None
+    text = " ".join(
+        value for key, value in column.items()
+        if key.startswith("description") or key == "chartSubtitle"
+        for value in ([value] if isinstance(value, str) else value if isinstance(value, list) else [])
+        if isinstance(value, str)
+    )
+    starts = [int(match.group(1)) for pattern in _PROJECTION_START_RES for match in pattern.finditer(text)]
+    if starts:
+        return min(starts) - 1
+    updated = re.match(r"(\d{4})-", str(column.get("lastUpdated") or ""))
+    return int(updated.group(1)) if updated else None
+
+
+class OWIDNumericIndex:
+    """전체 OWID 데이터셋의 (데이터셋, 지표, 국가) 시계열 인덱스"""
+
+    def __init__(self, data_dir: str = str(OWID_DATA_DIR)):
+        self.data_dir = Path(data_dir)
+        self.series: Dict[Tuple[str, str, str], Tuple[np.ndarray, np.ndarray]] = {}
+        self.indicators: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.entity_names: Dict[str, str] = {}
+        self._entity_re: Optional[re.Pattern] = None
+        self._indicator_words: Dict[Tuple[str, str], set] = {}
+        self._lock = threading.RLock()
+        self.built = False
+
+    # ------------------------------------------------------------------
+    # 인덱스 구축
+    # ------------------------------------------------------------------
+    def build(self) -> "OWIDNumericIndex":
+        """모든 데이터셋을 읽어 인덱스 구축 (Arrow 변환본이 있으면 memory-map으로 읽음)
+
+        새 딕셔너리에 구축한 뒤 마지막에 교체하므로 재구축 중에도 조회는 이전 인덱스를 본다.
+        """
+        with self._lock:
+            series: Dict[Tuple[str, str, str], Tuple[np.ndarray, np.ndarray]] = {}
+            indicators: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            entities = set()
+            for folder in sorted(self.data_dir.iterdir()) if self.data_dir.exists() else []:
+                csv_path = dataset_csv_path(folder) if folder.is_dir() else None
+                if csv_path is None:
+                    continue
+                try:
+                    entities.update(self._index_dataset(
+                        folder.name, load_frame(csv_path), series, indicators, _column_metadata(csv_path)
+                    ))
+                except Exception as e:
+                    logger.warning(f"Numeric index skipped {folder.name}: {e}")
+
+            entity_names = {_normalize(name): name for name in entities}
+            for alias, name in ENTITY_ALIASES.items():
+                if name in entities:
+                    entity_names.setdefault(_normalize(alias), name)
+            indicator_words = {
+                key: _words(key[1]) | _words(key[0].replace('-', ' ')) for key in indicators
+            }
+
+            self.series, self.indicators = series, indicators
+            self.entity_names = entity_names
+            self._entity_re = _entity_pattern(list(entity_names))
+            self._indicator_words = indicator_words
+            self.built = True
+
+        logger.info(f"OWID numeric index: {len(self.indicators)} indicators, "
+                    f"{len(self.entity_names)} entity names, {len(self.series)} series")
+        return self
+
+    @staticmethod
+    def _index_dataset(dataset_id: str, frame: pd.DataFrame,
+                       series: Dict[Tuple[str, str, str], Tuple[np.ndarray, np.ndarray]],
+                       indicators: Dict[Tuple[str, str], Dict[str, Any]],
+                       column_metadata: Optional[Dict[str, Any]] = None) -> set:
+        """데이터셋 하나를 지표별 국가 시계열로 분해 - 등장한 국가명 반환"""
+        country = next((col for col in COUNTRY_COLUMNS if col in frame.columns), None)
+        time_col = next((col for col in TIME_COLUMNS if col in frame.columns), None)
+        if country is None or time_col is None or frame.empty:
+            return set()
+
+        if time_col == 'Day':
+            year = pd.to_datetime(frame['Day'], errors='coerce').dt.year
+        else:
+            year = pd.to_numeric(frame['Year'], errors='coerce')
+        base = pd.DataFrame({'entity': frame[country].astype(object), 'year': year})
+
+        columns = [
+            col for col in frame.columns
+            if col not in (country, time_col, 'Code') and pd.api.types.is_numeric_dtype(frame[col])
+        ]
+        for indicator in columns:
+            data = base.assign(value=frame[indicator].astype(np.float64)).dropna()
+            if data.empty:
+                continue
+            # 같은 (국가, 연도)가 여러 번이면 파일상 마지막 값 (Day 데이터는 연도 말 값)
+            data = data.drop_duplicates(['entity', 'year'], keep='last')
+            data = data.sort_values(['entity', 'year'], kind='stable')
+
+            entity_values = data['entity'].to_numpy()
+            years = data['year'].to_numpy(dtype=np.int32)
+            values = data['value'].to_numpy(dtype=np.float64)
+            starts = np.flatnonzero(np.r_[True, entity_values[1:] != entity_values[:-1]])
+            ends = np.r_[starts[1:], len(entity_values)]
+            for start, end in zip(starts, ends):
+                series[(dataset_id, indicator, entity_values[start])] = (years[start:end], values[start:end])
+
+            indicators[(dataset_id, indicator)] = {
+                "dataset_id": dataset_id,
+                "indicator": indicator,
+                "time_column": time_col,
+                "entities": len(starts),
+                "year_min": int(years.min()),
+                "year_max": int(years.max()),
+                "projection": bool(_PROJECTION_RE.search(indicator)),
+                # 이 연도 이후 값은 관측값이 아님 (None이면 올해까지 관측값으로 봄)
+                "observed_until": _observed_until((column_metadata or {}).get(indicator)),
+            }
+        return set(base['entity'].dropna().unique())
+
+    def _ensure_built(self) -> None:
+        if not self.built:
+            with self._lock:
+                if not self.built:
+                    self.build()
+
+    # ------------------------------------------------------------------
+    # 이름 해석
+    # ------------------------------------------------------------------
+    def resolve_entity(self, name: str) -> Optional[str]:
+        """국가/지역명(한국어 별칭 포함) -> OWID Entity 이름"""
+        self._ensure_built()
+        return self.entity_names.get(_normalize(name.strip()))
+
+    def find_entities(self, text: str) -> List[str]:
+        """질의에 등장하는 국가/지역 (등장 순서, 중복 제거)"""
+        self._ensure_built()
+        if self._entity_re is None:
+            return []
+        found = []
+        for match in self._entity_re.finditer(_normalize(text)):
+            entity = self.entity_names[match.group(1) or match.group(2)]
+            if entity not in found:
+                found.append(entity)
+        return found
+
+    @staticmethod
+    def find_years(text: str) -> List[int]:
+        return [int(year) for year in _YEAR_RE.findall(text)]
+
+    def resolve_indicators(self, text: str, limit: int = MAX_INDICATORS_PER_QUERY) -> List[Tuple[str, str]]:
+        """질의와 가장 잘 맞는 (데이터셋, 지표) 목록 - 별칭/단어 일치 길이 합으로 점수화"""
+        self._ensure_built()
+        query = _normalize(text)
+        query_words = _words(text)
+        alias_scores = {
+            dataset_id: sum(len(alias) for alias in aliases if alias in query)
+            for dataset_id, aliases in INDICATOR_ALIASES.items()
+        }
+
+        scored = []
+        for key, words in self._indicator_words.items():
+            score = alias_scores.get(key[0], 0) + sum(len(word) for word in words & query_words)
+            if score > 0:
+                scored.append((score, self.indicators[key]["projection"], len(words), key))
+        if not scored:
+            return []
+        # 동점이면 관측값 지표, 그다음 단어 수가 적은(더 구체적으로 일치한) 지표 우선
+        scored.sort(key=lambda item: (-item[0], item[1], item[2]))
+        # 최고 점수의 절반 미만은 우연히 겹친 단어로 보고 제외
+        threshold = scored[0][0] / 2
+        return [key for score, _, _, key in scored[:limit] if score >= threshold]
+
+    # ------------------------------------------------------------------
+    # 수치 조회
+    # ------------------------------------------------------------------
+    def get_series(self, dataset_id: str, indicator: str, entity: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        self._ensure_built()
+        return self.series.get((dataset_id, indicator, entity))
+
+    def observed_until(self, dataset_id: str, indicator: str) -> int:
+        """마지막 관측 연도 (메타데이터의 전망 시작 직전 연도, 없으면 올해)"""
+        observed = self.indicators.get((dataset_id, indicator), {}).get("observed_until")
+        return _current_year() if observed is None else min(observed, _current_year())
+
+    def _is_projection(self, dataset_id: str, indicator: str, year: int) -> bool:
+        info = self.indicators.get((dataset_id, indicator), {})
+        return year > self.observed_until(dataset_id, indicator) or info.get("projection", False)
+
+    def value(self, dataset_id: str, indicator: str, entity: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """특정 연도 값 (없으면 가장 가까운 연도, year가 없으면 마지막 관측 연도까지의 최신값)
+
+        인구 전망(UN WPP), GDP 전망처럼 전망 구간이 들어 있는 시계열이 있어 마지막 관측 연도 이후 값과
+        전망치 지표의 값은 projection으로 표시한다.
+        """
+        series = self.get_series(dataset_id, indicator, entity)
+        if series is None:
+            return None
+        years, values = series
+        if year is None:
+            # 관측값이 없으면(전망치만 있는 시계열) 가장 이른 연도
+            idx = max(int(np.searchsorted(years, self.observed_until(dataset_id, indicator), side='right')) - 1, 0)
+        else:
+            idx = int(np.searchsorted(years, year))
+            exact = idx < len(years) and years[idx] == year
+            # 정확한 연도가 없으면 앞뒤 중 가까운 연도 (같으면 이전 연도)
+            if not exact and (idx == len(years) or (idx > 0 and year - years[idx - 1] <= years[idx] - year)):
+                idx -= 1
+        return {
+            "year": int(years[idx]),
+            "value": float(values[idx]),
+            "exact": year is None or int(years[idx]) == year,
+            "projection": self._is_projection(dataset_id, indicator, int(years[idx])),
+            "observed_until": self.observed_until(dataset_id, indicator),
+            "has_projection": int(years[-1]) > self.observed_until(dataset_id, indicator),
+        }
+
+    def range(self, dataset_id: str, indicator: str, entity: str,
+              start_year: Optional[int] = None, end_year: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """기간 내 관측값과 변화량/변화율/연평균 증가율(CAGR), 최소/최대 (end_year가 없으면 마지막 관측 연도까지)"""
+        series = self.get_series(dataset_id, indicator, entity)
+        if series is None:
+            return None
+        years, values = series
+        lo = 0 if start_year is None else int(np.searchsorted(years, start_year, side='left'))
+        if end_year is None:
+            end_year = self.observed_until(dataset_id, indicator)
+        hi = int(np.searchsorted(years, end_year, side='right'))
+        if hi - lo < 1:
+            return None
+
+        span_years, span_values = years[lo:hi], values[lo:hi]
+        first, last = float(span_values[0]), float(span_values[-1])
+        elapsed = int(span_years[-1] - span_years[0])
+        result = {
+            "start_year": int(span_years[0]),
+            "end_year": int(span_years[-1]),
+            "start_value": first,
+            "end_value": last,
+            "change": last - first,
+            "pct_change": (last - first) / abs(first) * 100 if first else None,
+            "cagr": ((last / first) ** (1 / elapsed) - 1) * 100 if elapsed > 0 and first > 0 and last > 0 else None,
+            "min": {"year": int(span_years[span_values.argmin()]), "value": float(span_values.min())},
+            "max": {"year": int(span_years[span_values.argmax()]), "value": float(span_values.max())},
+            "observations": int(hi - lo),
+            "projection": self._is_projection(dataset_id, indicator, int(span_years[-1])),
+            "observed_until": self.observed_until(dataset_id, indicator),
+        }
+        return result
+
+    def query(self, text: str, entity: Optional[str] = None, year: Optional[int] = None,
+              start_year: Optional[int] = None, end_year: Optional[int] = None,
+              limit: int = MAX_INDICATORS_PER_QUERY) -> Dict[str, Any]:
+        """자연어 질의 해석 후 조회
+
+        연도가 하나면 해당 연도 값, 둘 이상이면 처음~마지막 연도 범위와 증감률, 없으면 최신값.
+        명시적으로 넘긴 entity/year/start_year/end_year가 질의에서 찾은 값보다 우선한다.
+        """
+        self._ensure_built()
+        if entity:
+            resolved = self.resolve_entity(entity)
+            entities = [resolved] if resolved else self.find_entities(entity)
+        else:
+            entities = self.find_entities(text)
+
+        years = self.find_years(text)
+        if start_year is None and end_year is None and year is None:
+            if len(years) == 1:
+                year = years[0]
+            elif len(years) >= 2:
+                start_year, end_year = min(years), max(years)
+
+        # 국가명/연도는 지표 검색어에서 제외
+        indicator_text = _YEAR_RE.sub(' ', _normalize(text))
+        if self._entity_re is not None:
+            indicator_text = self._entity_re.sub(' ', indicator_text)
+        indicators = self.resolve_indicators(indicator_text, limit=limit)
+
+        results = []
+        for dataset_id, indicator in indicators:
+            for name in entities or [DEFAULT_ENTITY]:
+                if (dataset_id, indicator, name) not in self.series:
+                    continue
+                item = {"dataset_id": dataset_id, "indicator": indicator, "entity": name}
+                if start_year is not None or end_year is not None:
+                    item["range"] = self.range(dataset_id, indicator, name, start_year, end_year)
+                    if item["range"] is None:
+                        continue
+                else:
+                    item["value"] = self.value(dataset_id, indicator, name, year)
+                results.append(item)
+
+        return {
+            "entities": entities,
+            "indicators": [{"dataset_id": d, "indicator": i} for d, i in indicators],
+            "year": year,
+            "start_year": start_year,
+            "end_year": end_year,
+            "results": results,
+        }
+
+
+_indexes: Dict[str, OWIDNumericIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_numeric_index(data_dir: str = str(OWID_DATA_DIR)) -> OWIDNumericIndex:
+    """프로세스 공용 인덱스 (경로별 1회 구축)"""
+    key = str(Path(data_dir).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = OWIDNumericIndex(data_dir)
+    # 구축은 인덱스별 락에서 한 번만 (다른 경로의 인덱스 조회는 막지 않음)
+    index._ensure_built()
+    return index
@@ -13,7 +13,9 @@ import json
 import os
 
 # Import the enhanced RAG system
+from .owid_chunking import OWID_DATA_DIR
 from .owid_enhanced_rag import EnhancedOWIDRAG
+from .owid_vector_store import get_vector_backend
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -83,9 +85,10 @@ class OWIDRAGTool(BaseTool):
             
             # Check if required packages are installed
             try:
-                import chromadb
                 from sentence_transformers import SentenceTransformer
                 from rank_bm25 import BM25Okapi
+                if get_vector_backend() == "chroma":
+                    import chromadb
             except ImportError as e:
                 logger.error(f"Missing required package: {e}")
                 logger.error("Install with: uv pip install chromadb sentence-transformers rank-bm25")
@@ -93,8 +96,8 @@ class OWIDRAGTool(BaseTool):
             
             # Initialize the RAG system
             self.rag_system = EnhancedOWIDRAG(
-                data_dir="./owid_datasets",
-                db_path="./owid_enhanced_vectordb"
+                data_dir=str(OWID_DATA_DIR),
+                db_path=str(OWID_DATA_DIR.parent / "owid_enhanced_vectordb")
             )
             
             # Build index if needed
@@ -105,7 +108,7 @@ class OWIDRAGTool(BaseTool):
                     self.rag_system.build_enhanced_index(force_rebuild=False)
                 else:
                     logger.info(f"Using existing index with {existing_count} chunks")
-                    # Build BM25 index (in-memory)
+                    # Load persisted BM25 index (rebuilt only if the corpus changed)
                     self.rag_system._build_bm25_index()
             
             logger.info("✅ OWID RAG System ready")
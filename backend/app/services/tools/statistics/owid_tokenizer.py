@@ -0,0 +1,108 @@
+"""
+BM25 tokenizers for OWID hybrid search
+한국어 BM25 전처리용 토크나이저 선택 (환경변수 OWID_BM25_TOKENIZER)
+
+    okt         konlpy Okt 형태소 분석 (기본값, JVM은 처음 사용할 때 생성, konlpy가 없으면 whitespace)
+    ngram       한글은 음절 bigram, 그 외는 공백 단위 (순수 Python, 순위가 okt와 달라지므로 명시적으로 선택)
+    whitespace  공백 단위 분리만 수행
+
+문서와 질의는 반드시 같은 토크나이저로 처리해야 하므로 BM25 인덱스 해시에 이름을 포함한다.
+"""
+
+import os
+import re
+import threading
+import logging
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+try:
+    import konlpy  # noqa: F401  (Okt 생성 전까지 JVM을 띄우지 않음)
+    HAS_KONLPY = True
+except ImportError:
+    HAS_KONLPY = False
+
+logger = logging.getLogger(__name__)
+
+BM25_TOKENIZER = os.getenv("OWID_BM25_TOKENIZER", "okt").strip().lower()
+QUERY_TOKEN_CACHE_SIZE = int(os.getenv("OWID_QUERY_TOKEN_CACHE_SIZE", "4096"))
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+_HANGUL_SPLIT_RE = re.compile(r"[가-힣]+|[^\s가-힣]+")
+_DECIMAL_RE = re.compile(r"\d+\.\d+")
+
+_okt = None
+_okt_lock = threading.Lock()
+
+
+def _get_okt():
+    """Okt 인스턴스 (최초 호출 시 JVM 시작)"""
+    global _okt
+    if _okt is None:
+        with _okt_lock:
+            if _okt is None:
+                from konlpy.tag import Okt
+                logger.info("Starting konlpy Okt (JVM)...")
+                _okt = Okt()
+    return _okt
+
+
+def _normalize(text: str) -> str:
+    """소문자 변환 + 숫자 정규화 (소수점 제거)"""
+    text = text.lower()
+    return _DECIMAL_RE.sub(lambda m: str(int(float(m.group()))), text)
+
+
+def tokenize_whitespace(text: str) -> List[str]:
+    return text.split()
+
+
+def tokenize_ngram(text: str) -> List[str]:
+    """한글 구간은 음절 bigram(한 글자면 그대로), 나머지는 공백 단위 토큰"""
+    tokens = []
+    for part in _HANGUL_SPLIT_RE.findall(text):
+        if not _HANGUL_RE.match(part):
+            tokens.append(part)
+        elif len(part) == 1:
+            tokens.append(part)
+        else:
+            tokens.extend(part[i:i + 2] for i in range(len(part) - 1))
+    return tokens
+
+
+def tokenize_okt(text: str) -> List[str]:
+    """한국어가 포함된 경우에만 Okt 형태소 분석 (기존 동작과 동일)"""
+    if _HANGUL_RE.search(text):
+        return _get_okt().morphs(text)
+    return text.split()
+
+
+TOKENIZERS: Dict[str, Callable[[str], List[str]]] = {
+    "ngram": tokenize_ngram,
+    "okt": tokenize_okt,
+    "whitespace": tokenize_whitespace,
+}
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer_name() -> str:
+    """설정된 토크나이저 이름 (알 수 없으면 okt, konlpy가 없으면 기존 동작대로 whitespace)"""
+    name = BM25_TOKENIZER
+    if name not in TOKENIZERS:
+        logger.warning(f"Unknown OWID_BM25_TOKENIZER={name!r}, using okt")
+        name = "okt"
+    if name == "okt" and not HAS_KONLPY:
+        logger.warning("konlpy not installed, using whitespace tokenizer")
+        return "whitespace"
+    return name
+
+
+def tokenize(text: str) -> List[str]:
+    """문서/질의 공통 BM25 토크나이징"""
+    return TOKENIZERS[get_tokenizer_name()](_normalize(text))
+
+
+@lru_cache(maxsize=QUERY_TOKEN_CACHE_SIZE)
+def tokenize_query(text: str) -> Tuple[str, ...]:
+    """질의 토큰 (LRU 캐시, 반환값은 변경 불가 tuple)"""
+    return tuple(tokenize(text))
@@ -0,0 +1,231 @@
+"""
+Flat in-process vector store for OWID RAG
+수천 개 규모의 OWID 청크를 위한 ChromaDB 대체 백엔드 (OWID_VECTOR_BACKEND=flat)
+
+    embeddings.npy   정규화된 임베딩 행렬 (N x D, float16 또는 float32, np.load mmap으로 열기)
+    chunks.json      행 순서대로 청크 ID / 문서 / 메타데이터
+
+EnhancedOWIDRAG가 쓰는 Collection 메서드(count/upsert/add/delete/get/query)만 같은 형식으로 제공한다.
+인덱스 빌드는 batch() 안에서 upsert/delete를 메모리에만 반영하고 끝날 때 한 번만 디스크에 쓴다.
+질의는 행렬-벡터 곱으로 전체 코사인 유사도를 구한 뒤 argpartition으로 정확한 top-k를 고르고,
+distance는 Chroma 기본 공간(l2)과 같은 제곱 L2 거리(정규화 벡터에서 2 - 2cos)로 돌려준다.
+"""
+
+import os
+import json
+import threading
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .owid_bm25 import top_k_indices
+
+logger = logging.getLogger(__name__)
+
+OWID_VECTOR_CONFIG = {
+    "backend": os.getenv("OWID_VECTOR_BACKEND", "chroma").strip().lower(),  # chroma | flat
+    "dtype": os.getenv("OWID_FLAT_DTYPE", "float16").strip().lower(),       # 디스크 저장 타입 (float16 | float32)
+}
+
+EMBEDDINGS_FILE = "embeddings.npy"
+CHUNKS_FILE = "chunks.json"
+
+
+def get_vector_backend() -> str:
+    """설정된 벡터 백엔드 (알 수 없는 값이면 chroma)"""
+    backend = OWID_VECTOR_CONFIG["backend"]
+    if backend not in ("chroma", "flat"):
+        logger.warning(f"Unknown OWID_VECTOR_BACKEND={backend!r}, using chroma")
+        return "chroma"
+    return backend
+
+
+class FlatVectorCollection:
+    """memory-map 임베딩 행렬 + JSON 사이드카 기반 정확 최근접 검색"""
+
+    def __init__(self, path: Path, dtype: Optional[str] = None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype or OWID_VECTOR_CONFIG["dtype"])
+        if self.dtype not in (np.float16, np.float32):
+            raise ValueError(f"OWID_FLAT_DTYPE must be float16 or float32, got {self.dtype}")
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self._matrix: Optional[np.ndarray] = None
+        chunks_path = self.path / CHUNKS_FILE
+        matrix_path = self.path / EMBEDDINGS_FILE
+        if chunks_path.exists() and matrix_path.exists():
+            payload = json.loads(chunks_path.read_text(encoding="utf-8"))
+            matrix = np.load(matrix_path, mmap_mode="r")
+            if len(payload["ids"]) != matrix.shape[0]:
+                logger.warning("Flat vector store is inconsistent, starting empty")
+            else:
+                self.ids = payload["ids"]
+                self.documents = payload["documents"]
+                self.metadatas = payload["metadatas"]
+                self._matrix = matrix
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        self._scoring = None
+        self._dirty = False
+
+    def _commit(self, matrix: np.ndarray) -> None:
+        """변경된 행렬 반영 - batch() 안이면 메모리에만 두고, 아니면 바로 저장"""
+        if not self._batch_depth:
+            self._save(matrix)
+            return
+        self._matrix = matrix if len(self.ids) else None
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        self._scoring = None
+        self._dirty = True
+
+    def _save(self, matrix: np.ndarray) -> None:
+        """행렬과 사이드카를 임시 파일에 쓴 뒤 교체하고 mmap으로 다시 열기"""
+        matrix_path = self.path / EMBEDDINGS_FILE
+        chunks_path = self.path / CHUNKS_FILE
+        tmp_matrix = self.path / (EMBEDDINGS_FILE + ".tmp")
+        tmp_chunks = self.path / (CHUNKS_FILE + ".tmp")
+        with open(tmp_matrix, "wb") as f:
+            np.save(f, np.ascontiguousarray(matrix, dtype=self.dtype))
+        tmp_chunks.write_text(
+            json.dumps({"ids": self.ids, "documents": self.documents, "metadatas": self.metadatas},
+                       ensure_ascii=False),
+            encoding="utf-8",
+        )
+        # 기존 mmap을 놓은 뒤 교체
+        self._matrix = None
+        self._scoring = None
+        os.replace(tmp_matrix, matrix_path)
+        os.replace(tmp_chunks, chunks_path)
+        self._matrix = np.load(matrix_path, mmap_mode="r") if len(self.ids) else None
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        self._scoring = None
+        self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """묶음 쓰기 - 블록 안의 upsert/delete는 메모리에만 반영하고 정상 종료 시 한 번 저장
+
+        예외로 끝나면 메모리 변경을 버리고 디스크의 마지막 저장본을 다시 연다.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._dirty:
+                    self._load()
+            raise
+        with self._lock:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save(self._matrix if self._matrix is not None else np.empty((0, 0), dtype=np.float32))
+
+    def _scoring_matrix(self) -> Optional[np.ndarray]:
+        """질의용 float32 행렬 (float32 저장이면 mmap 그대로, float16이면 한 번 변환해 보관)"""
+        if self._matrix is None:
+            return None
+        if self._scoring is None:
+            self._scoring = self._matrix if self._matrix.dtype == np.float32 else self._matrix.astype(np.float32)
+        return self._scoring
+
+    # ------------------------------------------------------------------
+    # Chroma Collection 호환 API
+    # ------------------------------------------------------------------
+    def count(self) -> int:
+        return len(self.ids)
+
+    def upsert(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]],
+               documents: Sequence[str], metadatas: Sequence[Dict[str, Any]]) -> None:
+        """같은 ID는 교체, 새 ID는 뒤에 추가"""
+        new_rows = np.asarray(embeddings, dtype=np.float32)
+        with self._lock:
+            dim = new_rows.shape[1] if new_rows.ndim == 2 else 0
+            if self._matrix is not None:
+                # batch() 중 메모리에 있는 행렬은 이미 복사본이므로 그대로 수정
+                matrix = self._matrix if self._dirty else np.array(self._matrix, dtype=np.float32)
+                if dim and matrix.shape[1] != dim:
+                    raise ValueError(f"Embedding dimension mismatch: {dim} != {matrix.shape[1]}")
+            else:
+                matrix = np.empty((0, dim), dtype=np.float32)
+
+            appended = []
+            for chunk_id, row, document, metadata in zip(ids, new_rows, documents, metadatas):
+                position = self._positions.get(chunk_id)
+                if position is None:
+                    self._positions[chunk_id] = len(self.ids)
+                    self.ids.append(chunk_id)
+                    self.documents.append(document)
+                    self.metadatas.append(dict(metadata))
+                    appended.append(row)
+                elif position < matrix.shape[0]:
+                    matrix[position] = row
+                    self.documents[position] = document
+                    self.metadatas[position] = dict(metadata)
+                else:
+                    # 같은 호출 안에서 새로 추가된 ID가 다시 나온 경우
+                    appended[position - matrix.shape[0]] = row
+                    self.documents[position] = document
+                    self.metadatas[position] = dict(metadata)
+            if appended:
+                matrix = np.vstack([matrix, np.asarray(appended, dtype=np.float32)])
+            self._commit(matrix)
+
+    def add(self, ids, embeddings, documents, metadatas) -> None:
+        self.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+
+    def delete(self, ids: Sequence[str]) -> None:
+        with self._lock:
+            victims = {self._positions[chunk_id] for chunk_id in ids if chunk_id in self._positions}
+            if not victims:
+                return
+            keep = [i for i in range(len(self.ids)) if i not in victims]
+            matrix = np.asarray(self._matrix, dtype=np.float32)[keep]
+            self.ids = [self.ids[i] for i in keep]
+            self.documents = [self.documents[i] for i in keep]
+            self.metadatas = [self.metadatas[i] for i in keep]
+            self._commit(matrix)
+
+    def get(self, ids: Optional[Sequence[str]] = None, include: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Chroma get과 같은 형식 (include 기본값: documents, metadatas)"""
+        include = ["documents", "metadatas"] if include is None else include
+        with self._lock:
+            positions = range(len(self.ids)) if ids is None else [
+                self._positions[chunk_id] for chunk_id in ids if chunk_id in self._positions
+            ]
+            result: Dict[str, Any] = {"ids": [self.ids[i] for i in positions]}
+            if "documents" in include:
+                result["documents"] = [self.documents[i] for i in positions]
+            if "metadatas" in include:
+                result["metadatas"] = [self.metadatas[i] for i in positions]
+        return result
+
+    def query(self, query_embeddings: Sequence[Sequence[float]], n_results: int = 10) -> Dict[str, List]:
+        """정확한 top-k (질의별 ids/documents/metadatas/distances 리스트)"""
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        with self._lock:
+            matrix = self._scoring_matrix()
+            similarities = matrix @ queries.T if matrix is not None else np.zeros((0, len(queries)))
+            for column in similarities.T:
+                top = top_k_indices(column, n_results)
+                result["ids"].append([self.ids[i] for i in top])
+                result["documents"].append([self.documents[i] for i in top])
+                result["metadatas"].append([self.metadatas[i] for i in top])
+                result["distances"].append([float(2.0 - 2.0 * column[i]) for i in top])
+        return result
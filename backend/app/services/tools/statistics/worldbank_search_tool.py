@@ -5,10 +5,11 @@ import os
 from typing import Type, List, Dict, Optional, Tuple
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-import requests
 from pathlib import Path
 from datetime import datetime
 
+from ..base_tool import AsyncToolMixin, AsyncHTTPClient, RobustRequests, cached_tool, has_optional_fetch_budget
+
 
 class WorldBankSearchInput(BaseModel):
     query: str = Field(..., description="검색어 (예: unemployment, GDP, poverty)")
@@ -17,7 +18,9 @@ class WorldBankSearchInput(BaseModel):
     years: int = Field(5, description="최근 몇 년 데이터를 가져올지")
 
 
-class WorldBankSearchTool(BaseTool):
+@cached_tool("statistics", empty_markers=("지표를 찾을 수 없습니다",),
+             canonical_args={"query": "bag"})
+class WorldBankSearchTool(AsyncToolMixin, BaseTool):
     """World Bank 자연어 검색 도구 - WDI 지표를 자연어로 검색"""
 
     name: str = "WorldBank_Natural_Search"
@@ -98,27 +101,46 @@ class WorldBankSearchTool(BaseTool):
     
     def _fetch_indicator_data(self, indicator_code: str, country: str, years: int) -> Optional[Dict]:
         """지표 데이터 가져오기"""
-        current_year = datetime.now().year
-        start_year = current_year - years
-        
-        url = f"https://api.worldbank.org/v2/country/{country}/indicator/{indicator_code}"
-        params = {
-            "format": "json",
-            "date": f"{start_year}:{current_year}",
-            "per_page": 100
-        }
+        try:
+            resp = RobustRequests.get(**self._build_indicator_request(indicator_code, country, years), timeout=10)
+            return self._parse_indicator_response(resp)
+        except Exception:
+            pass
         
+        return None
+    
+    async def _afetch_indicator_data(self, indicator_code: str, country: str, years: int) -> Optional[Dict]:
+        """지표 데이터 가져오기 (비동기)"""
         try:
-            resp = requests.get(url, params=params, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                if isinstance(data, list) and len(data) > 1 and data[1]:
-                    return data[1]
-        except:
+            resp = await AsyncHTTPClient.get(**self._build_indicator_request(indicator_code, country, years), timeout=10)
+            return self._parse_indicator_response(resp)
+        except Exception:
             pass
         
         return None
     
+    def _build_indicator_request(self, indicator_code: str, country: str, years: int) -> Dict:
+        """지표 데이터 요청 구성"""
+        current_year = datetime.now().year
+        start_year = current_year - years
+        
+        return {
+            "url": f"https://api.worldbank.org/v2/country/{country}/indicator/{indicator_code}",
+            "params": {
+                "format": "json",
+                "date": f"{start_year}:{current_year}",
+                "per_page": 100
+            }
+        }
+    
+    def _parse_indicator_response(self, resp) -> Optional[Dict]:
+        """World Bank 응답에서 데이터 목록 추출"""
+        if resp.status_code == 200:
+            data = resp.json()
+            if isinstance(data, list) and len(data) > 1 and data[1]:
+                return data[1]
+        return None
+    
     def _format_data(self, data: List[Dict], indicator_name: str) -> str:
         """데이터와 모든 메타데이터를 있는 그대로 전달"""
         if not data:
@@ -166,9 +188,36 @@ class WorldBankSearchTool(BaseTool):
         if not search_results:
             return f"❌ '{query}'에 대한 지표를 찾을 수 없습니다."
         
-        return self._format_structured_output(query, search_results, country, fetch_data, years)
+        # 데이터 가져오기 (첫 번째 지표만, 부가 정보이므로 시간 예산이 부족하면 생략)
+        data_info = None
+        if fetch_data and has_optional_fetch_budget():
+            code, name, _ = search_results[0]
+            data_info = self._fetch_and_format_data(code, country, years, name)
+        
+        return self._format_structured_output(query, search_results, country, data_info)
+    
+    async def _arun(
+        self,
+        query: str,
+        country: str = "KR",
+        fetch_data: bool = True,
+        years: int = 5
+    ) -> str:
+        """검색 실행 (비동기)"""
+        search_results = self._search_indicators(query, limit=5)
+        
+        if not search_results:
+            return f"❌ '{query}'에 대한 지표를 찾을 수 없습니다."
+        
+        data_info = None
+        if fetch_data and has_optional_fetch_budget():
+            code, name, _ = search_results[0]
+            data = await self._afetch_indicator_data(code, country, years)
+            data_info = self._format_data(data, name) if data else "  ⚠️ 데이터를 불러올 수 없습니다."
+        
+        return self._format_structured_output(query, search_results, country, data_info)
     
-    def _format_structured_output(self, query: str, search_results: List, country: str, fetch_data: bool, years: int) -> str:
+    def _format_structured_output(self, query: str, search_results: List, country: str, data_info: Optional[str]) -> str:
         """구조화된 World Bank 출력 형식"""
         
         result = []
@@ -185,9 +234,8 @@ class WorldBankSearchTool(BaseTool):
             result.append(f"  📋 관련도: {score:.0f}%")
             result.append(f"  📋 대상국가: {country}")
             
-            # 데이터 가져오기 (첫 번째만 또는 모든 지표)
-            if fetch_data and (i == 1):  # 첫 번째만 데이터 표시
-                data_info = self._fetch_and_format_data(code, country, years, name)
+            # 첫 번째 지표에만 데이터 표시
+            if data_info is not None and i == 1:
                 result.append("\n📊 지표 데이터:")
                 result.append(data_info)
             
@@ -0,0 +1,163 @@
+"""
+Cache registry for FactWave
+시스템의 모든 캐시(도구 응답 DataCache, OWID 검색 결과 등)를 이름으로 등록하고
+적중/미스/제거/용량 통계 조회와 키 접두사 단위 삭제를 한곳에서 제공한다.
+
+등록되는 캐시는 다음 두 메서드를 구현한다.
+    stats() -> Dict[str, Any]
+    purge(prefix: Optional[str] = None) -> int   # 삭제한 항목 수
+"""
+
+import sys
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats:
+    """캐시 카운터 (호출자 또는 내부 lock으로 보호)"""
+
+    FIELDS = ("hits", "misses", "stale_hits", "sets", "evictions", "expirations", "purged")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters = {field: 0 for field in self.FIELDS}
+
+    def incr(self, field: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[field] = self.counters.get(field, 0) + amount
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters["hits"] + counters["stale_hits"] + counters["misses"]
+        counters["hit_rate"] = round((counters["hits"] + counters["stale_hits"]) / lookups, 4) if lookups else None
+        return counters
+
+
+class LRUCache:
+    """통계를 수집하는 스레드 안전 메모리 LRU 캐시"""
+
+    _MISSING = object()
+
+    def __init__(self, max_items: int = 128, name: Optional[str] = None):
+        self.max_items = max(1, max_items)
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        if name:
+            register_cache(name, self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, self._MISSING)
+            if value is self._MISSING:
+                self._stats.incr("misses")
+                return default
+            self._data.move_to_end(key)
+        self._stats.incr("hits")
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            evicted = 0
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+                evicted += 1
+        self._stats.incr("sets")
+        if evicted:
+            self._stats.incr("evictions", evicted)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self.purge()
+
+    def purge(self, prefix: Optional[str] = None) -> int:
+        """전체 또는 문자열 키 접두사가 일치하는 항목 삭제"""
+        with self._lock:
+            if prefix is None:
+                removed = len(self._data)
+                self._data.clear()
+            else:
+                victims = [k for k in self._data if isinstance(k, str) and k.startswith(prefix)]
+                for key in victims:
+                    del self._data[key]
+                removed = len(victims)
+        self._stats.incr("purged", removed)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._data)
+            # 얕은 크기 추정 (키 + 값 객체 자체)
+            approx_bytes = sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in self._data.items())
+        return {
+            "type": "memory_lru",
+            "entries": entries,
+            "max_items": self.max_items,
+            "bytes": approx_bytes,
+            **self._stats.as_dict(),
+        }
+
+
+_registry: Dict[str, Any] = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """캐시 등록 (같은 이름이면 최신 인스턴스로 교체)"""
+    with _registry_lock:
+        _registry[name] = cache
+
+
+def get_registered_caches() -> Dict[str, Any]:
+    with _registry_lock:
+        return dict(_registry)
+
+
+def get_cache_stats(name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """등록된 캐시별 통계 (name을 주면 해당 캐시만)"""
+    caches = get_registered_caches()
+    if name is not None:
+        if name not in caches:
+            raise KeyError(name)
+        caches = {name: caches[name]}
+
+    stats = {}
+    for cache_name, cache in sorted(caches.items()):
+        try:
+            stats[cache_name] = cache.stats()
+        except Exception as e:
+            logger.error(f"Cache stats error ({cache_name}): {e}")
+            stats[cache_name] = {"error": str(e)}
+    return stats
+
+
+def purge_caches(name: Optional[str] = None, prefix: Optional[str] = None) -> Dict[str, int]:
+    """캐시 항목 삭제 - name이 없으면 모든 캐시 대상, prefix가 없으면 전체 삭제"""
+    caches = get_registered_caches()
+    if name is not None:
+        if name not in caches:
+            raise KeyError(name)
+        caches = {name: caches[name]}
+
+    removed = {}
+    for cache_name, cache in caches.items():
+        removed[cache_name] = cache.purge(prefix)
+    logger.info(f"Cache purge (name={name}, prefix={prefix}): {removed}")
+    return removed
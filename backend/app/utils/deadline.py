@@ -0,0 +1,133 @@
+"""
+Deadline propagation for FactWave
+팩트체크 한 건의 시간 예산을 단계 → 에이전트 → 도구 호출까지 전달하는 유틸리티
+"""
+
+import os
+import time
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+
+# 시간 예산 설정 (환경변수로 조정 가능)
+DEADLINE_CONFIG = {
+    "total_seconds": float(os.getenv("FACTCHECK_TIME_BUDGET", "90")),  # 판정까지의 SLA
+    "step_shares": {"step1": 0.5, "step2": 0.3, "step3": 0.2},        # 단계별 예산 비율
+    "min_step2_seconds": 15.0,           # 이보다 적게 남으면 토론 단계 생략
+    "min_tool_seconds": 2.0,             # 이보다 적게 남으면 도구 호출 생략
+    "min_retry_seconds": 10.0,           # 이보다 적게 남으면 HTTP 재시도 없이 1회만 시도
+    "min_optional_fetch_seconds": 15.0,  # 부가 데이터 조회(KOSIS/FRED/World Bank 수치 등) 기준
+    "hard_timeout_grace_seconds": float(os.getenv("FACTCHECK_HARD_TIMEOUT_GRACE", "30")),  # 강제 종료 전 유예
+}
+
+TIME_BUDGET_EXHAUSTED_MESSAGE = (
+    "⏱️ 팩트체크 시간 예산이 소진되어 도구 호출을 생략했습니다. "
+    "지금까지 수집한 근거로 결론을 내려주세요."
+)
+
+
+class DeadlineExceeded(Exception):
+    """남은 시간 예산이 부족하여 작업을 건너뜀"""
+
+
+class Deadline:
+    """단조 시계 기준의 마감 시각
+
+    자식 Deadline은 부모의 마감 시각을 넘지 못하고, 부모가 취소되면 함께 취소된다.
+    """
+
+    def __init__(self, seconds: float, parent: Optional["Deadline"] = None, label: str = ""):
+        expires_at = time.monotonic() + max(seconds, 0.0)
+        if parent is not None:
+            expires_at = min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+        self.budget = seconds
+        self.label = label
+        self.parent = parent
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """협조적 취소 - 다른 스레드에서 실행 중인 작업이 다음 확인 지점에서 멈추도록 남은 시간을 0으로 만든다"""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self.parent is not None and self.parent.cancelled)
+
+    def raise_if_cancelled(self) -> None:
+        """취소되었으면 DeadlineExceeded (단계/에이전트 사이 확인 지점용)"""
+        if self.cancelled:
+            raise DeadlineExceeded(f"팩트체크가 취소되었습니다 ({self.label})")
+
+    def remaining(self) -> float:
+        """남은 시간(초) - 취소되었으면 0"""
+        if self.cancelled:
+            return 0.0
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def child(self, seconds: float, label: str = "") -> "Deadline":
+        """현재 예산 안에서 하위 예산 생성"""
+        return Deadline(seconds, parent=self, label=label)
+
+    def __repr__(self) -> str:
+        state = ", cancelled" if self.cancelled else ""
+        return f"Deadline(label={self.label!r}, remaining={self.remaining():.1f}s{state})"
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "factwave_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 Deadline (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Union[Deadline, float], label: str = "") -> Iterator[Deadline]:
+    """컨텍스트 안에서 사용할 Deadline 설정
+
+    숫자를 넘기면 현재 Deadline의 하위 예산으로 만든다.
+    contextvar는 run_in_executor 등 다른 스레드로 자동 전파되지 않으므로
+    워커 스레드 안에서 진입해야 한다.
+    """
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline, parent=current_deadline(), label=label)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """남은 시간(초), Deadline이 없으면 None"""
+    deadline = current_deadline()
+    return deadline.remaining() if deadline is not None else None
+
+
+def has_time_budget(seconds: float) -> bool:
+    """최소 seconds 만큼의 예산이 남아 있는지 (Deadline이 없으면 항상 True)"""
+    remaining = remaining_time()
+    return remaining is None or remaining >= seconds
+
+
+def clamp_timeout(timeout: float, minimum: Optional[float] = None) -> float:
+    """요청 timeout을 남은 예산으로 줄임
+
+    남은 시간이 minimum(기본 min_tool_seconds)보다 적으면 DeadlineExceeded를 발생시킨다.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if minimum is None:
+        minimum = DEADLINE_CONFIG["min_tool_seconds"]
+    if remaining < minimum:
+        raise DeadlineExceeded(f"시간 예산 소진 (남은 시간 {remaining:.1f}초)")
+    return min(timeout, remaining)
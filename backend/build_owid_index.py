@@ -2,30 +2,37 @@
 """
 OWID RAG 인덱스 사전 빌드 스크립트
 한 번만 실행하면 이후에는 빠르게 로드 가능
+데이터가 바뀐 뒤 다시 실행하면 변경된 데이터셋만 증분 반영 (--force: 전체 재빌드)
 """
 
-from app.services.tools.owid_enhanced_rag import EnhancedOWIDRAG
+import argparse
+from app.services.tools.statistics.owid_enhanced_rag import EnhancedOWIDRAG
+from app.services.tools.statistics.owid_columnar import convert_datasets
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def build_index():
+def build_index(force_rebuild: bool = False):
     """인덱스 빌드 및 저장"""
     logger.info("🏗️ Building OWID RAG Index...")
-    logger.info("This will take about 30-40 seconds but only needs to be done once.")
+    if force_rebuild:
+        logger.info("Full rebuild requested: every dataset will be re-chunked and re-embedded.")
     
     rag = EnhancedOWIDRAG()
     
-    # 강제로 재빌드
-    rag.build_enhanced_index(force_rebuild=True)
+    # CSV -> Arrow 변환본 갱신 (바뀐 CSV만, 청크 생성 시 memory-map으로 읽음)
+    convert_datasets(rag.data_dir, force=force_rebuild)
+    
+    # 바뀐 데이터셋만 재처리 (force_rebuild면 전체)
+    rag.build_enhanced_index(force_rebuild=force_rebuild)
     
     # 테스트 쿼리로 확인
     test_results = rag.search("Korea CO2", n_results=1)
     if test_results:
         logger.info("✅ Index built successfully!")
         logger.info(f"   Total chunks: {rag.collection.count()}")
-        logger.info("   Index is saved and ready for use.")
+        logger.info("   Index (vectors + BM25) is saved and ready for use.")
     else:
         logger.error("❌ Index build failed")
         return False
@@ -33,4 +40,7 @@ def build_index():
     return True
 
 if __name__ == "__main__":
-    build_index()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="OWID RAG 인덱스 빌드")
+    parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 전체 재빌드")
+    args = parser.parse_args()
+    build_index(force_rebuild=args.force)
\ No newline at end of file
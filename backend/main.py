@@ -25,6 +25,8 @@ import logging
 
 # Project imports
 from app.core import FactWaveCrew
+from app.services.tools.base_tool import load_tool_caches
+from app.utils.cache_registry import get_cache_stats, purge_caches
 
 # Setup
 load_dotenv()
@@ -567,6 +569,44 @@ Super Agent creates a weighted confidence matrix and delivers the final verdict.
                 logger.error(f"Application error: {e}", exc_info=True)
 
 
+def show_cache_stats():
+    """도구 캐시 항목 수/크기 출력
+
+    적중/미스/제거 카운터는 프로세스 메모리에만 있어 새로 뜬 CLI에서는 항상 0이므로 표시하지 않는다.
+    실행 중인 서버의 카운터는 GET /api/cache/stats로 확인한다.
+    """
+    load_tool_caches()
+    table = Table(title="📦 캐시 통계", show_header=True,
+                  caption="적중/미스 통계는 서버의 GET /api/cache/stats에서 확인하세요 (프로세스별 카운터)")
+    table.add_column("캐시", style="cyan")
+    table.add_column("항목", justify="right")
+    table.add_column("유효", justify="right")
+    table.add_column("크기", justify="right")
+    
+    for name, stats in get_cache_stats().items():
+        if "error" in stats:
+            table.add_row(name, "-", "-", f"[red]{stats['error']}[/red]")
+            continue
+        table.add_row(
+            name,
+            str(stats["entries"]),
+            str(stats.get("fresh_entries", stats["entries"])),
+            f"{stats['bytes'] / 1024:.1f} KB"
+        )
+    console.print(table)
+
+
+def purge_cache(name: Optional[str] = None, tool: Optional[str] = None, prefix: Optional[str] = None):
+    """캐시 항목 삭제 (tool을 주면 해당 도구의 항목만)"""
+    load_tool_caches()
+    if tool:
+        prefix = f"{tool}:"
+    removed = purge_caches(name=name, prefix=prefix)
+    for cache_name, count in removed.items():
+        console.print(f"  {cache_name}: {count}개 삭제")
+    console.print(f"[green]✅ 총 {sum(removed.values())}개 캐시 항목을 삭제했습니다.[/green]")
+
+
 def main():
     """Main entry point with argument parsing"""
     parser = argparse.ArgumentParser(
@@ -616,7 +656,47 @@ def main():
         help="상세 출력 모드"
     )
     
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="캐시 통계 출력"
+    )
+    
+    parser.add_argument(
+        "--cache-purge",
+        nargs="?",
+        const="",
+        metavar="CACHE",
+        help="캐시 항목 삭제 (캐시 이름 예: tool:news, 생략하면 모든 캐시)"
+    )
+    
+    parser.add_argument(
+        "--cache-tool",
+        metavar="TOOL",
+        help="--cache-purge 대상 도구 이름"
+    )
+    
+    parser.add_argument(
+        "--cache-prefix",
+        metavar="PREFIX",
+        help="--cache-purge 대상 키 접두사"
+    )
+    
     args = parser.parse_args()
+    if args.cache_tool and args.cache_prefix:
+        parser.error("--cache-tool과 --cache-prefix는 함께 지정할 수 없습니다")
+    
+    # 캐시 관리 명령은 API 키 없이 실행
+    if args.cache_stats or args.cache_purge is not None:
+        try:
+            if args.cache_purge is not None:
+                purge_cache(args.cache_purge or None, args.cache_tool, args.cache_prefix)
+            if args.cache_stats:
+                show_cache_stats()
+        except KeyError as e:
+            console.print(f"[red]알 수 없는 캐시: {e}[/red]")
+            sys.exit(1)
+        return
     
     # Create interface
     interface = FactWaveInterface()
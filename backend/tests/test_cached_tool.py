@@ -0,0 +1,153 @@
+"""cached_tool 테스트 - 동일 호출 재사용, 키로 만들 수 없는 인자, 오류/빈 결과 네거티브 캐시, 부분 결과"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+import pytest
+
+from app.services.tools import base_tool
+from app.services.tools.base_tool import DataCache, cached_tool, has_optional_fetch_budget, mark_result_uncacheable
+from app.utils.deadline import DEADLINE_CONFIG, Deadline, deadline_scope
+
+
+@cached_tool("test", canonical_args={"query": "bag"})
+class ProbeTool:
+    """호출 횟수를 세고 reply로 결과를 만드는 도구"""
+
+    name = "probe"
+
+    def __init__(self):
+        self.calls = 0
+        self.reply = lambda query: f"🔍 '{query}' 검색 결과\n📊 데이터: 42"
+
+    def _run(self, query, limit: int = 5) -> str:
+        self.calls += 1
+        return self.reply(query)
+
+    async def _arun(self, query, limit: int = 5) -> str:
+        self.calls += 1
+        return self.reply(query)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = DataCache(cache_dir=str(tmp_path), name="test:cached_tool")
+    monkeypatch.setitem(base_tool._type_caches, "test", cache)
+    return cache
+
+
+@pytest.fixture
+def tool(cache):
+    return ProbeTool()
+
+
+def test_equivalent_calls_share_entry(tool):
+    first = tool._run("한국 실업률")
+    assert tool._run("실업률  한국", limit=5) == "🔍 '실업률  한국' 검색 결과\n📊 데이터: 42"
+    assert tool._run(query="한국 실업률") == first
+    assert tool.calls == 1
+
+    tool._run("한국 실업률", limit=10)
+    assert tool.calls == 2
+
+
+def test_async_path_uses_same_cache(tool):
+    tool._run("한국 실업률")
+    assert asyncio.run(tool._arun("한국 실업률")).startswith("🔍 '한국 실업률'")
+    assert tool.calls == 1
+
+
+def test_unbindable_arguments_fall_back_to_uncached_call(tool, cache):
+    # 키를 만들 수 없으면 원래 _run을 그대로 호출하므로 원래 함수의 TypeError가 나온다
+    with pytest.raises(TypeError, match="unexpected keyword"):
+        tool._run("한국 실업률", bogus=True)
+    assert cache.stats()["entries"] == 0
+
+
+def test_error_result_is_not_cached(tool):
+    tool.reply = lambda query: "❌ 오류: 서비스 사용 불가"
+    tool._run("한국 실업률")
+    tool._run("한국 실업률")
+    assert tool.calls == 2
+
+
+def _stored_ttl_minutes(cache):
+    created_at, expires_at = cache._conn.execute("SELECT created_at, expires_at FROM cache").fetchone()
+    return (expires_at - created_at) / 60
+
+
+def test_empty_result_gets_negative_ttl(tool, cache):
+    tool.reply = lambda query: f"❌ '{query}'에 대한 결과를 찾을 수 없습니다."
+    tool._run("없는 지표")
+    tool._run("없는 지표")
+    assert tool.calls == 1
+    assert _stored_ttl_minutes(cache) == pytest.approx(base_tool.NEGATIVE_CACHE_CONFIGS["empty"]["ttl_hours"] * 60)
+
+
+def test_permanent_error_gets_negative_ttl(tool, cache):
+    def not_found(query):
+        base_tool._record_outcome(404)
+        return "❌ 오류: HTTP 404"
+
+    tool.reply = not_found
+    tool._run("한국 실업률")
+    tool._run("한국 실업률")
+    assert tool.calls == 1
+    assert _stored_ttl_minutes(cache) == pytest.approx(base_tool.NEGATIVE_CACHE_CONFIGS["permanent_error"]["ttl_hours"] * 60)
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_transient_failure_is_never_cached(tool, cache, status):
+    def flaky(query):
+        base_tool._record_outcome(status)
+        return f"❌ '{query}'에 대한 결과를 찾을 수 없습니다."  # 빈 결과처럼 보여도 캐시하지 않음
+
+    tool.reply = flaky
+    tool._run("한국 실업률")
+    tool._run("한국 실업률")
+    assert tool.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_result_without_optional_fetch_is_not_cached(tool):
+    def with_optional_data(query):
+        data = "📊 데이터: 42" if has_optional_fetch_budget() else "(시간 예산 부족으로 데이터 생략)"
+        return f"🔍 '{query}' 검색 결과\n{data}"
+
+    tool.reply = with_optional_data
+    with deadline_scope(Deadline(DEADLINE_CONFIG["min_optional_fetch_seconds"] / 2)):
+        assert "데이터 생략" in tool._run("한국 GDP")
+
+    # 예산이 충분한 다음 호출은 부분 결과가 아닌 전체 결과를 받고, 그 결과가 캐시됨
+    assert "데이터: 42" in tool._run("한국 GDP")
+    assert "데이터: 42" in tool._run("한국 GDP")
+    assert tool.calls == 2
+
+
+def test_marked_fallback_result_is_not_cached(tool, cache):
+    def mock_articles(query):
+        mark_result_uncacheable()
+        return f"🔍 '{query}' 관련 뉴스 3건\n1. 예시 기사"  # 첫 줄만 보면 정상 결과
+
+    tool.reply = mock_articles
+    tool._run("한국 실업률")
+    tool._run("한국 실업률")
+    assert tool.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_naver_mock_output_is_not_cached(tmp_path, monkeypatch):
+    from app.services.tools.news.naver_news_tool import NaverNewsTool
+
+    news_cache = DataCache(cache_dir=str(tmp_path), name="test:news")
+    monkeypatch.setitem(base_tool._type_caches, "news", news_cache)
+    monkeypatch.delenv("NAVER_CLIENT_ID", raising=False)
+    monkeypatch.delenv("NAVER_CLIENT_SECRET", raising=False)
+
+    news = NaverNewsTool()
+    assert "API 키가 설정되지 않았습니다" in news._run("최저임금 인상")
+    assert "API 키가 설정되지 않았습니다" in asyncio.run(news._arun("최저임금 인상"))
+    assert news_cache.stats()["entries"] == 0
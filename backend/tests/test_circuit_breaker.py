@@ -0,0 +1,59 @@
+"""서킷 브레이커 테스트 - 연속 실패 시 차단, half-open 단일 탐침, 탐침 슬롯 반환"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import pytest
+
+from app.services.tools.base_tool import CircuitBreaker, CircuitOpenError, HostCircuitBreakers, RobustRequests
+
+
+def test_circuit_opens_after_threshold():
+    breaker = CircuitBreaker("example.org", failure_threshold=2, recovery_seconds=60)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker("example.org", failure_threshold=1, recovery_seconds=0.01)
+    breaker.before_call()
+    breaker.record(False)
+    time.sleep(0.02)
+
+    breaker.before_call()  # 탐침
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # 결과 없이 반환한 탐침 슬롯은 다시 쓸 수 있음
+    breaker.record(None)
+    breaker.before_call()
+    breaker.record(True, elapsed=0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker("example.org", failure_threshold=3, recovery_seconds=0.01)
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record(False)
+    time.sleep(0.02)
+    breaker.before_call()
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_unknown_retry_policy_does_not_hold_probe():
+    url = "https://probe-test.example/api"
+    breaker = HostCircuitBreakers.get(url)
+    breaker.state = CircuitBreaker.HALF_OPEN
+    with pytest.raises(ValueError):
+        RobustRequests.get(url, retry_policy="aggressive")
+    assert breaker.probe_in_flight is False
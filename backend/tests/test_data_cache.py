@@ -0,0 +1,60 @@
+"""DataCache 테스트 - 메모리 LRU 티어, SQLite 티어, 만료/유예, 접두사 삭제"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.tools.base_tool import DataCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return DataCache(cache_dir=str(tmp_path / "cache"), name=f"test:{tmp_path}", **kwargs)
+
+
+def test_memory_tier_serves_repeated_reads(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("tool:a", {"value": 1})
+    assert cache.get("tool:a") == {"value": 1}
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_sqlite_tier_survives_new_instance(tmp_path):
+    make_cache(tmp_path).set("tool:a", {"rows": ["x" * 2000]})  # 압축되는 크기
+    reopened = make_cache(tmp_path)
+    assert reopened.stats()["memory_entries"] == 0
+    assert reopened.get("tool:a") == {"rows": ["x" * 2000]}
+    assert reopened.stats()["memory_entries"] == 1
+
+
+def test_memory_tier_is_lru_bounded(tmp_path):
+    cache = make_cache(tmp_path, memory_items=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_evictions"] == 1
+    # 메모리에서 밀려난 항목은 SQLite에서 읽힘
+    assert cache.get("a") == "a"
+
+
+def test_expired_entry_is_stale_within_grace(tmp_path):
+    cache = make_cache(tmp_path, stale_grace_hours=1)
+    cache.set("tool:a", "old", ttl_hours=-1 / 3600)
+    assert cache.get("tool:a") is None
+    assert cache.get_entry("tool:a") == ("old", False)
+
+    no_grace = make_cache(tmp_path / "other")
+    no_grace.set("tool:a", "old", ttl_hours=-1 / 3600)
+    assert no_grace.get_entry("tool:a") is None
+
+
+def test_purge_by_prefix(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("kosis:1", 1)
+    cache.set("kosis:2", 2)
+    cache.set("fred:1", 3)
+    assert cache.purge("kosis:") == 2
+    assert cache.get("kosis:1") is None
+    assert cache.get("fred:1") == 3
+    assert cache.purge() == 1
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,65 @@
+"""공유 HTTP 풀 테스트 - 정책별 세션 재사용, keep-alive 연결 재사용"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.tools.base_tool import HTTP_POOL_CONFIG, RobustRequests
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    peers = set()
+
+    def do_GET(self):
+        self.peers.add(self.client_address)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.peers = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_session_is_shared_per_policy():
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(RobustRequests.get_session("fast"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(session) for session in sessions}) == 1
+    assert RobustRequests.get_session("none") is not RobustRequests.get_session("fast")
+
+    adapter = RobustRequests.get_session("fast").get_adapter("https://example.org")
+    assert adapter._pool_maxsize == HTTP_POOL_CONFIG["pool_maxsize"]
+    assert adapter.max_retries.total == 1
+
+
+def test_unknown_policy_raises():
+    with pytest.raises(ValueError):
+        RobustRequests.get_session("aggressive")
+
+
+def test_sequential_calls_reuse_connection(server):
+    for _ in range(3):
+        assert RobustRequests.get(f"{server}/ping", retry_policy="none", timeout=5).text == "ok"
+    assert len(_Handler.peers) == 1
@@ -0,0 +1,58 @@
+"""SparseBM25 테스트 - rank_bm25.BM25Okapi와 점수/순위 일치"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+rank_bm25 = pytest.importorskip("rank_bm25")
+
+from app.services.tools.statistics.owid_bm25 import SparseBM25, top_k_indices
+
+CORPUS = [
+    "한국 기대수명 2020 south korea life expectancy".split(),
+    "co2 emissions per capita south korea".split(),
+    "co2 co2 emissions world total".split(),
+    "renewable energy share world".split(),
+    "life expectancy world average".split(),
+    "plastic waste per capita".split(),
+    "world world world population".split(),
+]
+
+QUERIES = [
+    "south korea life expectancy".split(),
+    "co2 emissions".split(),
+    "world".split(),                 # 절반 이상 문서에 나와 음수 idf -> epsilon 보정
+    "없는 토큰 unknown".split(),
+    [],
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_scores_match_bm25okapi(query):
+    expected = rank_bm25.BM25Okapi(CORPUS).get_scores(query)
+    np.testing.assert_allclose(SparseBM25(CORPUS).get_scores(query), expected, rtol=1e-9, atol=1e-12)
+
+
+def test_batch_matches_single():
+    bm25 = SparseBM25(CORPUS)
+    batch = bm25.get_scores_batch(QUERIES)
+    for query, scores in zip(QUERIES, batch):
+        np.testing.assert_allclose(scores, bm25.get_scores(query))
+
+
+def test_top_k_order_and_min_score():
+    bm25 = SparseBM25(CORPUS)
+    scores = bm25.get_scores("co2 emissions".split())
+    top = bm25.top_k("co2 emissions".split(), k=3)
+    assert [idx for idx, _ in top] == [idx for idx in np.argsort(scores)[::-1][:3] if scores[idx] > 0]
+    assert bm25.top_k("unknown".split(), k=3) == []
+
+
+def test_top_k_indices_ties_match_argsort():
+    scores = np.array([1.0, 3.0, 3.0, 0.5, 3.0, 2.0])
+    for k in range(1, len(scores) + 1):
+        assert list(top_k_indices(scores, k)) == list(np.argsort(scores)[-k:][::-1])
@@ -0,0 +1,170 @@
+"""EnhancedOWIDRAG 증분 빌드 테스트 - 파일 stat 기반 해시 생략, 벡터 인덱스 없을 때 BM25 구축, 토크나이저별 BM25 저장본
+
+모델/ChromaDB 없이 결정적인 가짜 인코더와 flat 벡터 인덱스로 구성한다.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.tools.statistics import owid_enhanced_rag, owid_tokenizer
+from app.services.tools.statistics.owid_enhanced_rag import EnhancedOWIDRAG, INDEX_MANIFEST_FILE
+from app.services.tools.statistics.owid_vector_store import FlatVectorCollection
+from app.utils.cache_registry import LRUCache
+
+DATASETS = {
+    "co2-emissions": "Annual CO2 emissions",
+    "life-expectancy": "Life expectancy",
+}
+
+
+class FakeEncoder:
+    def encode(self, texts, normalize_embeddings=True, **kwargs):
+        vectors = np.zeros((len(texts), 8), dtype=np.float32)
+        for i, text in enumerate(texts):
+            vectors[i, len(text) % 8] = 1.0
+        return vectors
+
+
+def _write_datasets(data_dir):
+    for dataset_id, column in DATASETS.items():
+        folder = data_dir / dataset_id
+        folder.mkdir(parents=True)
+        pd.DataFrame([
+            {"Entity": entity, "Code": code, "Year": year, column: value + year / 100}
+            for entity, code, value in (("South Korea", "KOR", 10), ("Japan", "JPN", 8), ("World", "OWID_WRL", 4))
+            for year in (2000, 2010, 2020)
+        ]).to_csv(folder / f"{dataset_id}.csv", index=False)
+        (folder / "readme.md").write_text(f"# {column}\n\nOur World in Data - {column}", encoding="utf-8")
+
+
+def make_rag(tmp_path, with_vectors=True):
+    rag = EnhancedOWIDRAG.__new__(EnhancedOWIDRAG)
+    rag.data_dir = tmp_path / "data"
+    rag.db_path = tmp_path / "db"
+    rag.db_path.mkdir(exist_ok=True)
+    rag.encoder = FakeEncoder() if with_vectors else None
+    rag.reranker = None
+    rag.collection = FlatVectorCollection(rag.db_path / "flat", dtype="float32") if with_vectors else None
+    rag.bm25_index = None
+    rag.bm25_documents = []
+    rag.bm25_metadata = []
+    rag.bm25_ids = []
+    rag.datasets = rag._load_datasets()
+    rag.cache = LRUCache(max_items=10, name="test:owid_search")
+    rag.query_embeddings = LRUCache(max_items=10, name="test:owid_query_embedding")
+    rag.rerank_scores = LRUCache(max_items=10, name="test:owid_rerank")
+    rag._rerank_ms_per_pair = None
+    return rag
+
+
+@pytest.fixture
+def data(tmp_path, monkeypatch):
+    monkeypatch.setitem(owid_enhanced_rag.OWID_BUILD_CONFIG, "workers", 1)
+    _write_datasets(tmp_path / "data")
+    return tmp_path
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    """_dataset_hash 호출된 데이터셋 ID 기록"""
+    calls = []
+    original = EnhancedOWIDRAG._dataset_hash
+
+    def counting(dataset):
+        calls.append(dataset["id"])
+        return original(dataset)
+
+    monkeypatch.setattr(EnhancedOWIDRAG, "_dataset_hash", staticmethod(counting))
+    return calls
+
+
+def test_unchanged_files_skip_hashing(data, hashed):
+    make_rag(data).build_enhanced_index()
+    assert sorted(hashed) == sorted(DATASETS)
+
+    hashed.clear()
+    rag = make_rag(data)
+    rag.build_enhanced_index()
+    assert hashed == []
+    assert rag.bm25_index is not None
+
+
+def test_touched_file_is_rehashed_once(data, hashed):
+    make_rag(data).build_enhanced_index()
+    chunks = make_rag(data).collection.count()
+
+    csv_path = data / "data" / "life-expectancy" / "life-expectancy.csv"
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    hashed.clear()
+    make_rag(data).build_enhanced_index()
+    assert hashed == ["life-expectancy"]  # 내용이 같으므로 다시 청킹하지 않고 stat만 갱신
+    manifest = json.loads((data / "db" / INDEX_MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert manifest["datasets"]["life-expectancy"]["files"]["csv_path"][2] == stat.st_mtime_ns + 10**9
+
+    hashed.clear()
+    rag = make_rag(data)
+    rag.build_enhanced_index()
+    assert hashed == []
+    assert rag.collection.count() == chunks
+
+
+def test_changed_content_is_rebuilt(data, hashed):
+    make_rag(data).build_enhanced_index()
+    readme = data / "data" / "co2-emissions" / "readme.md"
+    readme.write_text(readme.read_text(encoding="utf-8") + "\nUpdated.", encoding="utf-8")
+
+    hashed.clear()
+    rag = make_rag(data)
+    rag.build_enhanced_index()
+    assert hashed == ["co2-emissions"]
+    manifest = json.loads((data / "db" / INDEX_MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert manifest["datasets"]["co2-emissions"]["hash"] == EnhancedOWIDRAG._dataset_hash(rag.datasets[0])
+
+
+def test_bm25_is_built_without_vector_index(data):
+    rag = make_rag(data, with_vectors=False)
+    rag.build_enhanced_index()
+    assert rag.bm25_index is not None
+    assert {metadata["dataset_id"] for metadata in rag.bm25_metadata} == set(DATASETS)
+    assert len(rag.bm25_ids) == len(rag.bm25_documents) == len(rag.bm25_metadata) > 0
+
+    results = rag._bm25_search("life expectancy Japan", k=5)
+    assert results and results[0].dataset_id == "life-expectancy"
+
+
+@pytest.mark.parametrize("configured, has_konlpy, expected", [
+    ("okt", False, "whitespace"),   # 기존 동작: konlpy가 없으면 공백 단위
+    ("okt", True, "okt"),
+    ("ngram", False, "ngram"),
+    ("unknown", False, "whitespace"),
+])
+def test_tokenizer_selection(monkeypatch, configured, has_konlpy, expected):
+    monkeypatch.setattr(owid_tokenizer, "BM25_TOKENIZER", configured)
+    monkeypatch.setattr(owid_tokenizer, "HAS_KONLPY", has_konlpy)
+    owid_tokenizer.get_tokenizer_name.cache_clear()
+    try:
+        assert owid_tokenizer.get_tokenizer_name() == expected
+    finally:
+        owid_tokenizer.get_tokenizer_name.cache_clear()
+
+
+def test_stored_bm25_index_is_tied_to_tokenizer(data, monkeypatch):
+    rag = make_rag(data)
+    rag.build_enhanced_index()
+    corpus_hash = rag._corpus_hash(rag.bm25_ids)
+    assert make_rag(data)._load_bm25_index(corpus_hash)
+
+    monkeypatch.setattr(owid_enhanced_rag, "get_tokenizer_name", lambda: "tokenizer-b")
+    other = make_rag(data)
+    assert other._corpus_hash(rag.bm25_ids) != corpus_hash
+    assert not other._load_bm25_index(corpus_hash)
+    assert other._load_bm25_tokens() == {}
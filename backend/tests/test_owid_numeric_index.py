@@ -0,0 +1,183 @@
+"""OWID 수치 인덱스 테스트 - 국가명 경계, 연도 추출, 전망치 처리, 동시 구축, 데이터 경로"""
+
+import json
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+
+from app.services.tools.statistics import owid_numeric_index
+from app.services.tools.statistics.owid_numeric_index import OWIDNumericIndex, get_numeric_index
+
+THIS_YEAR = 2025
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """기대수명(관측값) + 인구증가율(2100년까지 전망 포함) 소형 데이터셋"""
+    monkeypatch.setattr(owid_numeric_index, "_current_year", lambda: THIS_YEAR)
+    entities = ["South Korea", "Iran", "India", "China", "World"]
+
+    life = tmp_path / "life-expectancy"
+    life.mkdir()
+    pd.DataFrame([
+        {"Entity": entity, "Code": "", "Year": year, "Period life expectancy at birth": 60.0 + i + (year - 2000) / 10}
+        for i, entity in enumerate(entities) for year in (2000, 2010, 2020)
+    ]).to_csv(life / "life-expectancy.csv", index=False)
+
+    population = tmp_path / "population-growth"
+    population.mkdir()
+    pd.DataFrame([
+        {"Entity": entity, "Code": "", "Year": year, "Population growth rate": 1.0 - (year - 2000) / 100}
+        for entity in entities for year in (2000, 2020, 2024, 2050, 2100)
+    ]).to_csv(population / "population-growth.csv", index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def index(data_dir):
+    return OWIDNumericIndex(str(data_dir)).build()
+
+
+@pytest.mark.parametrize("query", ["기대수명이란", "인도주의 기대수명", "중국어 사용국 기대수명"])
+def test_hangul_alias_inside_word_is_not_entity(index, query):
+    assert index.find_entities(query) == []
+    assert [item["entity"] for item in index.query(query)["results"]] == ["World"]
+
+
+@pytest.mark.parametrize("query, entity", [
+    ("한국의 기대수명", "South Korea"),
+    ("이란 기대수명", "Iran"),
+    ("인도는 기대수명이", "India"),
+    ("중국, 2020년 기대수명", "China"),
+    ("life expectancy in South Korea", "South Korea"),
+])
+def test_entity_with_particle_or_boundary(index, query, entity):
+    assert index.find_entities(query) == [entity]
+
+
+@pytest.mark.parametrize("text, years", [
+    ("2020년 한국 기대수명", [2020]),
+    ("2000 2020 Japan", [2000, 2020]),
+    ("인구 1500만 명", []),
+    ("2000명이 참여한 2019년 조사", [2019]),
+    ("3.2020 또는 2020.5", []),
+])
+def test_find_years_skips_counts(text, years):
+    assert OWIDNumericIndex.find_years(text) == years
+
+
+def test_latest_value_excludes_projection(index):
+    point = index.value("population-growth", "Population growth rate", "World")
+    assert point["year"] == 2024
+    assert point["projection"] is False
+
+    future = index.value("population-growth", "Population growth rate", "World", year=2100)
+    assert future["year"] == 2100
+    assert future["projection"] is True
+
+
+def test_range_without_end_stops_at_current_year(index):
+    span = index.range("population-growth", "Population growth rate", "World", start_year=2000)
+    assert span["end_year"] == 2024
+    assert span["projection"] is False
+    assert index.range("population-growth", "Population growth rate", "World", 2000, 2100)["projection"] is True
+
+
+def test_concurrent_first_use_builds_once(data_dir, monkeypatch):
+    builds = []
+    original = OWIDNumericIndex.build
+
+    def counting_build(self):
+        builds.append(threading.get_ident())
+        return original(self)
+
+    monkeypatch.setattr(OWIDNumericIndex, "build", counting_build)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_numeric_index(str(data_dir)).query("한국 기대수명 2020")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(result["results"][0]["value"]["value"] == 62.0 for result in results)
+
+
+def test_forecast_indicator_is_projection(tmp_path, monkeypatch):
+    monkeypatch.setattr(owid_numeric_index, "_current_year", lambda: THIS_YEAR)
+    folder = tmp_path / "gdp-growth"
+    folder.mkdir()
+    pd.DataFrame([
+        {"Entity": "World", "Code": "", "Year": year,
+         "GDP growth - Observations": 3.0 if year <= 2024 else None,
+         "GDP growth - Forecasts": 2.5 if year >= 2024 else None}
+        for year in (2020, 2024, 2025)
+    ]).to_csv(folder / "real-gdp-growth.csv", index=False)
+    index = OWIDNumericIndex(str(tmp_path)).build()
+
+    assert index.resolve_indicators("gdp growth")[0] == ("gdp-growth", "GDP growth - Observations")
+    assert index.value("gdp-growth", "GDP growth - Forecasts", "World")["projection"] is True
+    assert index.value("gdp-growth", "GDP growth - Observations", "World")["projection"] is False
+
+
+def _write_projection_dataset(tmp_path, subtitle="", description="", last_updated="2024-07-11"):
+    """1950-2023 관측 + 2024-2100 UN 전망이 한 열에 들어 있는 인구증가율 데이터셋 (CSV 두 개)"""
+    folder = tmp_path / "population-growth"
+    folder.mkdir()
+    pd.DataFrame([
+        {"Entity": "United States", "Code": "USA", "Year": year, "Population growth rate": 0.5 + (2100 - year) / 1000}
+        for year in (2000, 2020, 2023, 2024, 2025, 2050, 2100)
+    ]).to_csv(folder / "population-growth-rate.csv", index=False)
+    pd.DataFrame([{"Entity": "World", "Year": -9999, "Annual population growth rate (OWID)": 0.04}]) \
+        .to_csv(folder / "population-growth.csv", index=False)
+    (folder / "download_summary.json").write_text(json.dumps({"chart_slug": "population-growth-rate"}))
+    (folder / "population-growth-rate.metadata.json").write_text(json.dumps({
+        "chart": {"subtitle": subtitle},
+        "columns": {"Population growth rate": {"descriptionProcessing": description, "lastUpdated": last_updated}},
+    }))
+    return OWIDNumericIndex(str(tmp_path)).build()
+
+
+def test_projection_range_in_metadata_limits_latest_value(tmp_path, monkeypatch):
+    monkeypatch.setattr(owid_numeric_index, "_current_year", lambda: THIS_YEAR)
+    index = _write_projection_dataset(
+        tmp_path, description="- 1950-2023: UN WPP records.\n\n- 2024-2100: Projections based on Medium variant."
+    )
+    assert index.observed_until("population-growth", "Population growth rate") == 2023
+
+    result = index.query("미국 인구증가율")
+    point = result["results"][0]["value"]
+    assert (point["year"], point["projection"], point["has_projection"]) == (2023, False, True)
+    assert index.value("population-growth", "Population growth rate", "United States", year=2025)["projection"] is True
+    assert index.range("population-growth", "Population growth rate", "United States", 2000)["end_year"] == 2023
+
+
+def test_last_updated_caps_observed_year(tmp_path, monkeypatch):
+    monkeypatch.setattr(owid_numeric_index, "_current_year", lambda: 2030)
+    index = _write_projection_dataset(tmp_path, last_updated="2024-07-11")
+    assert index.value("population-growth", "Population growth rate", "United States")["year"] == 2024
+
+
+def test_multi_csv_folder_uses_chart_slug(tmp_path, monkeypatch):
+    monkeypatch.setattr(owid_numeric_index, "_current_year", lambda: THIS_YEAR)
+    index = _write_projection_dataset(tmp_path)
+    assert list(index.indicators) == [("population-growth", "Population growth rate")]
+
+
+def test_lookup_tool_resolves_data_dir_from_module(tmp_path, monkeypatch):
+    from app.services.tools.statistics import owid_lookup_tool
+    from app.services.tools.statistics.owid_chunking import OWID_DATA_DIR
+
+    requested = []
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(owid_lookup_tool, "get_numeric_index", lambda data_dir: requested.append(data_dir))
+    owid_lookup_tool.OWIDLookupTool()._get_index()
+    assert requested == [str(OWID_DATA_DIR)]
+    assert (OWID_DATA_DIR / "life-expectancy").is_dir()
@@ -0,0 +1,98 @@
+"""OWID cross-encoder 재순위화 테스트 - 점수 캐시, 지연 예산, 채점 안 된 후보의 순위, 적응형 후보 수"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+
+import pytest
+
+from app.services.tools.statistics.owid_chunking import SearchResult
+from app.services.tools.statistics import owid_enhanced_rag
+from app.services.tools.statistics.owid_enhanced_rag import EnhancedOWIDRAG
+from app.utils.cache_registry import LRUCache
+
+
+class CountingReranker:
+    def __init__(self):
+        self.pairs = 0
+
+    def predict(self, pairs):
+        self.pairs += len(pairs)
+        return [float(len(doc)) for _, doc in pairs]
+
+
+def make_rag():
+    rag = EnhancedOWIDRAG.__new__(EnhancedOWIDRAG)
+    rag.reranker = CountingReranker()
+    rag.rerank_scores = LRUCache(max_items=1000)
+    rag._rerank_ms_per_pair = None
+    return rag
+
+
+def candidates(n=6):
+    return [
+        SearchResult(content="x" * (i + 1), metadata={}, score=0.05 - i * 0.001,
+                     source="test", dataset_id=f"d{i}", chunk_type="overview", chunk_id=f"c{i}")
+        for i in range(n)
+    ]
+
+
+def test_pair_scores_are_cached():
+    rag = make_rag()
+    results, complete = rag._rerank_results("기대수명", candidates(), n_results=3)
+    assert complete and [r.chunk_id for r in results][:3] == ["c5", "c4", "c3"]
+    rag._rerank_results(" 기대수명 ", candidates(), n_results=3)  # 정규화 후 같은 질의
+    assert rag.reranker.pairs == 6
+
+
+def test_unscored_results_rank_below_scored():
+    rag = make_rag()
+    query_hash = hashlib.md5(rag._normalize_query("기대수명").encode()).hexdigest()
+    rag.rerank_scores.set(f"{query_hash}:c1", -7.5)
+    rag.rerank_scores.set(f"{query_hash}:c4", -9.0)
+    rag._rerank_ms_per_pair = 1e6  # 예산 안에 새 쌍을 채점할 수 없음
+
+    results, complete = rag._rerank_results("기대수명", candidates(), n_results=6, budget_ms=1)
+    assert not complete and rag.reranker.pairs == 0
+    assert [r.chunk_id for r in results] == ["c1", "c4", "c0", "c2", "c3", "c5"]
+    scores = [r.score for r in results]
+    assert scores == sorted(scores, reverse=True) and max(scores[2:]) < -9.0
+
+
+def test_nothing_scored_keeps_rrf_scores():
+    rag = make_rag()
+    rag._rerank_ms_per_pair = 1e6
+    results, complete = rag._rerank_results("기대수명", candidates(), n_results=6, budget_ms=1)
+    assert not complete
+    assert [r.score for r in results] == pytest.approx([0.05 - i * 0.001 for i in range(6)])
+
+
+def _hits(prefix, n):
+    return [
+        SearchResult(content=f"{prefix} {i}", metadata={}, score=0.0, source="test",
+                     dataset_id=f"{prefix}{i}", chunk_type="overview", chunk_id=f"{prefix}{i}")
+        for i in range(n)
+    ]
+
+
+def test_depth_cuts_after_results_found_by_both_retrievers():
+    # 두 검색기가 공통으로 찾은 후보 6개 뒤에 한쪽에서만 찾은 후보가 이어지는 RRF 결과
+    shared = _hits("both", 6)
+    vector = shared + _hits("vec", 14)
+    bm25 = list(reversed(shared)) + _hits("bm25", 14)
+    fused = EnhancedOWIDRAG.__new__(EnhancedOWIDRAG)._reciprocal_rank_fusion(vector, bm25)[:20]
+
+    assert EnhancedOWIDRAG._rerank_depth(fused, n_results=5) == 6
+    assert EnhancedOWIDRAG._rerank_depth(fused, n_results=8) == 20  # 공통 후보가 모자라면 자르지 않음
+
+
+def test_depth_keeps_all_without_a_clear_gap(monkeypatch):
+    fused = EnhancedOWIDRAG.__new__(EnhancedOWIDRAG)._reciprocal_rank_fusion(_hits("vec", 20), [])
+    assert EnhancedOWIDRAG._rerank_depth(fused, n_results=5) == 20
+
+    monkeypatch.setitem(owid_enhanced_rag.OWID_RERANK_CONFIG, "min_gap", 0)
+    shared = _hits("both", 6)
+    fused = EnhancedOWIDRAG.__new__(EnhancedOWIDRAG)._reciprocal_rank_fusion(shared + _hits("vec", 14), shared)
+    assert EnhancedOWIDRAG._rerank_depth(fused, n_results=5) == 20
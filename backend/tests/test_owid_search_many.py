@@ -0,0 +1,111 @@
+"""EnhancedOWIDRAG.search_many 테스트 - 질의마다 search()를 호출한 것과 같은 결과, 공유 결과 캐시
+
+모델/ChromaDB 없이 결정적인 가짜 인코더/재순위화기와 flat 벡터 인덱스로 구성한다.
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from app.services.tools.statistics.owid_enhanced_rag import EnhancedOWIDRAG
+from app.services.tools.statistics.owid_vector_store import FlatVectorCollection
+from app.utils.cache_registry import LRUCache
+
+DOCUMENTS = {
+    "co2-kr": "CO2 emissions per capita in South Korea rose until 2018",
+    "co2-world": "Global CO2 emissions by fuel: coal, oil and gas",
+    "life-kr": "Life expectancy in South Korea reached 83 years",
+    "life-jp": "Life expectancy in Japan is among the highest in the world",
+    "energy": "Share of renewable energy in primary energy consumption",
+    "plastic": "Plastic waste generation per capita by country",
+    "kr-ko": "한국 기대수명 추이와 OECD 평균 비교",
+}
+
+QUERIES = [
+    "CO2 emissions Korea",
+    "life expectancy Japan",
+    "renewable energy",
+    "CO2 emissions Korea",
+    "한국 기대수명",
+    "zzzz nothing matches",
+]
+
+
+def _embed(text):
+    vector = np.zeros(32, dtype=np.float32)
+    for token in text.lower().replace("query: ", "").split():
+        vector[int(hashlib.md5(token.encode()).hexdigest(), 16) % 32] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class FakeEncoder:
+    def __init__(self):
+        self.encoded = 0
+
+    def encode(self, texts, normalize_embeddings=True, **kwargs):
+        self.encoded += len(texts)
+        return np.stack([_embed(text) for text in texts])
+
+
+class FakeReranker:
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, pairs):
+        self.calls += 1
+        return [len(set(query.lower().split()) & set(doc.lower().split())) - 2.0 for query, doc in pairs]
+
+
+def make_rag(tmp_path, reranker=True):
+    rag = EnhancedOWIDRAG.__new__(EnhancedOWIDRAG)
+    rag.data_dir = tmp_path / "data"
+    rag.db_path = tmp_path / "db"
+    rag.db_path.mkdir(exist_ok=True)
+    rag.datasets = []
+    rag.encoder = FakeEncoder()
+    rag.reranker = FakeReranker() if reranker else None
+    rag.collection = FlatVectorCollection(tmp_path / "db" / "flat", dtype="float32")
+    if not rag.collection.count():
+        ids = list(DOCUMENTS)
+        rag.collection.upsert(
+            ids=ids,
+            embeddings=[_embed(DOCUMENTS[chunk_id]) for chunk_id in ids],
+            documents=[DOCUMENTS[chunk_id] for chunk_id in ids],
+            metadatas=[{"dataset_id": chunk_id, "chunk_type": "overview", "source": "test"} for chunk_id in ids],
+        )
+    rag.bm25_index = None
+    rag.bm25_documents, rag.bm25_metadata, rag.bm25_ids = [], [], []
+    rag._build_bm25_index()
+    rag.cache = LRUCache(max_items=100)
+    rag.query_embeddings = LRUCache(max_items=100)
+    rag.rerank_scores = LRUCache(max_items=1000)
+    rag._rerank_ms_per_pair = None
+    return rag
+
+
+@pytest.mark.parametrize("use_reranker", [True, False])
+def test_search_many_matches_search(tmp_path, use_reranker):
+    single = make_rag(tmp_path)
+    expected = [single.search(query, n_results=3, use_reranker=use_reranker) for query in QUERIES]
+
+    batched = make_rag(tmp_path)
+    assert batched.search_many(QUERIES, n_results=3, use_reranker=use_reranker) == expected
+    # 중복 질의는 한 번만 인코딩, 재순위화는 predict 한 번
+    assert batched.encoder.encoded == len(set(QUERIES))
+    assert batched.reranker.calls == (1 if use_reranker else 0)
+
+
+def test_search_and_search_many_share_normalized_cache(tmp_path):
+    rag = make_rag(tmp_path)
+    first = rag.search("CO2  emissions\tKorea", n_results=3)
+    calls, encoded = rag.reranker.calls, rag.encoder.encoded
+
+    assert rag.search_many(["CO2 emissions Korea", " CO2 emissions Korea "], n_results=3) == [first, first]
+    assert rag.search("CO2 emissions Korea", n_results=3) == first
+    assert (rag.reranker.calls, rag.encoder.encoded) == (calls, encoded)
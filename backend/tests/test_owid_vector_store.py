@@ -0,0 +1,105 @@
+"""FlatVectorCollection 테스트 - upsert/delete/get/query, 디스크 재로드, 묶음 쓰기"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from app.services.tools.statistics.owid_vector_store import FlatVectorCollection
+
+
+def unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def collection(tmp_path):
+    store = FlatVectorCollection(tmp_path / "flat", dtype="float32")
+    store.upsert(
+        ids=["a", "b", "c"],
+        embeddings=[unit(1, 0, 0), unit(0, 1, 0), unit(1, 1, 0)],
+        documents=["doc a", "doc b", "doc c"],
+        metadatas=[{"dataset_id": "x"}, {"dataset_id": "y"}, {"dataset_id": "x"}],
+    )
+    return store
+
+
+def test_query_returns_exact_top_k_with_l2_distance(collection):
+    result = collection.query([unit(1, 0, 0)], n_results=2)
+    assert result["ids"] == [["a", "c"]]
+    assert result["documents"] == [["doc a", "doc c"]]
+    np.testing.assert_allclose(result["distances"][0], [0.0, 2 - 2 / np.sqrt(2)], atol=1e-6)
+
+
+def test_upsert_replaces_existing_and_appends_new(collection):
+    collection.upsert(ids=["b", "d"], embeddings=[unit(1, 0, 0), unit(0, 0, 1)],
+                      documents=["doc b2", "doc d"], metadatas=[{}, {}])
+    assert collection.count() == 4
+    assert collection.get(ids=["b"])["documents"] == ["doc b2"]
+    assert collection.query([unit(0, 0, 1)], n_results=1)["ids"] == [["d"]]
+
+
+def test_delete_and_reload(collection, tmp_path):
+    collection.delete(ids=["a", "missing"])
+    assert collection.get(include=[]) == {"ids": ["b", "c"]}
+
+    reloaded = FlatVectorCollection(tmp_path / "flat", dtype="float32")
+    assert reloaded.get()["metadatas"] == [{"dataset_id": "y"}, {"dataset_id": "x"}]
+    assert reloaded.query([unit(1, 0, 0)], n_results=5)["ids"] == [["c", "b"]]
+
+
+def test_float16_storage_matches_float32_ranking(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [f"id{i}" for i in range(50)]
+    rankings = []
+    for dtype in ("float32", "float16"):
+        store = FlatVectorCollection(tmp_path / dtype, dtype=dtype)
+        store.upsert(ids=ids, embeddings=vectors, documents=ids, metadatas=[{}] * 50)
+        rankings.append(store.query(vectors[:3], n_results=5)["ids"])
+    assert rankings[0] == rankings[1]
+
+
+def test_batch_writes_once_and_matches_unbatched(tmp_path, monkeypatch):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(40, 8)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [f"id{i}" for i in range(40)]
+
+    def build(store):
+        for i in range(0, 40, 10):
+            store.upsert(ids=ids[i:i + 10], embeddings=vectors[i:i + 10], documents=ids[i:i + 10],
+                         metadatas=[{"n": n} for n in range(i, i + 10)])
+        store.upsert(ids=["id3"], embeddings=[vectors[0]], documents=["id3 again"], metadatas=[{}])
+        store.delete(ids=["id5", "id7"])
+
+    build(FlatVectorCollection(tmp_path / "plain", dtype="float32"))
+
+    batched = FlatVectorCollection(tmp_path / "batched", dtype="float32")
+    saves = []
+    original_save = FlatVectorCollection._save
+    monkeypatch.setattr(FlatVectorCollection, "_save", lambda self, matrix: (saves.append(1), original_save(self, matrix)))
+    with batched.batch():
+        build(batched)
+        assert not (tmp_path / "batched" / "chunks.json").exists()
+        assert batched.query(vectors[1:2], n_results=3)["ids"][0][0] == "id1"  # 저장 전에도 질의 가능
+    assert len(saves) == 1
+
+    plain = FlatVectorCollection(tmp_path / "plain", dtype="float32")
+    reloaded = FlatVectorCollection(tmp_path / "batched", dtype="float32")
+    assert reloaded.get() == plain.get()
+    assert reloaded.query(vectors[:5], n_results=5) == plain.query(vectors[:5], n_results=5)
+
+
+def test_failed_batch_keeps_last_saved_state(collection, tmp_path):
+    with pytest.raises(RuntimeError):
+        with collection.batch():
+            collection.upsert(ids=["d"], embeddings=[unit(0, 0, 1)], documents=["doc d"], metadatas=[{}])
+            collection.delete(ids=["a"])
+            raise RuntimeError("build failed")
+    assert collection.get(include=[]) == {"ids": ["a", "b", "c"]}
+    assert FlatVectorCollection(tmp_path / "flat", dtype="float32").count() == 3
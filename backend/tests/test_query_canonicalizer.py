@@ -0,0 +1,53 @@
+"""도구 캐시 키 정규화 테스트 - 모드별 정규화, 조사 처리, 검색 연산자"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import inspect
+
+import pytest
+
+from app.services.tools.query_canonicalizer import canonical_call_key, canonicalize_text
+
+
+def test_text_mode_whitespace_nfc_casefold():
+    decomposed = "\u1112\u1161\u11ab\u1100\u116e\u11a8"  # 자모로 분해된(NFD) "한국"
+    assert canonicalize_text(f"  {decomposed}   GDP ") == "한국 gdp"
+
+
+@pytest.mark.parametrize("word", ["원자로", "한반도", "인도", "한국은행"])
+def test_nouns_ending_like_particles_are_kept(word):
+    assert canonicalize_text(word, "keywords") == word
+
+
+def test_multi_syllable_particles_are_stripped():
+    assert canonicalize_text("한국에서의 실업률", "keywords") == "한국 실업률"
+    assert canonicalize_text("미국으로 수출", "keywords") == "미국 수출"
+
+
+def test_bag_mode_ignores_word_order():
+    assert canonicalize_text("실업률 한국", "bag") == canonicalize_text("한국  실업률", "bag")
+
+
+def test_boolean_operators_keep_case():
+    assert canonicalize_text("quantum AND computing") != canonicalize_text("quantum and computing")
+    # 검색 문법이 있으면 keywords/bag 모드도 text 모드로 처리
+    assert canonicalize_text("Quantum AND Computing", "bag") == "quantum AND computing"
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        canonicalize_text("x", "stem")
+
+
+def test_call_key_skips_defaults_and_normalizes():
+    def search(query: str, limit: int = 10):
+        pass
+
+    signature = inspect.signature(search)
+    modes = {"query": "bag"}
+    assert canonical_call_key(signature, ("실업률  한국",), {}, modes) == \
+        canonical_call_key(signature, (), {"query": "한국 실업률", "limit": 10}, modes)
+    assert canonical_call_key(signature, ("한국 실업률", 5), {}, modes) != \
+        canonical_call_key(signature, ("한국 실업률",), {}, modes)
@@ -0,0 +1,48 @@
+"""토큰 버킷 속도 제한 테스트 - 예약 간격, 대기 한도, 호스트별 버킷 공유"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from app.services.tools.base_tool import RATE_LIMIT_CONFIGS, HostRateLimiter, TokenBucket
+from app.utils.deadline import DEADLINE_CONFIG, DeadlineExceeded, deadline_scope
+
+
+def test_token_bucket_spaces_calls():
+    bucket = TokenBucket(rate=10, burst=1)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_token_bucket_burst():
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_token_bucket_max_wait_raises_without_consuming():
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.reserve()
+    with pytest.raises(DeadlineExceeded):
+        bucket.acquire(max_wait=0.1)
+    # 거절된 예약은 토큰을 쓰지 않으므로 다음 대기는 여전히 약 1초
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    assert bucket.stats()["calls"] == 2
+
+
+def test_host_buckets_are_shared_and_matched_by_suffix():
+    bucket = HostRateLimiter.bucket("https://ko.wikipedia.org/w/api.php")
+    assert bucket is HostRateLimiter.bucket("ko.wikipedia.org")
+    assert bucket.rate == RATE_LIMIT_CONFIGS["wikipedia.org"]["rate"]
+    assert HostRateLimiter.bucket("unknown.example").rate == RATE_LIMIT_CONFIGS["default"]["rate"]
+
+
+def test_host_acquire_respects_deadline():
+    url = "https://api.gdeltproject.org/api/v2/doc/doc"
+    HostRateLimiter.bucket(url).reserve()  # 다음 토큰까지 약 5초
+    with deadline_scope(DEADLINE_CONFIG["min_tool_seconds"] + 1):
+        with pytest.raises(DeadlineExceeded):
+            HostRateLimiter.acquire(url)
@@ -1,4 +1,4 @@
-"""전체 도구 테스트 - 모든 11개 도구 검증"""
+"""전체 도구 테스트 - 모든 12개 도구 검증"""
 
 import os
 import sys
@@ -13,6 +13,7 @@ from app.services.tools import (
     WorldBankSearchTool,
     FREDSearchTool,
     OWIDRAGTool,
+    OWIDLookupTool,
     NewsAPITool,
     GoogleFactCheckTool,
     TwitterTool
@@ -63,6 +64,7 @@ def main():
         (FREDSearchTool, "FRED 미연준", {"query": "unemployment", "fetch_data": True, "limit": 3}),
         (WorldBankSearchTool, "WorldBank 세계은행", {"query": "GDP growth", "country": "KR", "fetch_data": True, "years": 3}),
         (OWIDRAGTool, "OWID", {"query": "Korea GDP", "n_results": 2, "use_reranker": True}),
+        (OWIDLookupTool, "OWID 정확 조회", {"query": "2020년 한국 1인당 CO2 배출량"}),
         
         # 학술 도구들
         (ArxivSearchTool, "ArXiv 논문", {"query": "machine learning", "max_results": 1, "sort_by": "relevance"}),
@@ -95,7 +97,7 @@ def main():
     
     # 카테고리별 분석
     print(f"\n📈 카테고리별:")
-    print(f"  통계 도구: 4개 (KOSIS, FRED, WorldBank, OWID)")
+    print(f"  통계 도구: 5개 (KOSIS, FRED, WorldBank, OWID, OWID Lookup)")
     print(f"  학술 도구: 3개 (ArXiv, OpenAlex, Wikipedia)")  
     print(f"  뉴스 도구: 3개 (Naver, NewsAPI, GoogleFC)")
     print(f"  커뮤니티 도구: 1개 (Twitter/X)")